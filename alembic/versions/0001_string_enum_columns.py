@@ -0,0 +1,66 @@
+"""Store status and role enums as VARCHAR with CHECK constraints
+
+Databases created by init_db before this revision hold native PostgreSQL
+ENUM types with the member names ('PENDING', 'ADMIN'). The models now read
+and write the lowercase member values, so each column is converted in place,
+its ENUM type dropped and a named CHECK constraint added.
+
+Existing databases: run `alembic upgrade head` before starting the
+application. Databases created by init_db from the current models already
+match and only need `alembic stamp head`.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, old ENUM type, CHECK constraint, allowed values)
+ENUM_COLUMNS = [
+    ('blogs', 'status', 'blogstatus', 'ck_blogs_status',
+     ('pending', 'approved', 'rejected')),
+    ('feature_requests', 'status', 'featurerequeststatus', 'ck_feature_requests_status',
+     ('pending', 'accepted', 'declined')),
+    ('users', 'role', 'userrole', 'ck_users_role',
+     ('user', 'admin', 'l1_approver')),
+]
+
+
+def _in_list(values) -> str:
+    return ", ".join(f"'{value}'" for value in values)
+
+
+def upgrade() -> None:
+    for table, column, enum_type, constraint, values in ENUM_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.String(16),
+            existing_nullable=False,
+            postgresql_using=f"lower({column}::text)"
+        )
+        op.execute(f"DROP TYPE {enum_type}")
+        op.create_check_constraint(constraint, table, f"{column} IN ({_in_list(values)})")
+
+
+def downgrade() -> None:
+    for table, column, enum_type, constraint, values in ENUM_COLUMNS:
+        op.drop_constraint(constraint, table, type_='check')
+        names = tuple(value.upper() for value in values)
+        op.execute(f"CREATE TYPE {enum_type} AS ENUM ({_in_list(names)})")
+        op.alter_column(
+            table, column,
+            type_=sa.Enum(*names, name=enum_type, create_type=False),
+            existing_nullable=False,
+            postgresql_using=f"upper({column})::{enum_type}"
+        )
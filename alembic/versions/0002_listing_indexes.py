@@ -0,0 +1,94 @@
+"""Match listing indexes to each query's filter and sort order
+
+init_db only runs create_all, which skips tables that already exist, so the
+composite and partial listing indexes declared on the models never reach an
+existing database and the indexes they replaced are never dropped. This
+revision brings those databases in line with the models.
+
+The partial index predicates compare status with the lowercase values
+written since revision 0001.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # blogs
+    op.drop_index('idx_blog_status_created', table_name='blogs')
+    op.create_index(
+        'idx_blog_author_created', 'blogs',
+        ['author_id', sa.text('created_at DESC'), sa.text('id DESC')]
+    )
+    op.create_index(
+        'idx_blog_approved_listing', 'blogs',
+        [sa.text('approved_at DESC'), sa.text('id DESC')],
+        postgresql_where=sa.text("status = 'approved'")
+    )
+    op.create_index(
+        'idx_blog_pending_listing', 'blogs',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+        postgresql_where=sa.text("status = 'pending'")
+    )
+
+    # feature_requests: the composites lead with status and user_id, so the
+    # single-column indexes on those are redundant
+    op.drop_index('ix_feature_requests_status', table_name='feature_requests')
+    op.drop_index('ix_feature_requests_user_id', table_name='feature_requests')
+    op.drop_index('idx_feature_request_status_priority', table_name='feature_requests')
+    op.create_index(
+        'idx_feature_request_status_priority', 'feature_requests',
+        ['status', sa.text('priority DESC'), sa.text('created_at DESC'), sa.text('id DESC')]
+    )
+    op.create_index(
+        'idx_feature_request_priority', 'feature_requests',
+        [sa.text('priority DESC'), sa.text('created_at DESC'), sa.text('id DESC')]
+    )
+    op.create_index(
+        'idx_feature_request_user_created', 'feature_requests',
+        ['user_id', sa.text('created_at DESC'), sa.text('id DESC')]
+    )
+
+    # comments
+    op.drop_index('ix_comments_user_id', table_name='comments')
+    op.drop_index('idx_comment_blog_created', table_name='comments')
+    op.create_index('idx_comment_blog_created', 'comments', ['blog_id', 'created_at', 'id'])
+    op.create_index(
+        'idx_comment_user_created', 'comments',
+        ['user_id', sa.text('created_at DESC'), sa.text('id DESC')]
+    )
+
+
+def downgrade() -> None:
+    # comments
+    op.drop_index('idx_comment_user_created', table_name='comments')
+    op.drop_index('idx_comment_blog_created', table_name='comments')
+    op.create_index('idx_comment_blog_created', 'comments', ['blog_id', 'created_at'])
+    op.create_index('ix_comments_user_id', 'comments', ['user_id'])
+
+    # feature_requests
+    op.drop_index('idx_feature_request_user_created', table_name='feature_requests')
+    op.drop_index('idx_feature_request_priority', table_name='feature_requests')
+    op.drop_index('idx_feature_request_status_priority', table_name='feature_requests')
+    op.create_index('idx_feature_request_status_priority', 'feature_requests', ['status', 'priority'])
+    op.create_index('ix_feature_requests_user_id', 'feature_requests', ['user_id'])
+    op.create_index('ix_feature_requests_status', 'feature_requests', ['status'])
+
+    # blogs
+    op.drop_index('idx_blog_pending_listing', table_name='blogs')
+    op.drop_index('idx_blog_approved_listing', table_name='blogs')
+    op.drop_index('idx_blog_author_created', table_name='blogs')
+    op.create_index('idx_blog_status_created', 'blogs', ['status', 'created_at'])
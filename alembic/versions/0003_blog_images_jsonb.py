@@ -0,0 +1,43 @@
+"""Store blog images in a native JSONB column
+
+blogs.images was a TEXT column holding a JSON-encoded list. The model now
+maps it as JSON, which is JSONB on PostgreSQL, so existing values are cast
+in place.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'blogs', 'images',
+        type_=postgresql.JSONB(),
+        existing_type=sa.Text(),
+        existing_nullable=True,
+        postgresql_using='images::jsonb'
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'blogs', 'images',
+        type_=sa.Text(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using='images::text'
+    )
@@ -3,28 +3,59 @@ API dependencies for authentication and authorization.
 Provides reusable dependencies for FastAPI endpoints.
 """
 import logging
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError
+from jwt import PyJWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
-from app.core.security import decode_token
-from app.crud.user_crud import user_crud
-from app.models.user import User, UserRole
+from app.core.security import verify_and_extract_user_id
+from app.core.cache import cache_incr
+from app.crud.user_crud import user_crud, UserIdentity
+from app.models.user import UserRole
 
 logger = logging.getLogger(__name__)
 
 security = HTTPBearer()
 
+# Roles allowed through the role-guarded dependencies
+_ADMIN_ROLES = frozenset({UserRole.ADMIN})
+_APPROVER_ROLES = frozenset({UserRole.ADMIN, UserRole.L1_APPROVER})
+
+# Login attempts allowed per client IP within each window
+LOGIN_RATE_LIMIT = 10
+LOGIN_RATE_WINDOW_SECONDS = 60
+
+
+def _credentials_exception() -> HTTPException:
+    """
+    Build the 401 raised for any authentication failure.
+
+    Only called on the failure path, so successful requests allocate nothing.
+
+    Returns:
+        HTTPException with a Bearer challenge header
+    """
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
 
 async def get_current_user(
+        request: Request,
         credentials: HTTPAuthorizationCredentials = Depends(security),
         db: AsyncSession = Depends(get_db)
-) -> User:
+) -> UserIdentity:
     """
     Get current authenticated user from JWT token.
 
+    The resolved user is stored on ``request.state`` so any later
+    authorization check in the same request reuses it instead of
+    decoding the token and querying the database again.
+
     Args:
+        request: Incoming request
         credentials: HTTP Authorization header
         db: Database session
 
@@ -34,42 +65,53 @@ async def get_current_user(
     Raises:
         HTTPException: If authentication fails
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+    cached_user = getattr(request.state, "current_user", None)
+    if cached_user is not None:
+        return cached_user
 
     try:
         token = credentials.credentials
         logger.debug("Decoding authentication token")
-        payload = decode_token(token)
-        user_id: int = int(payload.get("sub"))
-
-        if user_id is None:
-            logger.warning("Token payload missing user_id")
-            raise credentials_exception
-
-        logger.debug(f"Token decoded successfully for user_id={user_id}")
-    except JWTError as e:
-        logger.warning(f"JWT error: {str(e)}")
-        raise credentials_exception
+        user_id = verify_and_extract_user_id(token).user_id
+        logger.debug("Token decoded successfully for user_id=%s", user_id)
+    except PyJWTError as e:
+        logger.warning("JWT error: %s", e)
+        raise _credentials_exception()
     except Exception as e:
-        logger.error(f"Unexpected error decoding token: {str(e)}", exc_info=True)
-        raise credentials_exception
+        logger.error("Unexpected error decoding token: %s", e, exc_info=True)
+        raise _credentials_exception()
 
-    user = await user_crud.get(db, user_id)
+    user = await user_crud.get_cached(db, user_id)
     if user is None:
-        logger.warning(f"User not found: user_id={user_id}")
-        raise credentials_exception
+        logger.warning("User not found: user_id=%s", user_id)
+        raise _credentials_exception()
 
-    logger.info(f"User authenticated: user_id={user.id}, email={user.email}")
+    logger.debug("User authenticated: user_id=%s, email=%s", user.id, user.email)
+    request.state.current_user = user
     return user
 
 
+def _ensure_active(user: UserIdentity) -> None:
+    """
+    Reject inactive users.
+
+    Args:
+        user: Authenticated user
+
+    Raises:
+        HTTPException: If user is inactive
+    """
+    if user.is_active != 1:
+        logger.warning("Inactive user attempted access: user_id=%s", user.id)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Inactive user"
+        )
+
+
 async def get_current_active_user(
-        current_user: User = Depends(get_current_user)
-) -> User:
+        current_user: UserIdentity = Depends(get_current_user)
+) -> UserIdentity:
     """
     Ensure current user is active.
 
@@ -82,64 +124,95 @@ async def get_current_active_user(
     Raises:
         HTTPException: If user is inactive
     """
-    if not await user_crud.is_active(current_user):
-        logger.warning(f"Inactive user attempted access: user_id={current_user.id}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Inactive user"
-        )
+    _ensure_active(current_user)
 
-    logger.debug(f"Active user check passed: user_id={current_user.id}")
+    logger.debug("Active user check passed: user_id=%s", current_user.id)
     return current_user
 
 
 async def require_admin(
-        current_user: User = Depends(get_current_active_user)
-) -> User:
+        current_user: UserIdentity = Depends(get_current_user)
+) -> UserIdentity:
     """
-    Require admin role.
+    Require an active user with admin role.
+
+    Checks activity and role on the user row already loaded by
+    get_current_user instead of chaining through get_current_active_user.
 
     Args:
-        current_user: Current active user
+        current_user: Current user from token
 
     Returns:
         Admin user instance
 
     Raises:
-        HTTPException: If user is not admin
+        HTTPException: If user is inactive or not admin
     """
-    if current_user.role != UserRole.ADMIN:
-        logger.warning(f"Non-admin user attempted admin access: user_id={current_user.id}, role={current_user.role}")
+    _ensure_active(current_user)
+
+    if current_user.role not in _ADMIN_ROLES:
+        logger.warning("Non-admin user attempted admin access: user_id=%s, role=%s", current_user.id, current_user.role)
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required"
         )
 
-    logger.debug(f"Admin check passed: user_id={current_user.id}")
+    logger.debug("Admin check passed: user_id=%s", current_user.id)
     return current_user
 
 
 async def require_approver(
-        current_user: User = Depends(get_current_active_user)
-) -> User:
+        current_user: UserIdentity = Depends(get_current_user)
+) -> UserIdentity:
     """
-    Require approver role (admin or L1 approver).
+    Require an active user with approver role (admin or L1 approver).
+
+    Checks activity and role on the user row already loaded by
+    get_current_user instead of chaining through get_current_active_user.
 
     Args:
-        current_user: Current active user
+        current_user: Current user from token
 
     Returns:
         Approver user instance
 
     Raises:
-        HTTPException: If user cannot approve
+        HTTPException: If user is inactive or cannot approve
     """
-    if current_user.role not in [UserRole.ADMIN, UserRole.L1_APPROVER]:
-        logger.warning(f"Non-approver attempted approver access: user_id={current_user.id}, role={current_user.role}")
+    _ensure_active(current_user)
+
+    if current_user.role not in _APPROVER_ROLES:
+        logger.warning("Non-approver attempted approver access: user_id=%s, role=%s", current_user.id, current_user.role)
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Approver access required. Must be admin or L1 approver."
         )
 
-    logger.debug(f"Approver check passed: user_id={current_user.id}")
+    logger.debug("Approver check passed: user_id=%s", current_user.id)
     return current_user
+
+
+async def limit_login_attempts(request: Request) -> None:
+    """
+    Dependency to rate-limit login attempts per client IP.
+
+    Counted in Redis with INCR + EXPIRE; when Redis is unavailable the
+    limit is not enforced. Every attempt counts, successful logins
+    included, since the counter is taken before the credentials are checked.
+
+    Args:
+        request: Incoming request
+
+    Raises:
+        HTTPException: 429 once the client exceeds LOGIN_RATE_LIMIT attempts in the window
+    """
+    client_ip = request.client.host if request.client else "unknown"
+    attempts = await cache_incr(f"auth:rl:{client_ip}", LOGIN_RATE_WINDOW_SECONDS)
+
+    if attempts is not None and attempts > LOGIN_RATE_LIMIT:
+        logger.warning("Login rate limit exceeded for ip=%s", client_ip)
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts. Please try again later.",
+            headers={"Retry-After": str(LOGIN_RATE_WINDOW_SECONDS)},
+        )
@@ -3,11 +3,12 @@ Authentication API endpoints.
 Handles user registration and login.
 """
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
 from app.schemas.user_dto import UserCreate, UserLogin, UserResponse, TokenResponse
 from app.services.auth_service import auth_service
+from app.api.deps import limit_login_attempts
 from app.core.exceptions import AuthenticationError, ValidationError
 
 logger = logging.getLogger(__name__)
@@ -50,7 +51,7 @@ async def register(
         )
 
 
-@router.post("/login", response_model=TokenResponse)
+@router.post("/login", response_model=TokenResponse, dependencies=[Depends(limit_login_attempts)])
 async def login(
         credentials: UserLogin,
         db: AsyncSession = Depends(get_db)
@@ -73,7 +74,8 @@ async def login(
     try:
         tokens = await auth_service.authenticate_user(db, credentials)
         logger.info(f"User logged in successfully: {credentials.email}")
-        return tokens
+        # Encoded directly with orjson; response_model is kept for the docs only
+        return Response(content=TokenResponse.encode(tokens), media_type="application/json")
     except AuthenticationError as e:
         logger.warning(f"Login failed for {credentials.email}: {str(e)}")
         raise HTTPException(
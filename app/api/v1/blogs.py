@@ -1,31 +1,89 @@
 """
 Blog management API endpoints.
 Handles CRUD operations and approval workflow.
+Domain exceptions propagate to the application's exception handlers.
 """
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, Response, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 from app.database import get_db
 from app.schemas.blog_dto import (
     BlogCreate, BlogUpdate, BlogResponse,
-    BlogListResponse, BlogApprovalRequest
+    BlogApprovalRequest,
+    BlogBulkReviewRequest, BlogBulkReviewResponse
 )
 from app.services.blog_service import blog_service
 from app.services.notification_service import notification_service
 from app.api.deps import get_current_active_user, require_approver
-from app.models.user import User
-from app.core.exceptions import ValidationError, AuthorizationError, NotFoundError
+from app.crud.user_crud import UserIdentity
+from app.core.exceptions import NotFoundError
+from app.core.cache import (
+    cache_get, cache_set, cache_get_many, cache_set_many, cache_prefix, cache_clear
+)
+from app.utils.http_cache import conditional_json_response
+from app.utils.pagination import NEXT_CURSOR_HEADER, split_page
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/blogs", tags=["Blogs"])
 
+# Read endpoints encode rows straight to JSON with BlogResponse.encode/encode_many;
+# their response_model is kept for the docs only
+
+# Response cache for blog reads; review and edits clear both namespaces,
+# new submissions only the pending lists
+BLOG_CACHE_NAMESPACE = "blogs"
+PENDING_CACHE_NAMESPACE = "blogs_pending"
+PUBLIC_LIST_CACHE_EXPIRE = 60
+PENDING_LIST_CACHE_EXPIRE = 30
+BLOG_DETAIL_CACHE_EXPIRE = 120
+
+# Client/CDN max-age for public blog reads
+PUBLIC_BLOG_MAX_AGE = 60
+
+
+async def _cached_blog_page(
+        namespace: str,
+        page_key: str,
+        expire: int,
+        limit: int,
+        fetch: Callable[[int], Awaitable[List]]
+) -> Tuple[bytes, Dict[str, str]]:
+    """
+    Read-through cache for a page of blogs.
+
+    Args:
+        namespace: Cache namespace
+        page_key: Key of the page within the namespace (the cursor is stored under "<key>:next")
+        expire: Time to live in seconds
+        limit: Page size
+        fetch: Loads up to the given number of rows on a cache miss
+
+    Returns:
+        Tuple of (serialized page, next-cursor headers)
+    """
+    cache_key = f"{await cache_prefix(namespace)}:{page_key}"
+    cursor_key = f"{cache_key}:next"
+    cached, cached_cursor = await cache_get_many(cache_key, cursor_key)
+    if cached is not None:
+        return cached, ({NEXT_CURSOR_HEADER: cached_cursor.decode()} if cached_cursor else {})
+
+    blogs, headers = split_page(await fetch(limit + 1), limit)
+    body = BlogResponse.encode_many(blogs)
+    await cache_set_many(
+        {cache_key: body, cursor_key: headers.get(NEXT_CURSOR_HEADER, "").encode()},
+        expire
+    )
+    return body, headers
+
 
 @router.get("/", response_model=List[BlogResponse])
 async def list_public_blogs(
+        request: Request,
         skip: int = Query(0, ge=0, description="Number of records to skip"),
         limit: int = Query(100, ge=1, le=100, description="Maximum number of records"),
+        cursor: Optional[int] = Query(None, description="Id of the last blog from the previous page"),
         db: AsyncSession = Depends(get_db)
 ):
     """
@@ -36,28 +94,29 @@ async def list_public_blogs(
 
     - **skip**: Pagination offset (default: 0)
     - **limit**: Maximum results per page (default: 100, max: 100)
+    - **cursor**: Id from the previous page's X-Next-Cursor header; skips the offset scan
 
     Returns list of approved blog posts ordered by approval date (newest first).
+    Responses carry an ETag; send it back in If-None-Match to get 304 Not Modified.
     """
-    logger.info(f"Fetching public blogs: skip={skip}, limit={limit}")
+    logger.info("Fetching public blogs: skip=%s, limit=%s, cursor=%s", skip, limit, cursor)
 
-    try:
-        blogs = await blog_service.get_public_blogs(db, skip, limit)
-        logger.info(f"Retrieved {len(blogs)} public blogs")
-        return blogs
-    except Exception as e:
-        logger.error(f"Error fetching public blogs: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to fetch blogs"
-        )
+    body, headers = await _cached_blog_page(
+        BLOG_CACHE_NAMESPACE,
+        f"pub:{skip}:{limit}:{cursor}",
+        PUBLIC_LIST_CACHE_EXPIRE,
+        limit,
+        lambda n: blog_service.get_public_blogs(db, skip, n, cursor)
+    )
+    return conditional_json_response(request, body, PUBLIC_BLOG_MAX_AGE, headers)
 
 
 @router.post("/", response_model=BlogResponse, status_code=status.HTTP_201_CREATED)
 async def create_blog(
         blog_in: BlogCreate,
+        background_tasks: BackgroundTasks,
         db: AsyncSession = Depends(get_db),
-        current_user: User = Depends(get_current_active_user)
+        current_user: UserIdentity = Depends(get_current_active_user)
 ):
     """
     Create a new blog post (requires authentication).
@@ -69,32 +128,21 @@ async def create_blog(
     Created blogs start in 'pending' status and require admin/approver approval
     before becoming publicly visible. Admins/approvers are notified in real-time.
     """
-    logger.info(f"Creating blog by user_id={current_user.id}: {blog_in.title}")
-
-    try:
-        blog = await blog_service.create_blog(db, blog_in, current_user.id)
-
-        # Notify admins about new pending blog via SSE
-        await notification_service.notify_pending_blog(blog)
-
-        logger.info(f"Blog created successfully: id={blog.id}, title={blog.title}")
-        return blog
-    except ValidationError as e:
-        logger.warning(f"Blog creation validation failed: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        logger.error(f"Error creating blog: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create blog"
-        )
+    logger.info("Creating blog by user_id=%s: %s", current_user.id, blog_in.title)
+
+    blog = await blog_service.create_blog(db, blog_in, current_user.id)
+    await cache_clear(PENDING_CACHE_NAMESPACE)
+
+    # Notify admins about new pending blog via SSE once the response is sent
+    background_tasks.add_task(notification_service.notify_pending_blog, blog)
+
+    logger.info("Blog created successfully: id=%s, title=%s", blog.id, blog.title)
+    return blog
 
 
 @router.get("/{blog_id}", response_model=BlogResponse)
 async def get_blog(
+        request: Request,
         blog_id: int,
         db: AsyncSession = Depends(get_db)
 ):
@@ -103,66 +151,53 @@ async def get_blog(
 
     Only approved blogs are accessible via this public endpoint.
     Pending or rejected blogs cannot be viewed by public users.
+    Responses carry an ETag; send it back in If-None-Match to get 304 Not Modified.
     """
-    logger.info(f"Fetching blog: id={blog_id}")
-
-    try:
-        from app.crud.blog_crud import blog_crud
-        from app.models.blog import BlogStatus
-
-        blog = await blog_crud.get(db, blog_id)
-
-        if not blog:
-            logger.warning(f"Blog not found: id={blog_id}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Blog not found"
-            )
-
-        # Only show approved blogs to public
-        if blog.status != BlogStatus.APPROVED:
-            logger.warning(f"Attempted access to non-approved blog: id={blog_id}, status={blog.status}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Blog not found"
-            )
-
-        logger.info(f"Blog retrieved: id={blog_id}")
-        return blog
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error fetching blog: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to fetch blog"
-        )
+    logger.info("Fetching blog: id=%s", blog_id)
+
+    cache_key = f"{await cache_prefix(BLOG_CACHE_NAMESPACE)}:item:{blog_id}"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return conditional_json_response(request, cached, PUBLIC_BLOG_MAX_AGE)
+
+    # Pending and rejected blogs are filtered out in the query itself
+    blog = await blog_service.get_public_blog(db, blog_id)
+
+    if not blog:
+        logger.warning("Blog not found or not approved: id=%s", blog_id)
+        raise NotFoundError("Blog not found")
+
+    logger.info("Blog retrieved: id=%s", blog_id)
+    body = BlogResponse.encode(blog)
+    await cache_set(cache_key, body, BLOG_DETAIL_CACHE_EXPIRE)
+    return conditional_json_response(request, body, PUBLIC_BLOG_MAX_AGE)
 
 
 @router.get("/user/my-blogs", response_model=List[BlogResponse])
 async def get_my_blogs(
         skip: int = Query(0, ge=0),
         limit: int = Query(100, ge=1, le=100),
+        cursor: Optional[int] = Query(None, description="Id of the last blog from the previous page"),
         db: AsyncSession = Depends(get_db),
-        current_user: User = Depends(get_current_active_user)
+        current_user: UserIdentity = Depends(get_current_active_user)
 ):
     """
     Get all blogs created by the authenticated user.
 
     Returns all blogs (pending, approved, rejected) authored by the current user.
+    Pass the X-Next-Cursor response header back as **cursor** to fetch the next page.
     """
-    logger.info(f"Fetching blogs for user_id={current_user.id}")
+    logger.info("Fetching blogs for user_id=%s", current_user.id)
 
-    try:
-        blogs = await blog_service.get_user_blogs(db, current_user.id, skip, limit)
-        logger.info(f"Retrieved {len(blogs)} blogs for user_id={current_user.id}")
-        return blogs
-    except Exception as e:
-        logger.error(f"Error fetching user blogs: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to fetch your blogs"
-        )
+    blogs, headers = split_page(
+        await blog_service.get_user_blogs(db, current_user.id, skip, limit + 1, cursor), limit
+    )
+    logger.info("Retrieved %s blogs for user_id=%s", len(blogs), current_user.id)
+    return Response(
+        content=BlogResponse.encode_many(blogs),
+        media_type="application/json",
+        headers=headers
+    )
 
 
 @router.put("/{blog_id}", response_model=BlogResponse)
@@ -170,7 +205,7 @@ async def update_blog(
         blog_id: int,
         blog_in: BlogUpdate,
         db: AsyncSession = Depends(get_db),
-        current_user: User = Depends(get_current_active_user)
+        current_user: UserIdentity = Depends(get_current_active_user)
 ):
     """
     Update own blog post (requires authentication).
@@ -183,78 +218,43 @@ async def update_blog(
     - **content**: Updated content (optional)
     - **images**: Updated image URLs (optional)
     """
-    logger.info(f"Updating blog id={blog_id} by user_id={current_user.id}")
-
-    try:
-        blog = await blog_service.update_blog(
-            db, blog_id, blog_in, current_user.id, current_user.role
-        )
-        logger.info(f"Blog updated successfully: id={blog_id}")
-        return blog
-    except NotFoundError as e:
-        logger.warning(f"Blog not found for update: id={blog_id}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except (ValidationError, AuthorizationError) as e:
-        logger.warning(f"Blog update failed: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=str(e)
-        )
-    except Exception as e:
-        logger.error(f"Error updating blog: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to update blog"
-        )
+    logger.info("Updating blog id=%s by user_id=%s", blog_id, current_user.id)
+
+    blog = await blog_service.update_blog(
+        db, blog_id, blog_in, current_user.id, current_user.role
+    )
+    await cache_clear(BLOG_CACHE_NAMESPACE, PENDING_CACHE_NAMESPACE)
+    logger.info("Blog updated successfully: id=%s", blog_id)
+    return blog
 
 
 @router.delete("/{blog_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_blog(
         blog_id: int,
         db: AsyncSession = Depends(get_db),
-        current_user: User = Depends(get_current_active_user)
+        current_user: UserIdentity = Depends(get_current_active_user)
 ):
     """
     Delete own blog post (requires authentication).
 
     Only the blog author or admins can delete a blog.
     """
-    logger.info(f"Deleting blog id={blog_id} by user_id={current_user.id}")
-
-    try:
-        await blog_service.delete_blog(
-            db, blog_id, current_user.id, current_user.role
-        )
-        logger.info(f"Blog deleted successfully: id={blog_id}")
-    except NotFoundError as e:
-        logger.warning(f"Blog not found for deletion: id={blog_id}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except (ValidationError, AuthorizationError) as e:
-        logger.warning(f"Blog deletion failed: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=str(e)
-        )
-    except Exception as e:
-        logger.error(f"Error deleting blog: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to delete blog"
-        )
+    logger.info("Deleting blog id=%s by user_id=%s", blog_id, current_user.id)
+
+    await blog_service.delete_blog(
+        db, blog_id, current_user.id, current_user.role
+    )
+    await cache_clear(BLOG_CACHE_NAMESPACE, PENDING_CACHE_NAMESPACE)
+    logger.info("Blog deleted successfully: id=%s", blog_id)
 
 
 @router.post("/{blog_id}/approve", response_model=BlogResponse)
 async def approve_blog(
         blog_id: int,
         approval: BlogApprovalRequest,
+        background_tasks: BackgroundTasks,
         db: AsyncSession = Depends(get_db),
-        current_user: User = Depends(require_approver)
+        current_user: UserIdentity = Depends(require_approver)
 ):
     """
     Approve a pending blog (admin/L1 approver only).
@@ -264,34 +264,16 @@ async def approve_blog(
 
     - **reason**: Optional approval reason/notes
     """
-    logger.info(f"Approving blog id={blog_id} by user_id={current_user.id}")
-
-    try:
-        blog = await blog_service.approve_blog(db, blog_id, current_user.id)
-
-        # Notify about approval
-        await notification_service.notify_blog_approved(blog)
-
-        logger.info(f"Blog approved successfully: id={blog_id}")
-        return blog
-    except NotFoundError as e:
-        logger.warning(f"Blog not found for approval: id={blog_id}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except ValidationError as e:
-        logger.warning(f"Blog approval failed: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        logger.error(f"Error approving blog: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to approve blog"
-        )
+    logger.info("Approving blog id=%s by user_id=%s", blog_id, current_user.id)
+
+    blog = await blog_service.approve_blog(db, blog_id, current_user.id)
+    await cache_clear(BLOG_CACHE_NAMESPACE, PENDING_CACHE_NAMESPACE)
+
+    # Notify about approval once the response is sent
+    background_tasks.add_task(notification_service.notify_blog_approved, blog)
+
+    logger.info("Blog approved successfully: id=%s", blog_id)
+    return blog
 
 
 @router.post("/{blog_id}/reject", response_model=BlogResponse)
@@ -299,7 +281,7 @@ async def reject_blog(
         blog_id: int,
         rejection: BlogApprovalRequest,
         db: AsyncSession = Depends(get_db),
-        current_user: User = Depends(require_approver)
+        current_user: UserIdentity = Depends(require_approver)
 ):
     """
     Reject a pending blog (admin/L1 approver only).
@@ -309,53 +291,85 @@ async def reject_blog(
 
     - **reason**: Optional rejection reason/feedback for the author
     """
-    logger.info(f"Rejecting blog id={blog_id} by user_id={current_user.id}")
-
-    try:
-        blog = await blog_service.reject_blog(db, blog_id)
-        logger.info(f"Blog rejected successfully: id={blog_id}")
-        return blog
-    except NotFoundError as e:
-        logger.warning(f"Blog not found for rejection: id={blog_id}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except ValidationError as e:
-        logger.warning(f"Blog rejection failed: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        logger.error(f"Error rejecting blog: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to reject blog"
-        )
+    logger.info("Rejecting blog id=%s by user_id=%s", blog_id, current_user.id)
+
+    blog = await blog_service.reject_blog(db, blog_id)
+    await cache_clear(BLOG_CACHE_NAMESPACE, PENDING_CACHE_NAMESPACE)
+    logger.info("Blog rejected successfully: id=%s", blog_id)
+    return blog
+
+
+@router.post("/approve/bulk", response_model=BlogBulkReviewResponse)
+async def bulk_approve_blogs(
+        approval: BlogBulkReviewRequest,
+        background_tasks: BackgroundTasks,
+        db: AsyncSession = Depends(get_db),
+        current_user: UserIdentity = Depends(require_approver)
+):
+    """
+    Approve several pending blogs at once (admin/L1 approver only).
+
+    Ids that do not exist or are no longer pending are skipped; the
+    response lists the blogs that were actually approved.
+
+    - **blog_ids**: Blogs to approve (up to 100)
+    """
+    logger.info("Bulk approving %s blogs by user_id=%s", len(approval.blog_ids), current_user.id)
+
+    rows = await blog_service.bulk_approve_blogs(db, approval.blog_ids, current_user.id)
+    if rows:
+        await cache_clear(BLOG_CACHE_NAMESPACE, PENDING_CACHE_NAMESPACE)
+
+    for row in rows:
+        background_tasks.add_task(notification_service.notify_blog_approved, row)
+
+    return BlogBulkReviewResponse(updated_ids=[row.id for row in rows])
+
+
+@router.post("/reject/bulk", response_model=BlogBulkReviewResponse)
+async def bulk_reject_blogs(
+        rejection: BlogBulkReviewRequest,
+        db: AsyncSession = Depends(get_db),
+        current_user: UserIdentity = Depends(require_approver)
+):
+    """
+    Reject several pending blogs at once (admin/L1 approver only).
+
+    Ids that do not exist or are no longer pending are skipped; the
+    response lists the blogs that were actually rejected.
+
+    - **blog_ids**: Blogs to reject (up to 100)
+    """
+    logger.info("Bulk rejecting %s blogs by user_id=%s", len(rejection.blog_ids), current_user.id)
+
+    blog_ids = await blog_service.bulk_reject_blogs(db, rejection.blog_ids)
+    if blog_ids:
+        await cache_clear(BLOG_CACHE_NAMESPACE, PENDING_CACHE_NAMESPACE)
+
+    return BlogBulkReviewResponse(updated_ids=blog_ids)
 
 
 @router.get("/pending/all", response_model=List[BlogResponse])
 async def list_pending_blogs(
         skip: int = Query(0, ge=0),
         limit: int = Query(100, ge=1, le=100),
+        cursor: Optional[int] = Query(None, description="Id of the last blog from the previous page"),
         db: AsyncSession = Depends(get_db),
-        current_user: User = Depends(require_approver)
+        current_user: UserIdentity = Depends(require_approver)
 ):
     """
     Get all pending blogs for approval (admin/L1 approver only).
 
     Returns all blogs awaiting approval review, ordered by creation date.
+    Pass the X-Next-Cursor response header back as **cursor** to fetch the next page.
     """
-    logger.info(f"Fetching pending blogs by user_id={current_user.id}")
-
-    try:
-        blogs = await blog_service.get_pending_blogs(db, skip, limit)
-        logger.info(f"Retrieved {len(blogs)} pending blogs")
-        return blogs
-    except Exception as e:
-        logger.error(f"Error fetching pending blogs: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to fetch pending blogs"
-        )
+    logger.info("Fetching pending blogs by user_id=%s", current_user.id)
+
+    body, headers = await _cached_blog_page(
+        PENDING_CACHE_NAMESPACE,
+        f"{skip}:{limit}:{cursor}",
+        PENDING_LIST_CACHE_EXPIRE,
+        limit,
+        lambda n: blog_service.get_pending_blogs(db, skip, n, cursor)
+    )
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -1,11 +1,12 @@
 """
 Feature request API endpoints.
 Handles user suggestions and admin management.
+Domain exceptions propagate to the application's exception handlers.
 """
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, Response, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from typing import List, Optional
 from app.database import get_db
 from app.schemas.feature_request_dto import (
     FeatureRequestCreate,
@@ -14,47 +15,50 @@ from app.schemas.feature_request_dto import (
 )
 from app.services.feature_request_service import feature_request_service
 from app.api.deps import get_current_active_user, require_admin
-from app.models.user import User
+from app.crud.user_crud import UserIdentity
 from app.models.feature_request import FeatureRequestStatus
-from app.core.exceptions import ValidationError, NotFoundError
+from app.core.exceptions import NotFoundError
+from app.utils.pagination import split_page
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/feature-requests", tags=["Feature Requests"])
 
+# List endpoints encode rows straight to JSON with FeatureRequestResponse.encode_many;
+# their response_model is kept for the docs only
+
 
 @router.get("/", response_model=List[FeatureRequestResponse])
 async def list_feature_requests(
         skip: int = Query(0, ge=0),
         limit: int = Query(100, ge=1, le=100),
+        cursor: Optional[int] = Query(None, description="Id of the last feature request from the previous page"),
         db: AsyncSession = Depends(get_db),
-        current_user: User = Depends(get_current_active_user)
+        current_user: UserIdentity = Depends(get_current_active_user)
 ):
     """
     Get all feature requests.
 
     Authenticated users can view all feature requests.
     Results are ordered by priority (high to low) and creation date.
+    Pass the X-Next-Cursor response header back as **cursor** to fetch the next page.
     """
-    logger.info(f"Fetching all feature requests by user_id={current_user.id}")
-
-    try:
-        requests = await feature_request_service.get_all(db, skip, limit)
-        logger.info(f"Retrieved {len(requests)} feature requests")
-        return requests
-    except Exception as e:
-        logger.error(f"Error fetching feature requests: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to fetch feature requests"
-        )
+    logger.info("Fetching all feature requests by user_id=%s", current_user.id)
+
+    requests, headers = split_page(await feature_request_service.get_all(db, skip, limit + 1, cursor), limit)
+    logger.info("Retrieved %s feature requests", len(requests))
+    return Response(
+        content=FeatureRequestResponse.encode_many(requests),
+        media_type="application/json",
+        headers=headers
+    )
 
 
 @router.post("/", response_model=FeatureRequestResponse, status_code=status.HTTP_201_CREATED)
 async def create_feature_request(
         request_in: FeatureRequestCreate,
         db: AsyncSession = Depends(get_db),
-        current_user: User = Depends(get_current_active_user)
+        current_user: UserIdentity = Depends(get_current_active_user)
 ):
     """
     Create a new feature request.
@@ -65,52 +69,39 @@ async def create_feature_request(
 
     Created requests start in 'pending' status awaiting admin review.
     """
-    logger.info(f"Creating feature request by user_id={current_user.id}: {request_in.title}")
+    logger.info("Creating feature request by user_id=%s: %s", current_user.id, request_in.title)
 
-    try:
-        feature_request = await feature_request_service.create_feature_request(
-            db, request_in, current_user.id
-        )
-        logger.info(f"Feature request created: id={feature_request.id}")
-        return feature_request
-    except ValidationError as e:
-        logger.warning(f"Feature request creation validation failed: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        logger.error(f"Error creating feature request: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create feature request"
-        )
+    feature_request = await feature_request_service.create_feature_request(
+        db, request_in, current_user.id
+    )
+    logger.info("Feature request created: id=%s", feature_request.id)
+    return feature_request
 
 
 @router.get("/my-requests", response_model=List[FeatureRequestResponse])
 async def get_my_feature_requests(
         skip: int = Query(0, ge=0),
         limit: int = Query(100, ge=1, le=100),
+        cursor: Optional[int] = Query(None, description="Id of the last feature request from the previous page"),
         db: AsyncSession = Depends(get_db),
-        current_user: User = Depends(get_current_active_user)
+        current_user: UserIdentity = Depends(get_current_active_user)
 ):
     """
     Get all feature requests created by the authenticated user.
+
+    Pass the X-Next-Cursor response header back as **cursor** to fetch the next page.
     """
-    logger.info(f"Fetching feature requests for user_id={current_user.id}")
+    logger.info("Fetching feature requests for user_id=%s", current_user.id)
 
-    try:
-        requests = await feature_request_service.get_by_user(
-            db, current_user.id, skip, limit
-        )
-        logger.info(f"Retrieved {len(requests)} feature requests for user_id={current_user.id}")
-        return requests
-    except Exception as e:
-        logger.error(f"Error fetching user feature requests: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to fetch your feature requests"
-        )
+    requests, headers = split_page(
+        await feature_request_service.get_by_user(db, current_user.id, skip, limit + 1, cursor), limit
+    )
+    logger.info("Retrieved %s feature requests for user_id=%s", len(requests), current_user.id)
+    return Response(
+        content=FeatureRequestResponse.encode_many(requests),
+        media_type="application/json",
+        headers=headers
+    )
 
 
 @router.patch("/{request_id}", response_model=FeatureRequestResponse)
@@ -118,7 +109,7 @@ async def update_feature_request_status(
         request_id: int,
         update_in: FeatureRequestUpdate,
         db: AsyncSession = Depends(get_db),
-        current_user: User = Depends(require_admin)
+        current_user: UserIdentity = Depends(require_admin)
 ):
     """
     Update feature request status (admin only).
@@ -129,37 +120,18 @@ async def update_feature_request_status(
     - **status**: New status
     - **priority**: New priority (0-10)
     """
-    logger.info(f"Updating feature request id={request_id} by admin user_id={current_user.id}")
-
-    try:
-        if update_in.status:
-            feature_request = await feature_request_service.update_status(
-                db, request_id, update_in.status
-            )
-        else:
-            from app.crud.feature_request_crud import feature_request_crud
-            feature_request = await feature_request_crud.update(db, request_id, update_in)
-
-        if not feature_request:
-            raise NotFoundError("Feature request not found")
-
-        logger.info(f"Feature request updated: id={request_id}")
-        return feature_request
-    except NotFoundError as e:
-        logger.warning(f"Feature request not found: id={request_id}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
-    except ValidationError as e:
-        logger.warning(f"Feature request update validation failed: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        logger.error(f"Error updating feature request: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to update feature request"
+    logger.info("Updating feature request id=%s by admin user_id=%s", request_id, current_user.id)
+
+    if update_in.status:
+        feature_request = await feature_request_service.update_status(
+            db, request_id, update_in.status
         )
+    else:
+        from app.crud.feature_request_crud import feature_request_crud
+        feature_request = await feature_request_crud.update(db, request_id, update_in)
+
+    if not feature_request:
+        raise NotFoundError("Feature request not found")
+
+    logger.info("Feature request updated: id=%s", request_id)
+    return feature_request
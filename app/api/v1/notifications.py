@@ -3,7 +3,7 @@ Server-Sent Events (SSE) API for real-time notifications.
 """
 import logging
 import asyncio
-import json
+import orjson
 from fastapi import APIRouter, Depends
 from fastapi.responses import StreamingResponse
 from app.api.deps import require_approver
@@ -43,27 +43,26 @@ async def notification_stream(
     logger.info(f"SSE stream opened by user_id={current_user.id}")
 
     async def event_generator():
-        queue = await notification_service.subscribe()
+        cursor = await notification_service.subscribe()
 
         try:
             # Send initial connection message
-            yield f"data: {json.dumps({'event': 'connected', 'message': 'Notification stream established'})}\n\n"
+            yield b"data: " + orjson.dumps({"event": "connected", "message": "Notification stream established"}) + b"\n\n"
 
             while True:
-                # Wait for notification
-                message = await queue.get()
+                # Wait for notifications published since the last read
+                cursor, messages = await notification_service.wait_for_messages(cursor)
 
-                # Format as SSE
-                event_data = json.dumps(message)
-                yield f"data: {event_data}\n\n"
+                # Coalesce everything pending into one SSE chunk (one ASGI send)
+                yield b"".join(b"data: " + orjson.dumps(message) + b"\n\n" for message in messages)
 
-                logger.debug(f"SSE notification sent to user_id={current_user.id}: {message['event']}")
+                logger.debug("SSE sent %s notifications to user_id=%s", len(messages), current_user.id)
         except asyncio.CancelledError:
             logger.info(f"SSE stream cancelled for user_id={current_user.id}")
         except Exception as e:
             logger.error(f"SSE stream error for user_id={current_user.id}: {str(e)}", exc_info=True)
         finally:
-            await notification_service.unsubscribe(queue)
+            await notification_service.unsubscribe()
             logger.info(f"SSE stream closed for user_id={current_user.id}")
 
     return StreamingResponse(
@@ -1,70 +1,302 @@
 """
 WebSocket endpoints for real-time comments.
 """
+import asyncio
 import logging
-import json
+import time
+from collections import defaultdict
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, Query
+from redis.asyncio.client import PubSub
+from redis.exceptions import RedisError
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Dict, Set
+from typing import DefaultDict, Dict, Optional
 from app.database import get_db
 from app.crud.comment_crud import comment_crud
 from app.schemas.comment_dto import CommentCreate
-from app.core.security import decode_token
-from jose import JWTError
+from app.core.security import verify_and_extract_user_id
+from app.core.redis import get_redis
+from jwt import PyJWTError
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["WebSockets"])
 
 
+class CommentCreateExtended(CommentCreate):
+    """Comment creation schema with the author resolved from the socket's token."""
+    user_id: int
+
+
+class PeerSender:
+    """
+    Outbound queue for one WebSocket.
+
+    Broadcasts enqueue without waiting and a dedicated task drains the queue,
+    so a slow client only delays itself. When the queue is full the oldest
+    message is dropped; a peer that keeps falling behind is disconnected.
+    """
+
+    QUEUE_SIZE = 32
+    # Dropped messages after which a lagging peer is disconnected
+    MAX_DROPPED = 64
+
+    def __init__(self, websocket: WebSocket):
+        self.websocket = websocket
+        self.dropped = 0
+        self.closed = False
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        self._task = asyncio.create_task(self._run())
+
+    def send(self, payload: str) -> bool:
+        """
+        Queue a message for delivery without waiting.
+
+        Args:
+            payload: Encoded message
+
+        Returns:
+            False if the peer is dead or too far behind and should be disconnected
+        """
+        if self.closed:
+            return False
+
+        try:
+            self._queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            self._queue.get_nowait()
+            self._queue.put_nowait(payload)
+            self.dropped += 1
+            if self.dropped >= self.MAX_DROPPED:
+                return False
+        return True
+
+    async def _run(self):
+        """Drain the queue into the socket until it fails or is cancelled."""
+        try:
+            while True:
+                payload = await self._queue.get()
+                await self.websocket.send_text(payload)
+        except Exception as e:
+            self.closed = True
+            logger.error("Error broadcasting to WebSocket: %s", e)
+
+    async def close(self):
+        """Stop the sender task; queued messages are discarded."""
+        self.closed = True
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+
 class ConnectionManager:
-    """Manages WebSocket connections for blog comments."""
+    """
+    Manages WebSocket connections for blog comments.
+
+    Comments are published to a Redis channel per blog so every worker
+    process delivers them to its own sockets. Without Redis, messages are
+    delivered to this process's sockets only.
+    """
+
+    CHANNEL_PREFIX = "blog:"
+    # Seconds to wait before retrying Redis after a pub/sub failure
+    RETRY_AFTER_SECONDS = 30
 
     def __init__(self):
-        # blog_id -> set of WebSocket connections
-        self.active_connections: Dict[int, Set[WebSocket]] = {}
+        # blog_id -> {WebSocket: PeerSender}
+        self.active_connections: DefaultDict[int, Dict[WebSocket, PeerSender]] = defaultdict(dict)
+        self._pubsub: Optional[PubSub] = None
+        self._listener: Optional[asyncio.Task] = None
+        self._pubsub_lock = asyncio.Lock()
+        self._retry_at: float = 0.0
+        self._reconnect_task: Optional[asyncio.Task] = None
         logger.info("ConnectionManager initialized")
 
+    def _channel(self, blog_id: int) -> str:
+        """Get the pub/sub channel name for a blog."""
+        return f"{self.CHANNEL_PREFIX}{blog_id}"
+
     async def connect(self, websocket: WebSocket, blog_id: int):
         """Accept and register WebSocket connection."""
         await websocket.accept()
 
-        if blog_id not in self.active_connections:
-            self.active_connections[blog_id] = set()
+        connections = self.active_connections[blog_id]
+        connections[websocket] = PeerSender(websocket)
+        logger.info("WebSocket connected for blog_id=%s. Total connections: %s", blog_id, len(connections))
 
-        self.active_connections[blog_id].add(websocket)
-        logger.info(
-            f"WebSocket connected for blog_id={blog_id}. Total connections: {len(self.active_connections[blog_id])}")
+        if len(connections) == 1:
+            await self._subscribe(blog_id)
 
-    def disconnect(self, websocket: WebSocket, blog_id: int):
+    async def disconnect(self, websocket: WebSocket, blog_id: int):
         """Remove WebSocket connection."""
-        if blog_id in self.active_connections:
-            self.active_connections[blog_id].discard(websocket)
+        connections = self.active_connections.get(blog_id)
+        if connections is not None:
+            sender = connections.pop(websocket, None)
+            if sender is not None:
+                await sender.close()
 
             # Clean up empty sets
-            if not self.active_connections[blog_id]:
-                del self.active_connections[blog_id]
+            if not connections:
+                self.active_connections.pop(blog_id, None)
+                await self._unsubscribe(blog_id)
 
-        logger.info(f"WebSocket disconnected for blog_id={blog_id}")
+        logger.info("WebSocket disconnected for blog_id=%s", blog_id)
 
     async def broadcast(self, message: dict, blog_id: int):
-        """Broadcast message to all connections for a blog."""
-        if blog_id not in self.active_connections:
-            return
+        """Publish a message to every connection for a blog, across all workers."""
+        # Encode once for all recipients; sent as a text frame like send_json
+        payload = orjson.dumps(message).decode()
 
-        dead_connections = set()
-        for connection in self.active_connections[blog_id]:
+        if self._pubsub is not None:
             try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Error broadcasting to WebSocket: {str(e)}")
-                dead_connections.add(connection)
+                await get_redis().publish(self._channel(blog_id), payload)
+                return
+            except (RedisError, OSError) as e:
+                await self._reset_pubsub(e)
+
+        await self._send_local(blog_id, payload)
+
+    async def _send_local(self, blog_id: int, payload: str):
+        """Send an encoded message to this process's connections for a blog."""
+        # Use .get() so broadcasting to an idle blog doesn't create an empty entry
+        active = self.active_connections.get(blog_id)
+        if not active:
+            return
 
-        # Remove dead connections
-        for connection in dead_connections:
-            self.disconnect(connection, blog_id)
+        # Enqueue only; each peer's own task does the (possibly slow) send
+        failed = [(websocket, sender) for websocket, sender in tuple(active.items()) if not sender.send(payload)]
+
+        # Remove dead and persistently lagging connections
+        for websocket, sender in failed:
+            if not sender.closed:
+                logger.warning("Disconnecting WebSocket for blog_id=%s: client is not keeping up", blog_id)
+                try:
+                    await websocket.close(code=1013)
+                except Exception:
+                    pass
+            await self.disconnect(websocket, blog_id)
+
+        logger.debug("Queued message for %s connections for blog_id=%s", len(active), blog_id)
+
+    async def _subscribe(self, blog_id: int):
+        """Subscribe this worker to a blog's channel, starting the listener if needed."""
+        async with self._pubsub_lock:
+            if self._pubsub is not None:
+                try:
+                    await self._pubsub.subscribe(self._channel(blog_id))
+                except (RedisError, OSError) as e:
+                    await self._reset_pubsub(e)
+                return
+
+            await self._open_pubsub()
+
+    async def _open_pubsub(self):
+        """
+        Subscribe every blog with local sockets on a new pub/sub connection.
+
+        Must be called with _pubsub_lock held. Does nothing while Redis is
+        unconfigured or inside the retry delay; on failure schedules a retry.
+        """
+        client = get_redis()
+        if client is None or time.monotonic() < self._retry_at:
+            return
 
-        logger.debug(f"Broadcast message to {len(self.active_connections[blog_id])} connections for blog_id={blog_id}")
+        pubsub = client.pubsub()
+        try:
+            await pubsub.subscribe(*(self._channel(b) for b in self.active_connections))
+        except (RedisError, OSError) as e:
+            self._retry_at = time.monotonic() + self.RETRY_AFTER_SECONDS
+            logger.warning("Redis pub/sub unavailable, delivering comments locally: %s", e)
+            await pubsub.aclose()
+            self._schedule_reconnect()
+            return
+
+        self._pubsub = pubsub
+        self._listener = asyncio.create_task(self._listen(pubsub))
+        logger.info("Redis pub/sub subscribed for %s blogs", len(self.active_connections))
+
+    def _schedule_reconnect(self):
+        """Start the reconnect task unless one is already running."""
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = asyncio.create_task(self._reconnect())
+
+    async def _reconnect(self):
+        """
+        Restore the pub/sub subscription once the retry delay has passed.
+
+        Sockets that stay connected through a Redis outage never call
+        _subscribe again, so without this they would miss comments
+        published by other workers until they reconnect.
+        """
+        while self.active_connections and get_redis() is not None:
+            await asyncio.sleep(max(self._retry_at - time.monotonic(), 0))
+            async with self._pubsub_lock:
+                if self._pubsub is not None or not self.active_connections:
+                    return
+                await self._open_pubsub()
+
+    async def _unsubscribe(self, blog_id: int):
+        """Stop receiving a blog's channel once no local sockets remain."""
+        if self._pubsub is None:
+            return
+        try:
+            await self._pubsub.unsubscribe(self._channel(blog_id))
+        except (RedisError, OSError) as e:
+            await self._reset_pubsub(e)
+
+    async def _listen(self, pubsub: PubSub):
+        """Forward published messages to local connections."""
+        try:
+            while True:
+                # Short read timeout keeps the loop responsive without tripping socket_timeout
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if message is None:
+                    continue
+                blog_id = int(message["channel"][len(self.CHANNEL_PREFIX):])
+                await self._send_local(blog_id, message["data"].decode())
+        except (RedisError, OSError) as e:
+            await self._reset_pubsub(e)
+
+    async def _reset_pubsub(self, error: Exception):
+        """Drop the Redis subscription and fall back to local delivery."""
+        pubsub, listener = self._pubsub, self._listener
+        self._pubsub = None
+        self._listener = None
+        self._retry_at = time.monotonic() + self.RETRY_AFTER_SECONDS
+
+        if pubsub is None:
+            return
+
+        logger.warning("Redis pub/sub lost, delivering comments locally: %s", error)
+        if listener is not None and listener is not asyncio.current_task():
+            listener.cancel()
+        try:
+            await pubsub.aclose()
+        except (RedisError, OSError):
+            pass
+        self._schedule_reconnect()
+
+    async def close(self):
+        """Stop the pub/sub listener and reconnect task and release the Redis connection."""
+        listener, pubsub, reconnect = self._listener, self._pubsub, self._reconnect_task
+        self._listener = None
+        self._pubsub = None
+        self._reconnect_task = None
+
+        for task in (listener, reconnect):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        if pubsub is not None:
+            try:
+                await pubsub.aclose()
+            except (RedisError, OSError) as e:
+                logger.warning("Error closing Redis pub/sub: %s", e)
 
 
 manager = ConnectionManager()
@@ -106,62 +338,49 @@ async def websocket_blog_comments(
     """
     # Authenticate user via token
     try:
-        payload = decode_token(token)
-        user_id = int(payload.get("sub"))
-
-        if not user_id:
-            await websocket.close(code=1008, reason="Invalid token")
-            return
-    except JWTError:
+        user_id = verify_and_extract_user_id(token).user_id
+    except PyJWTError:
         await websocket.close(code=1008, reason="Invalid token")
         return
 
     # Connect WebSocket
     await manager.connect(websocket, blog_id)
-    logger.info(f"User user_id={user_id} connected to blog_id={blog_id} comments")
+    logger.info("User user_id=%s connected to blog_id=%s comments", user_id, blog_id)
 
     try:
         while True:
-            # Receive message
-            data = await websocket.receive_json()
+            # Receive message (text frame, parsed with orjson rather than stdlib json)
+            data = orjson.loads(await websocket.receive_text())
 
             # Create comment
-            comment_create = CommentCreate(
+            comment_extended = CommentCreateExtended(
                 content=data.get("content", ""),
-                blog_id=blog_id
+                blog_id=blog_id,
+                user_id=user_id
             )
 
-            # Save to database
-            from pydantic import create_model
-            CommentCreateExtended = create_model(
-                'CommentCreateExtended',
-                user_id=(int, ...),
-                __base__=CommentCreate
+            # Save to database (single INSERT ... RETURNING, no refresh)
+            row = await comment_crud.insert_returning(
+                db, comment_extended.content, blog_id, user_id
             )
-
-            comment_data = comment_create.model_dump()
-            comment_data["user_id"] = user_id
-            comment_extended = CommentCreateExtended(**comment_data)
-
-            comment = await comment_crud.create(db, comment_extended)
-            logger.info(f"Comment created: id={comment.id}, blog_id={blog_id}, user_id={user_id}")
+            logger.info("Comment created: id=%s, blog_id=%s, user_id=%s", row.id, blog_id, user_id)
 
             # Broadcast to all connected clients
             message = {
                 "type": "comment",
                 "data": {
-                    "id": comment.id,
-                    "content": comment.content,
-                    "user_id": comment.user_id,
-                    "created_at": str(comment.created_at)
+                    "id": row.id,
+                    "content": comment_extended.content,
+                    "user_id": user_id,
+                    "created_at": str(row.created_at)
                 }
             }
 
             await manager.broadcast(message, blog_id)
 
     except WebSocketDisconnect:
-        manager.disconnect(websocket, blog_id)
-        logger.info(f"User user_id={user_id} disconnected from blog_id={blog_id}")
+        await manager.disconnect(websocket, blog_id)
+        logger.info("User user_id=%s disconnected from blog_id=%s", user_id, blog_id)
     except Exception as e:
-        logger.error(f"WebSocket error for user_id={user_id}, blog_id={blog_id}: {str(e)}", exc_info=True)
-        manager.disconnect(websocket, blog_id)
+        logger.error("WebSocket error for user_id=%s, blog_id=%s: %s", user_id, blog_id, e, exc_info=True)
+        await manager.disconnect(websocket, blog_id)
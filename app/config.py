@@ -3,6 +3,7 @@ Configuration module with environment variable validation.
 Provides centralized settings management for the application.
 """
 import os
+from functools import lru_cache
 from typing import List, Optional
 from pydantic import field_validator, ConfigDict
 from pydantic_settings import BaseSettings
@@ -10,6 +11,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Sync-driver URL schemes rewritten to asyncpg (the app has no sync driver)
+SYNC_POSTGRES_SCHEMES = ("postgresql+psycopg2://", "postgresql://", "postgres://")
+
 
 class Settings(BaseSettings):
     """
@@ -22,11 +26,21 @@ class Settings(BaseSettings):
     APP_VERSION: str = "1.0.0"
     DEBUG: bool = False
     ENVIRONMENT: str = "production"
+    # Set by the test suite only; drops CORS and request-log middleware.
+    # Kept apart from ENVIRONMENT so a deploy running as "testing" keeps them.
+    APP_TESTING: bool = False
 
     # Database
     DATABASE_URL: str
     DATABASE_POOL_SIZE: int = 20
-    DATABASE_MAX_OVERFLOW: int = 0
+    DATABASE_MAX_OVERFLOW: int = 30
+    DATABASE_POOL_TIMEOUT: int = 5  # seconds to wait for a free connection
+    DATABASE_POOL_RECYCLE: int = 1800  # seconds
+    DATABASE_POOL_PRE_PING: bool = False  # always on when ENVIRONMENT=testing
+    DATABASE_POOL_USE_LIFO: bool = True
+    DATABASE_STATEMENT_CACHE_SIZE: int = 1024
+    DATABASE_QUERY_CACHE_SIZE: int = 1000  # compiled SQL statements kept by SQLAlchemy
+    DATABASE_STATEMENT_TIMEOUT_MS: int = 5000
 
     # JWT Settings
     SECRET_KEY: str
@@ -57,7 +71,8 @@ class Settings(BaseSettings):
     model_config = ConfigDict(
         env_file=".env",
         case_sensitive=True,
-        extra="ignore"
+        extra="ignore",
+        frozen=True
     )
 
     @field_validator("SECRET_KEY")
@@ -72,17 +87,33 @@ class Settings(BaseSettings):
     @classmethod
     def validate_database_url(cls, v: str) -> str:
         """Ensure DATABASE_URL uses asyncpg for async support."""
-        if "postgresql://" in v:
-            v = v.replace("postgresql://", "postgresql+asyncpg://")
-            logger.warning("Converted DATABASE_URL to use asyncpg driver")
-        elif "postgresql+asyncpg://" not in v:
+        for scheme in SYNC_POSTGRES_SCHEMES:
+            if v.startswith(scheme):
+                v = "postgresql+asyncpg://" + v[len(scheme):]
+                logger.warning("Converted DATABASE_URL to use asyncpg driver")
+                break
+        if not v.startswith("postgresql+asyncpg://"):
             raise ValueError("DATABASE_URL must use postgresql+asyncpg:// for async support")
         return v
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Load settings once per process.
+
+    The environment and .env file are parsed and validated on the first call
+    only; later calls (including use as a FastAPI dependency) reuse the instance.
+
+    Returns:
+        Application settings
+    """
+    return Settings()
+
+
 try:
-    settings = Settings()
-    logger.info(f"Configuration loaded successfully for environment: {settings.ENVIRONMENT}")
+    settings = get_settings()
+    logger.info("Configuration loaded successfully for environment: %s", settings.ENVIRONMENT)
 except Exception as e:
-    logger.error(f"Failed to load configuration: {str(e)}")
+    logger.error("Failed to load configuration: %s", e)
     raise
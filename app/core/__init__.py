@@ -1,5 +1,14 @@
 """Core utilities package."""
-from app.core.security import verify_password, get_password_hash, decode_token
+from app.core.security import (
+    verify_password,
+    get_password_hash,
+    averify_password,
+    aget_password_hash,
+    encode_token,
+    decode_token,
+    verify_and_extract_user_id,
+    TokenIdentity
+)
 from app.core.permissions import require_role, is_admin, is_approver, check_ownership
 from app.core.exceptions import (
     BaseAppException,
@@ -15,7 +24,12 @@ from app.core.exceptions import (
 __all__ = [
     "verify_password",
     "get_password_hash",
+    "averify_password",
+    "aget_password_hash",
+    "encode_token",
     "decode_token",
+    "verify_and_extract_user_id",
+    "TokenIdentity",
     "require_role",
     "is_admin",
     "is_approver",
@@ -0,0 +1,211 @@
+"""
+Redis-backed response cache.
+Stores pre-serialized response bodies and degrades to a no-op when Redis is unavailable.
+"""
+import logging
+import time
+from typing import Dict, List, Optional
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Seconds to skip Redis after a connection failure
+CACHE_RETRY_AFTER_SECONDS = 30
+
+_disabled_until: float = 0.0
+
+
+def _get_client() -> Optional[aioredis.Redis]:
+    """
+    Get a pooled Redis client, or None while Redis is marked unavailable.
+
+    Returns:
+        Redis client instance or None
+    """
+    if time.monotonic() < _disabled_until:
+        return None
+    return get_redis()
+
+
+def _mark_unavailable(error: Exception) -> None:
+    """
+    Disable cache access for a short period after a Redis failure.
+
+    Args:
+        error: Error raised by the Redis client
+    """
+    global _disabled_until
+    _disabled_until = time.monotonic() + CACHE_RETRY_AFTER_SECONDS
+    logger.warning("Redis cache unavailable, bypassing for %ss: %s", CACHE_RETRY_AFTER_SECONDS, error)
+
+
+async def cache_get(key: str) -> Optional[bytes]:
+    """
+    Get a cached value.
+
+    Args:
+        key: Cache key
+
+    Returns:
+        Cached bytes or None on miss or Redis failure
+    """
+    client = _get_client()
+    if client is None:
+        return None
+
+    try:
+        return await client.get(key)
+    except (RedisError, OSError) as e:
+        _mark_unavailable(e)
+        return None
+
+
+async def cache_set(key: str, value: bytes, expire: int) -> None:
+    """
+    Store a value with an expiry.
+
+    Args:
+        key: Cache key
+        value: Serialized value
+        expire: Time to live in seconds
+    """
+    client = _get_client()
+    if client is None:
+        return
+
+    try:
+        await client.set(key, value, ex=expire)
+    except (RedisError, OSError) as e:
+        _mark_unavailable(e)
+
+
+async def cache_delete(*keys: str) -> None:
+    """
+    Delete cached values.
+
+    Args:
+        keys: Cache keys
+    """
+    client = _get_client()
+    if client is None or not keys:
+        return
+
+    try:
+        await client.delete(*keys)
+    except (RedisError, OSError) as e:
+        _mark_unavailable(e)
+
+
+async def cache_incr(key: str, expire: int) -> Optional[int]:
+    """
+    Increment a counter, starting its expiry window on the first hit.
+
+    Args:
+        key: Counter key
+        expire: Window length in seconds
+
+    Returns:
+        Counter value, or None when Redis is unavailable
+    """
+    client = _get_client()
+    if client is None:
+        return None
+
+    try:
+        count = await client.incr(key)
+        if count == 1:
+            await client.expire(key, expire)
+        return count
+    except (RedisError, OSError) as e:
+        _mark_unavailable(e)
+        return None
+
+
+async def cache_get_many(*keys: str) -> List[Optional[bytes]]:
+    """
+    Get several cached values in one round trip.
+
+    Args:
+        keys: Cache keys
+
+    Returns:
+        Cached bytes (or None) per key; all None on Redis failure
+    """
+    client = _get_client()
+    if client is None:
+        return [None] * len(keys)
+
+    try:
+        return await client.mget(keys)
+    except (RedisError, OSError) as e:
+        _mark_unavailable(e)
+        return [None] * len(keys)
+
+
+async def cache_set_many(values: Dict[str, bytes], expire: int) -> None:
+    """
+    Store several values with the same expiry in one round trip.
+
+    Args:
+        values: Mapping of cache key to serialized value
+        expire: Time to live in seconds
+    """
+    client = _get_client()
+    if client is None:
+        return
+
+    try:
+        async with client.pipeline(transaction=False) as pipe:
+            for key, value in values.items():
+                pipe.set(key, value, ex=expire)
+            await pipe.execute()
+    except (RedisError, OSError) as e:
+        _mark_unavailable(e)
+
+
+def _generation_key(namespace: str) -> str:
+    """Build the key of a namespace's generation counter."""
+    return f"{namespace}:gen"
+
+
+async def cache_prefix(namespace: str) -> str:
+    """
+    Get the key prefix for a namespace's current generation.
+
+    Keys built on the prefix stop being read once cache_clear bumps the
+    generation; the old entries then age out on their own TTL.
+
+    Args:
+        namespace: Namespace name
+
+    Returns:
+        Prefix of the form "<namespace>:<generation>"
+    """
+    generation = await cache_get(_generation_key(namespace))
+    return f"{namespace}:{generation.decode() if generation else 0}"
+
+
+async def cache_clear(*namespaces: str) -> None:
+    """
+    Invalidate every key in the given namespaces.
+
+    Bumps each namespace's generation counter instead of scanning for its
+    keys, so the cost does not depend on the size of the keyspace.
+
+    Args:
+        namespaces: Namespace names (keys are built on cache_prefix)
+    """
+    client = _get_client()
+    if client is None or not namespaces:
+        return
+
+    try:
+        async with client.pipeline(transaction=False) as pipe:
+            for namespace in namespaces:
+                pipe.incr(_generation_key(namespace))
+            await pipe.execute()
+        logger.debug("Bumped cache generation for namespaces=%s", namespaces)
+    except (RedisError, OSError) as e:
+        _mark_unavailable(e)
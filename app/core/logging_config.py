@@ -2,8 +2,10 @@
 Centralized logging configuration.
 Provides structured logging with file rotation and JSON formatting.
 """
+import atexit
 import logging
 import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import Optional
@@ -17,7 +19,7 @@ class JSONFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcfromtimestamp(record.created).isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -39,6 +41,33 @@ class JSONFormatter(logging.Formatter):
         return json.dumps(log_data)
 
 
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that leaves formatting to the listener thread.
+
+    The stock QueueHandler formats each record on the calling thread and
+    folds the traceback into the message; this only merges the message
+    arguments, so the JSON file formatter still sees exc_info.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Resolve the message arguments and return the record for the queue."""
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the background logging thread."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
 def setup_logging(
         log_level: str = "INFO",
         log_file: Optional[str] = None,
@@ -48,12 +77,18 @@ def setup_logging(
     """
     Setup application logging with file rotation and console output.
 
+    Handlers run on a background QueueListener thread, so console and file
+    writes never block the event loop.
+
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Path to log file (if None, only console logging)
         max_bytes: Maximum log file size before rotation
         backup_count: Number of backup files to keep
     """
+    global _queue_listener
+    stop_logging()
+
     # Create logs directory if it doesn't exist
     if log_file:
         log_path = Path(log_file)
@@ -74,7 +109,7 @@ def setup_logging(
         datefmt="%Y-%m-%d %H:%M:%S"
     )
     console_handler.setFormatter(console_formatter)
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # File handler with rotation (JSON format)
     if log_file:
@@ -86,7 +121,12 @@ def setup_logging(
         )
         file_handler.setLevel(logging.INFO)
         file_handler.setFormatter(JSONFormatter())
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    root_logger.addHandler(_DeferredQueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
 
     # Set third-party loggers to WARNING
     logging.getLogger("uvicorn").setLevel(logging.WARNING)
@@ -96,6 +136,9 @@ def setup_logging(
     logging.info("Logging configured successfully")
 
 
+atexit.register(stop_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance with the specified name.
@@ -8,6 +8,8 @@ from app.models.user import UserRole, User
 
 logger = logging.getLogger(__name__)
 
+_APPROVER_ROLES = frozenset({UserRole.ADMIN, UserRole.L1_APPROVER})
+
 
 def require_role(*roles: UserRole):
     """
@@ -20,19 +22,17 @@ def require_role(*roles: UserRole):
         Decorator function
     """
 
+    # Resolved once at decoration time, not per request
+    allowed = frozenset(roles)
+    role_names = [r.value for r in roles]
+    detail = f"Insufficient permissions. Required roles: {role_names}"
+
     def decorator(func):
         async def wrapper(*args, current_user: User, **kwargs):
-            logger.debug(f"Checking role permission for user_id={current_user.id}, role={current_user.role}")
-
-            if current_user.role not in roles:
-                logger.warning(
-                    f"Permission denied for user_id={current_user.id}, required_roles={[r.value for r in roles]}")
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail=f"Insufficient permissions. Required roles: {[r.value for r in roles]}"
-                )
+            if current_user.role not in allowed:
+                logger.warning("Permission denied for user_id=%s, required_roles=%s", current_user.id, role_names)
+                raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
 
-            logger.debug(f"Permission granted for user_id={current_user.id}")
             return await func(*args, current_user=current_user, **kwargs)
 
         return wrapper
@@ -50,9 +50,7 @@ def is_admin(user: User) -> bool:
     Returns:
         True if user is admin
     """
-    result = user.role == UserRole.ADMIN
-    logger.debug(f"Admin check for user_id={user.id}: {result}")
-    return result
+    return user.role == UserRole.ADMIN
 
 
 def is_approver(user: User) -> bool:
@@ -65,9 +63,7 @@ def is_approver(user: User) -> bool:
     Returns:
         True if user is admin or L1 approver
     """
-    result = user.role in [UserRole.ADMIN, UserRole.L1_APPROVER]
-    logger.debug(f"Approver check for user_id={user.id}: {result}")
-    return result
+    return user.role in _APPROVER_ROLES
 
 
 def check_ownership(user: User, resource_owner_id: int) -> bool:
@@ -81,6 +77,4 @@ def check_ownership(user: User, resource_owner_id: int) -> bool:
     Returns:
         True if user owns the resource or is admin
     """
-    result = user.id == resource_owner_id or is_admin(user)
-    logger.debug(f"Ownership check for user_id={user.id}, resource_owner={resource_owner_id}: {result}")
-    return result
+    return user.id == resource_owner_id or is_admin(user)
@@ -0,0 +1,52 @@
+"""
+Shared Redis connection pool.
+One pool per process so every caller reuses TCP connections and the AUTH handshake.
+"""
+import logging
+from typing import Optional
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+REDIS_MAX_CONNECTIONS = 64
+
+# Built at import; no socket is opened until the first command
+redis_pool: Optional[aioredis.ConnectionPool] = (
+    aioredis.ConnectionPool.from_url(
+        settings.REDIS_URL,
+        password=settings.REDIS_PASSWORD,
+        max_connections=REDIS_MAX_CONNECTIONS,
+        socket_connect_timeout=1,
+        socket_timeout=1
+    )
+    if settings.REDIS_URL else None
+)
+
+
+def get_redis() -> Optional[aioredis.Redis]:
+    """
+    Get a Redis client backed by the shared connection pool.
+
+    Clients are cheap wrappers; connections come from redis_pool. Use
+    client.pipeline(transaction=False) to batch bursts of commands.
+
+    Returns:
+        Redis client, or None if REDIS_URL is not configured
+    """
+    if redis_pool is None:
+        return None
+    return aioredis.Redis(connection_pool=redis_pool)
+
+
+async def close_redis() -> None:
+    """Disconnect all pooled Redis connections."""
+    if redis_pool is None:
+        return
+
+    try:
+        await redis_pool.disconnect()
+        logger.info("Redis connection pool closed")
+    except (RedisError, OSError) as e:
+        logger.warning("Error closing Redis connection pool: %s", e)
@@ -2,16 +2,67 @@
 Security utilities for password hashing and JWT handling.
 Provides cryptographic functions for authentication.
 """
+import asyncio
+import base64
+import hashlib
+import hmac
 import logging
-from passlib.context import CryptContext
-from datetime import datetime, timedelta
-from jose import JWTError, jwt
+import os
+import threading
+import time
+from typing import NamedTuple, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import TTLCache
+import bcrypt
+import orjson
+import jwt
+from jwt import PyJWTError
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt cost factor; each hash records its own, so changing it keeps old hashes valid
+BCRYPT_ROUNDS = settings.BCRYPT_ROUNDS
+
+# Dedicated threads for bcrypt (it releases the GIL), so login bursts run in
+# parallel without starving the default executor used by asyncio.to_thread
+_password_executor = ThreadPoolExecutor(
+    max_workers=(os.cpu_count() or 1) * 2,
+    thread_name_prefix="password-hash"
+)
+
+
+class TokenIdentity(NamedTuple):
+    """User identity extracted from a verified access token."""
+    user_id: int
+    exp: Optional[int]
+
+
+# Verified token payloads keyed by token digest (raw tokens are never stored)
+TOKEN_CACHE_TTL_SECONDS = 30
+TOKEN_EXPIRY_LEEWAY_SECONDS = 5
+_token_cache: TTLCache = TTLCache(maxsize=10000, ttl=TOKEN_CACHE_TTL_SECONDS)
+_token_cache_lock = threading.Lock()
+
+# Decode inputs derived once from settings; tokens carry no audience/issuer claims
+_jwt_key = settings.SECRET_KEY.encode()
+_jwt_algorithms = [settings.ALGORITHM]
+_jwt_decode_options = {"verify_aud": False, "verify_iss": False}
+
+
+def _b64url(data: bytes) -> bytes:
+    """Base64url-encode without padding, as JWT segments require."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# HMAC algorithms signed in-process; anything else goes through PyJWT
+_JWT_HMAC_DIGESTS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+_jwt_digest = _JWT_HMAC_DIGESTS.get(settings.ALGORITHM)
+# HMAC state already keyed with the secret; each signature copies it instead of
+# re-deriving the inner/outer key pads
+_jwt_hmac = hmac.new(_jwt_key, digestmod=_jwt_digest) if _jwt_digest else None
+# The header never changes, so its encoded segment is built once
+_jwt_header_segment = _b64url(orjson.dumps({"alg": settings.ALGORITHM, "typ": "JWT"})) + b"."
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -26,11 +77,9 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         True if passwords match
     """
     try:
-        result = pwd_context.verify(plain_password, hashed_password)
-        logger.debug(f"Password verification result: {result}")
-        return result
+        return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
     except Exception as e:
-        logger.error(f"Error verifying password: {str(e)}", exc_info=True)
+        logger.error("Error verifying password: %s", e, exc_info=True)
         return False
 
 
@@ -45,17 +94,77 @@ def get_password_hash(password: str) -> str:
         Hashed password
     """
     try:
-        hashed = pwd_context.hash(password)
-        logger.debug("Password hashed successfully")
-        return hashed
+        return bcrypt.hashpw(password.encode(), bcrypt.gensalt(BCRYPT_ROUNDS)).decode()
     except Exception as e:
-        logger.error(f"Error hashing password: {str(e)}", exc_info=True)
+        logger.error("Error hashing password: %s", e, exc_info=True)
         raise
 
 
-def decode_token(token: str) -> dict:
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
     """
-    Decode and verify JWT token.
+    Verify a password in a worker thread so bcrypt does not block the event loop.
+
+    Args:
+        plain_password: Plain text password
+        hashed_password: Hashed password from database
+
+    Returns:
+        True if passwords match
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, verify_password, plain_password, hashed_password)
+
+
+async def aget_password_hash(password: str) -> str:
+    """
+    Hash a password in a worker thread so bcrypt does not block the event loop.
+
+    Args:
+        password: Plain text password
+
+    Returns:
+        Hashed password
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, get_password_hash, password)
+
+
+def encode_token(payload: dict) -> str:
+    """
+    Sign a JWT with the configured secret and algorithm.
+
+    For HMAC algorithms the precomputed header segment is joined with the
+    orjson-encoded payload and signed directly, skipping PyJWT's per-call
+    header encoding and algorithm lookup.
+
+    Args:
+        payload: JSON-serializable claims (exp as an integer timestamp)
+
+    Returns:
+        Encoded JWT token
+    """
+    if _jwt_hmac is None:
+        return jwt.encode(payload, _jwt_key, algorithm=settings.ALGORITHM)
+
+    signing_input = _jwt_header_segment + _b64url(orjson.dumps(payload))
+    mac = _jwt_hmac.copy()
+    mac.update(signing_input)
+    return (signing_input + b"." + _b64url(mac.digest())).decode()
+
+
+def _token_cache_key(token: str) -> str:
+    """Digest a token for use as a cache key."""
+    return hashlib.sha256(token.encode()).hexdigest()[:32]
+
+
+def _is_fresh(exp, now: float) -> bool:
+    """Check that a token expiry is not within the eviction leeway."""
+    return exp is None or now < float(exp) - TOKEN_EXPIRY_LEEWAY_SECONDS
+
+
+def _decode_token_uncached(token: str) -> dict:
+    """
+    Verify the token signature and claims.
 
     Args:
         token: JWT token string
@@ -64,19 +173,100 @@ def decode_token(token: str) -> dict:
         Decoded token payload
 
     Raises:
-        JWTError: If token is invalid or expired
+        PyJWTError: If token is invalid or expired
     """
     try:
-        payload = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM]
-        )
-        logger.debug("Token decoded successfully")
-        return payload
-    except JWTError as e:
-        logger.warning(f"JWT decode error: {str(e)}")
+        return jwt.decode(token, _jwt_key, algorithms=_jwt_algorithms, options=_jwt_decode_options)
+    except PyJWTError as e:
+        logger.warning("JWT decode error: %s", e)
         raise
     except Exception as e:
-        logger.error(f"Unexpected error decoding token: {str(e)}", exc_info=True)
-        raise JWTError(f"Token decode failed: {str(e)}")
+        logger.error("Unexpected error decoding token: %s", e, exc_info=True)
+        raise PyJWTError(f"Token decode failed: {str(e)}")
+
+
+def _extract_identity(payload: dict) -> Optional[TokenIdentity]:
+    """Build the token identity from a payload, or None if it has no usable subject."""
+    try:
+        return TokenIdentity(user_id=int(payload["sub"]), exp=payload.get("exp"))
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _verify_token(token: str) -> Tuple[dict, Optional[TokenIdentity]]:
+    """
+    Verify a token, serving repeat presentations from the cache.
+
+    Verified payloads are cached for TOKEN_CACHE_TTL_SECONDS, and never
+    past TOKEN_EXPIRY_LEEWAY_SECONDS before the token's own ``exp``.
+    Invalid tokens are never cached.
+
+    Args:
+        token: JWT token string
+
+    Returns:
+        Tuple of payload and extracted identity (None if the subject is unusable)
+
+    Raises:
+        PyJWTError: If token is invalid or expired
+    """
+    key = _token_cache_key(token)
+    now = time.time()
+
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+    if cached is not None:
+        payload, identity = cached
+        if _is_fresh(payload.get("exp"), now):
+            return payload, identity
+        with _token_cache_lock:
+            _token_cache.pop(key, None)
+
+    payload = _decode_token_uncached(token)
+    identity = _extract_identity(payload)
+    if _is_fresh(payload.get("exp"), now):
+        with _token_cache_lock:
+            _token_cache[key] = (payload, identity)
+    return payload, identity
+
+
+def decode_token(token: str) -> dict:
+    """
+    Decode and verify JWT token.
+
+    Results are cached (see _verify_token); the returned dict is shared
+    between callers and must not be mutated.
+
+    Args:
+        token: JWT token string
+
+    Returns:
+        Decoded token payload
+
+    Raises:
+        PyJWTError: If token is invalid or expired
+    """
+    payload, _ = _verify_token(token)
+    return payload
+
+
+def verify_and_extract_user_id(token: str) -> TokenIdentity:
+    """
+    Verify a token and return the user it identifies.
+
+    Shares the decode cache with decode_token, and the integer user id is
+    computed once per cached token rather than on every request.
+
+    Args:
+        token: JWT token string
+
+    Returns:
+        TokenIdentity with user_id and exp
+
+    Raises:
+        PyJWTError: If token is invalid, expired or has no valid subject
+    """
+    _, identity = _verify_token(token)
+    if identity is None:
+        raise PyJWTError("Token subject is missing or invalid")
+    return identity
@@ -1,5 +1,5 @@
 """CRUD operations package."""
-from app.crud.user_crud import user_crud, UserCRUD
+from app.crud.user_crud import user_crud, UserCRUD, UserIdentity
 from app.crud.blog_crud import blog_crud, BlogCRUD
 from app.crud.feature_request_crud import feature_request_crud, FeatureRequestCRUD
 from app.crud.comment_crud import comment_crud, CommentCRUD
@@ -7,6 +7,7 @@ from app.crud.comment_crud import comment_crud, CommentCRUD
 __all__ = [
     "user_crud",
     "UserCRUD",
+    "UserIdentity",
     "blog_crud",
     "BlogCRUD",
     "feature_request_crud",
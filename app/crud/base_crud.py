@@ -3,13 +3,16 @@ Abstract base CRUD with comprehensive error handling and logging.
 """
 import logging
 from abc import ABC
-from typing import Generic, TypeVar, Type, Optional, List, Dict, Any
+from typing import Generic, TypeVar, Type, Optional, List, Dict, Any, Sequence
+from sqlalchemy.engine import Result
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, update, delete
-from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from sqlalchemy import select, func, update, delete, tuple_, literal
+from sqlalchemy.sql import Select, Executable
+from sqlalchemy.orm import raiseload
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError, DBAPIError
 from pydantic import BaseModel
 from app.database import Base
-from app.core.exceptions import DatabaseError, NotFoundError
+from app.core.exceptions import DatabaseError, NotFoundError, ValidationError
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +20,9 @@ ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
+# Hard ceiling on rows fetched by a single list query, whatever the caller asks for
+MAX_QUERY_LIMIT = 500
+
 
 class BaseCRUD(ABC, Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """
@@ -38,7 +44,99 @@ class BaseCRUD(ABC, Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         self.model = model
         self.model_name = model.__name__
-        logger.info(f"Initialized {self.model_name}CRUD")
+        logger.info("Initialized %sCRUD", self.model_name)
+
+    def _paginate(
+            self,
+            query: Select,
+            skip: int,
+            limit: int,
+            cursor: Optional[int],
+            *sort_columns,
+            descending: bool = True
+    ) -> Select:
+        """
+        Apply keyset or offset pagination to a query ordered by sort_columns, then id.
+
+        With a cursor (id of the last row of the previous page) the query
+        seeks directly past that row's sort key, so deep pages cost the same
+        as the first one; skip is ignored in that case. An unknown cursor id
+        yields no rows; pass the result to _check_cursor to report it.
+
+        Args:
+            query: Select already ordered by sort_columns then id, all in the same direction
+            skip: Offset used when no cursor is given
+            limit: Maximum results
+            cursor: Id of the last row already returned, if any
+            sort_columns: Leading ORDER BY columns
+            descending: Whether the ordering is DESC (default) or ASC
+
+        Returns:
+            Paginated select
+        """
+        limit = min(limit, MAX_QUERY_LIMIT)
+        if cursor is None:
+            return query.offset(skip).limit(limit)
+
+        anchor = [
+            select(column).where(self.model.id == cursor).scalar_subquery()
+            for column in sort_columns
+        ]
+        key = tuple_(*sort_columns, self.model.id)
+        after = tuple_(*anchor, cursor)
+        return query.where(key < after if descending else key > after).limit(limit)
+
+    async def _check_cursor(self, db: AsyncSession, rows: Sequence, cursor: Optional[int]) -> None:
+        """
+        Reject an empty keyset page whose cursor row no longer exists.
+
+        The cursor's sort key is looked up by id, so a cursor row deleted
+        between pages matches nothing and would look like the end of the
+        list. Only empty pages pay for the extra lookup.
+
+        Args:
+            db: Database session
+            rows: Rows of the page fetched with the cursor
+            cursor: Id of the last row already returned, if any
+
+        Raises:
+            ValidationError: If the cursor does not name an existing row
+        """
+        if rows or cursor is None:
+            return
+        if not await self.exists(db, {"id": cursor}):
+            logger.warning("Unknown %s pagination cursor: %s", self.model_name, cursor)
+            raise ValidationError(
+                "Pagination cursor no longer exists; restart from the first page",
+                details={"cursor": cursor}
+            )
+
+    async def _read(self, db: AsyncSession, stmt: Executable) -> Result:
+        """
+        Execute a read statement, retrying once on a stale pooled connection.
+
+        The pool does not ping connections on checkout, so a connection the
+        server already closed surfaces as an invalidated-connection error on
+        its first statement. That is retried on a fresh connection, but only
+        when it was the first statement of the transaction; otherwise earlier
+        work in the session would be silently lost.
+
+        Args:
+            db: Database session
+            stmt: Statement to execute
+
+        Returns:
+            Statement result
+        """
+        first_statement = not db.in_transaction()
+        try:
+            return await db.execute(stmt)
+        except DBAPIError as e:
+            if not (e.connection_invalidated and first_statement):
+                raise
+            logger.warning("Stale database connection, retrying %s read once", self.model_name)
+            await db.rollback()
+            return await db.execute(stmt)
 
     async def get(self, db: AsyncSession, id: int) -> Optional[ModelType]:
         """
@@ -55,20 +153,18 @@ class BaseCRUD(ABC, Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             DatabaseError: If database operation fails
         """
         try:
-            logger.debug(f"Fetching {self.model_name} with id={id}")
-            result = await db.execute(
-                select(self.model).where(self.model.id == id)
-            )
-            obj = result.scalar_one_or_none()
+            logger.debug("Fetching %s with id=%s", self.model_name, id)
+            # Identity-map lookup first; only emits a primary-key SELECT on a miss
+            obj = await db.get(self.model, id)
 
             if obj:
-                logger.debug(f"{self.model_name} id={id} found")
+                logger.debug("%s id=%s found", self.model_name, id)
             else:
-                logger.debug(f"{self.model_name} id={id} not found")
+                logger.debug("%s id=%s not found", self.model_name, id)
 
             return obj
         except SQLAlchemyError as e:
-            logger.error(f"Database error fetching {self.model_name} id={id}: {str(e)}", exc_info=True)
+            logger.error("Database error fetching %s id=%s: %s", self.model_name, id, e, exc_info=True)
             raise DatabaseError(f"Failed to fetch {self.model_name}", details={"id": id, "error": str(e)})
 
     async def get_multi(
@@ -96,8 +192,10 @@ class BaseCRUD(ABC, Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             DatabaseError: If database operation fails
         """
         try:
-            logger.debug(f"Fetching {self.model_name} list: skip={skip}, limit={limit}, filters={filters}")
-            query = select(self.model)
+            logger.debug("Fetching %s list: skip=%s, limit=%s, filters=%s", self.model_name, skip, limit, filters)
+            # List responses never touch relationships; fail loudly instead of
+            # silently issuing one lazy load per row
+            query = select(self.model).options(raiseload("*"))
 
             # Apply filters
             if filters:
@@ -112,15 +210,15 @@ class BaseCRUD(ABC, Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 query = query.order_by(self.model.id.desc())
 
             # Apply pagination
-            query = query.offset(skip).limit(limit)
+            query = query.offset(skip).limit(min(limit, MAX_QUERY_LIMIT))
 
-            result = await db.execute(query)
+            result = await self._read(db, query)
             objects = result.scalars().all()
 
-            logger.debug(f"Retrieved {len(objects)} {self.model_name} records")
+            logger.debug("Retrieved %s %s records", len(objects), self.model_name)
             return list(objects)
         except SQLAlchemyError as e:
-            logger.error(f"Database error fetching {self.model_name} list: {str(e)}", exc_info=True)
+            logger.error("Database error fetching %s list: %s", self.model_name, e, exc_info=True)
             raise DatabaseError(f"Failed to fetch {self.model_name} list", details={"error": str(e)})
 
     async def create(self, db: AsyncSession, obj_in: CreateSchemaType) -> ModelType:
@@ -139,22 +237,22 @@ class BaseCRUD(ABC, Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         try:
             obj_data = obj_in.model_dump()
-            logger.info(f"Creating {self.model_name}: {obj_data}")
+            logger.debug("Creating %s", self.model_name)
 
             db_obj = self.model(**obj_data)
             db.add(db_obj)
             await db.commit()
             await db.refresh(db_obj)
 
-            logger.info(f"{self.model_name} created successfully: id={db_obj.id}")
+            logger.debug("%s created successfully: id=%s", self.model_name, db_obj.id)
             return db_obj
         except IntegrityError as e:
             await db.rollback()
-            logger.error(f"Integrity error creating {self.model_name}: {str(e)}", exc_info=True)
+            logger.error("Integrity error creating %s: %s", self.model_name, e, exc_info=True)
             raise DatabaseError(f"Duplicate or invalid data for {self.model_name}", details={"error": str(e)})
         except SQLAlchemyError as e:
             await db.rollback()
-            logger.error(f"Database error creating {self.model_name}: {str(e)}", exc_info=True)
+            logger.error("Database error creating %s: %s", self.model_name, e, exc_info=True)
             raise DatabaseError(f"Failed to create {self.model_name}", details={"error": str(e)})
 
     async def update(
@@ -178,29 +276,39 @@ class BaseCRUD(ABC, Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             DatabaseError: If database operation fails
         """
         try:
-            logger.info(f"Updating {self.model_name} id={id}")
-
-            db_obj = await self.get(db, id)
-            if not db_obj:
-                logger.warning(f"{self.model_name} id={id} not found for update")
-                return None
+            logger.debug("Updating %s id=%s", self.model_name, id)
 
             update_data = obj_in.model_dump(exclude_unset=True)
-            for field, value in update_data.items():
-                setattr(db_obj, field, value)
-
+            if not update_data:
+                return await self.get(db, id)
+
+            # Single UPDATE ... RETURNING round trip instead of SELECT + UPDATE + refresh;
+            # populate_existing refreshes an already-loaded instance with the returned row
+            stmt = (
+                update(self.model)
+                .where(self.model.id == id)
+                .values(**update_data)
+                .returning(self.model)
+            )
+            result = await db.execute(
+                select(self.model).from_statement(stmt).execution_options(populate_existing=True)
+            )
+            db_obj = result.scalar_one_or_none()
             await db.commit()
-            await db.refresh(db_obj)
 
-            logger.info(f"{self.model_name} id={id} updated successfully")
+            if not db_obj:
+                logger.warning("%s id=%s not found for update", self.model_name, id)
+                return None
+
+            logger.debug("%s id=%s updated successfully", self.model_name, id)
             return db_obj
         except IntegrityError as e:
             await db.rollback()
-            logger.error(f"Integrity error updating {self.model_name} id={id}: {str(e)}", exc_info=True)
+            logger.error("Integrity error updating %s id=%s: %s", self.model_name, id, e, exc_info=True)
             raise DatabaseError(f"Duplicate or invalid data for {self.model_name}", details={"id": id, "error": str(e)})
         except SQLAlchemyError as e:
             await db.rollback()
-            logger.error(f"Database error updating {self.model_name} id={id}: {str(e)}", exc_info=True)
+            logger.error("Database error updating %s id=%s: %s", self.model_name, id, e, exc_info=True)
             raise DatabaseError(f"Failed to update {self.model_name}", details={"id": id, "error": str(e)})
 
     async def delete(self, db: AsyncSession, id: int) -> bool:
@@ -218,21 +326,24 @@ class BaseCRUD(ABC, Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             DatabaseError: If database operation fails
         """
         try:
-            logger.info(f"Deleting {self.model_name} id={id}")
-
-            db_obj = await self.get(db, id)
-            if not db_obj:
-                logger.warning(f"{self.model_name} id={id} not found for deletion")
-                return False
+            logger.debug("Deleting %s id=%s", self.model_name, id)
 
-            await db.delete(db_obj)
+            # Dependent rows are removed by the ON DELETE CASCADE foreign keys
+            result = await db.execute(
+                delete(self.model).where(self.model.id == id).returning(self.model.id)
+            )
+            deleted_id = result.scalar_one_or_none()
             await db.commit()
 
-            logger.info(f"{self.model_name} id={id} deleted successfully")
+            if deleted_id is None:
+                logger.warning("%s id=%s not found for deletion", self.model_name, id)
+                return False
+
+            logger.debug("%s id=%s deleted successfully", self.model_name, id)
             return True
         except SQLAlchemyError as e:
             await db.rollback()
-            logger.error(f"Database error deleting {self.model_name} id={id}: {str(e)}", exc_info=True)
+            logger.error("Database error deleting %s id=%s: %s", self.model_name, id, e, exc_info=True)
             raise DatabaseError(f"Failed to delete {self.model_name}", details={"id": id, "error": str(e)})
 
     async def count(self, db: AsyncSession, filters: Optional[Dict[str, Any]] = None) -> int:
@@ -257,11 +368,41 @@ class BaseCRUD(ABC, Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                     if hasattr(self.model, key) and value is not None:
                         query = query.where(getattr(self.model, key) == value)
 
-            result = await db.execute(query)
+            result = await self._read(db, query)
             count = result.scalar()
 
-            logger.debug(f"{self.model_name} count: {count} (filters={filters})")
+            logger.debug("%s count: %s (filters=%s)", self.model_name, count, filters)
             return count
         except SQLAlchemyError as e:
-            logger.error(f"Database error counting {self.model_name}: {str(e)}", exc_info=True)
+            logger.error("Database error counting %s: %s", self.model_name, e, exc_info=True)
             raise DatabaseError(f"Failed to count {self.model_name}", details={"error": str(e)})
+
+    async def exists(self, db: AsyncSession, filters: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Check whether any record matches the filters.
+
+        Stops at the first matching row, unlike count() which scans them all.
+
+        Args:
+            db: Database session
+            filters: Optional filter dictionary
+
+        Returns:
+            True if at least one record matches
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        try:
+            query = select(literal(1)).select_from(self.model)
+
+            if filters:
+                for key, value in filters.items():
+                    if hasattr(self.model, key) and value is not None:
+                        query = query.where(getattr(self.model, key) == value)
+
+            result = await self._read(db, query.limit(1))
+            return result.scalar() is not None
+        except SQLAlchemyError as e:
+            logger.error("Database error checking %s existence: %s", self.model_name, e, exc_info=True)
+            raise DatabaseError(f"Failed to check {self.model_name} existence", details={"error": str(e)})
@@ -3,10 +3,11 @@ Blog CRUD operations with approval workflow.
 Implements abstract BaseCRUD with blog-specific functionality.
 """
 import logging
-from typing import Optional, List
-from datetime import datetime
-from sqlalchemy import select
+from typing import Optional, List, Sequence
+from sqlalchemy import select, update, delete, func
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 from sqlalchemy.exc import SQLAlchemyError
 from app.crud.base_crud import BaseCRUD
 from app.models.blog import Blog, BlogStatus
@@ -15,6 +16,10 @@ from app.core.exceptions import DatabaseError, NotFoundError
 
 logger = logging.getLogger(__name__)
 
+# Listings select plain columns: rows skip ORM instance construction and the
+# identity map, and are serialized straight into BlogResponse
+_LISTING_COLUMNS = tuple(Blog.__table__.columns)
+
 
 class BlogCRUD(BaseCRUD[Blog, BlogCreate, BlogUpdate]):
     """
@@ -22,13 +27,39 @@ class BlogCRUD(BaseCRUD[Blog, BlogCreate, BlogUpdate]):
     Extends BaseCRUD with blog-specific operations.
     """
 
+    async def get_public(self, db: AsyncSession, id: int) -> Optional[Blog]:
+        """
+        Get a blog by ID only if it is approved.
+
+        Args:
+            db: Database session
+            id: Blog ID
+
+        Returns:
+            Approved blog instance or None
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        try:
+            logger.debug("Fetching public blog with id=%s", id)
+            result = await self._read(
+                db,
+                select(Blog).options(raiseload("*")).where(Blog.id == id, Blog.status == BlogStatus.APPROVED)
+            )
+            return result.scalar_one_or_none()
+        except SQLAlchemyError as e:
+            logger.error("Database error fetching public blog id=%s: %s", id, e, exc_info=True)
+            raise DatabaseError("Failed to fetch blog", details={"id": id, "error": str(e)})
+
     async def get_by_author(
             self,
             db: AsyncSession,
             author_id: int,
             skip: int = 0,
-            limit: int = 100
-    ) -> List[Blog]:
+            limit: int = 100,
+            cursor: Optional[int] = None
+    ) -> List[Row]:
         """
         Get all blogs by specific author.
 
@@ -37,32 +68,37 @@ class BlogCRUD(BaseCRUD[Blog, BlogCreate, BlogUpdate]):
             author_id: Author user ID
             skip: Pagination offset
             limit: Maximum results
+            cursor: Id of the last blog from the previous page (keyset pagination)
 
         Returns:
-            List of blog instances
+            List of blog rows (all columns, no ORM instances)
 
         Raises:
             DatabaseError: If database operation fails
         """
         try:
-            logger.debug(f"Fetching blogs for author_id={author_id}, skip={skip}, limit={limit}")
-            query = select(Blog).where(Blog.author_id == author_id).offset(skip).limit(limit).order_by(
-                Blog.created_at.desc())
-            result = await db.execute(query)
-            blogs = result.scalars().all()
-
-            logger.debug(f"Retrieved {len(blogs)} blogs for author_id={author_id}")
+            logger.debug("Fetching blogs for author_id=%s, skip=%s, limit=%s", author_id, skip, limit)
+            query = select(*_LISTING_COLUMNS).where(
+                Blog.author_id == author_id
+            ).order_by(Blog.created_at.desc(), Blog.id.desc())
+            query = self._paginate(query, skip, limit, cursor, Blog.created_at)
+            result = await self._read(db, query)
+            blogs = result.all()
+            await self._check_cursor(db, blogs, cursor)
+
+            logger.debug("Retrieved %s blogs for author_id=%s", len(blogs), author_id)
             return list(blogs)
         except SQLAlchemyError as e:
-            logger.error(f"Database error fetching blogs for author {author_id}: {str(e)}", exc_info=True)
-            raise DatabaseError(f"Failed to fetch blogs for author", details={"author_id": author_id, "error": str(e)})
+            logger.error("Database error fetching blogs for author %s: %s", author_id, e, exc_info=True)
+            raise DatabaseError("Failed to fetch blogs for author", details={"author_id": author_id, "error": str(e)})
 
     async def get_approved_blogs(
             self,
             db: AsyncSession,
             skip: int = 0,
-            limit: int = 100
-    ) -> List[Blog]:
+            limit: int = 100,
+            cursor: Optional[int] = None
+    ) -> List[Row]:
         """
         Get all approved (public) blogs.
 
@@ -70,33 +106,37 @@ class BlogCRUD(BaseCRUD[Blog, BlogCreate, BlogUpdate]):
             db: Database session
             skip: Pagination offset
             limit: Maximum results
+            cursor: Id of the last blog from the previous page (keyset pagination)
 
         Returns:
-            List of approved blog instances
+            List of approved blog rows (all columns, no ORM instances)
 
         Raises:
             DatabaseError: If database operation fails
         """
         try:
-            logger.debug(f"Fetching approved blogs: skip={skip}, limit={limit}")
-            query = select(Blog).where(
+            logger.debug("Fetching approved blogs: skip=%s, limit=%s", skip, limit)
+            query = select(*_LISTING_COLUMNS).where(
                 Blog.status == BlogStatus.APPROVED
-            ).offset(skip).limit(limit).order_by(Blog.approved_at.desc())
-            result = await db.execute(query)
-            blogs = result.scalars().all()
+            ).order_by(Blog.approved_at.desc(), Blog.id.desc())
+            query = self._paginate(query, skip, limit, cursor, Blog.approved_at)
+            result = await self._read(db, query)
+            blogs = result.all()
+            await self._check_cursor(db, blogs, cursor)
 
-            logger.debug(f"Retrieved {len(blogs)} approved blogs")
+            logger.debug("Retrieved %s approved blogs", len(blogs))
             return list(blogs)
         except SQLAlchemyError as e:
-            logger.error(f"Database error fetching approved blogs: {str(e)}", exc_info=True)
-            raise DatabaseError(f"Failed to fetch approved blogs", details={"error": str(e)})
+            logger.error("Database error fetching approved blogs: %s", e, exc_info=True)
+            raise DatabaseError("Failed to fetch approved blogs", details={"error": str(e)})
 
     async def get_pending_blogs(
             self,
             db: AsyncSession,
             skip: int = 0,
-            limit: int = 100
-    ) -> List[Blog]:
+            limit: int = 100,
+            cursor: Optional[int] = None
+    ) -> List[Row]:
         """
         Get all pending blogs awaiting approval.
 
@@ -104,26 +144,143 @@ class BlogCRUD(BaseCRUD[Blog, BlogCreate, BlogUpdate]):
             db: Database session
             skip: Pagination offset
             limit: Maximum results
+            cursor: Id of the last blog from the previous page (keyset pagination)
 
         Returns:
-            List of pending blog instances
+            List of pending blog rows (all columns, no ORM instances)
 
         Raises:
             DatabaseError: If database operation fails
         """
         try:
-            logger.debug(f"Fetching pending blogs: skip={skip}, limit={limit}")
-            query = select(Blog).where(
+            logger.debug("Fetching pending blogs: skip=%s, limit=%s", skip, limit)
+            query = select(*_LISTING_COLUMNS).where(
                 Blog.status == BlogStatus.PENDING
-            ).offset(skip).limit(limit).order_by(Blog.created_at.desc())
-            result = await db.execute(query)
-            blogs = result.scalars().all()
+            ).order_by(Blog.created_at.desc(), Blog.id.desc())
+            query = self._paginate(query, skip, limit, cursor, Blog.created_at)
+            result = await self._read(db, query)
+            blogs = result.all()
+            await self._check_cursor(db, blogs, cursor)
 
-            logger.info(f"Retrieved {len(blogs)} pending blogs")
+            logger.info("Retrieved %s pending blogs", len(blogs))
             return list(blogs)
         except SQLAlchemyError as e:
-            logger.error(f"Database error fetching pending blogs: {str(e)}", exc_info=True)
-            raise DatabaseError(f"Failed to fetch pending blogs", details={"error": str(e)})
+            logger.error("Database error fetching pending blogs: %s", e, exc_info=True)
+            raise DatabaseError("Failed to fetch pending blogs", details={"error": str(e)})
+
+    async def update_pending_by_author(
+            self,
+            db: AsyncSession,
+            blog_id: int,
+            author_id: int,
+            obj_in: BlogUpdate
+    ) -> Optional[Blog]:
+        """
+        Update a blog only if it belongs to the author and is still pending.
+
+        Ownership and status are checked in the WHERE clause of a single
+        UPDATE ... RETURNING, so no separate SELECT is needed.
+
+        Args:
+            db: Database session
+            blog_id: Blog ID
+            author_id: Expected author user ID
+            obj_in: Update data
+
+        Returns:
+            Updated blog instance, or None if the blog is missing, owned by
+            someone else or no longer pending
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        conditions = (Blog.id == blog_id, Blog.author_id == author_id, Blog.status == BlogStatus.PENDING)
+        try:
+            logger.debug("Updating pending blog id=%s for author_id=%s", blog_id, author_id)
+            update_data = obj_in.model_dump(exclude_unset=True)
+            if not update_data:
+                result = await self._read(db, select(Blog).where(*conditions))
+                return result.scalar_one_or_none()
+
+            stmt = update(Blog).where(*conditions).values(**update_data).returning(Blog)
+            result = await db.execute(
+                select(Blog).from_statement(stmt).execution_options(populate_existing=True)
+            )
+            blog = result.scalar_one_or_none()
+            await db.commit()
+            return blog
+        except SQLAlchemyError as e:
+            await db.rollback()
+            logger.error("Database error updating blog %s: %s", blog_id, e, exc_info=True)
+            raise DatabaseError("Failed to update blog", details={"id": blog_id, "error": str(e)})
+
+    async def delete_by_author(
+            self,
+            db: AsyncSession,
+            blog_id: int,
+            author_id: Optional[int] = None
+    ) -> bool:
+        """
+        Delete a blog in a single DELETE ... RETURNING, optionally only if owned by the author.
+
+        Args:
+            db: Database session
+            blog_id: Blog ID
+            author_id: Required author user ID, or None to delete regardless of owner
+
+        Returns:
+            True if deleted, False if the blog is missing or owned by someone else
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        stmt = delete(Blog).where(Blog.id == blog_id)
+        if author_id is not None:
+            stmt = stmt.where(Blog.author_id == author_id)
+
+        try:
+            logger.debug("Deleting blog id=%s for author_id=%s", blog_id, author_id)
+            result = await db.execute(stmt.returning(Blog.id))
+            deleted_id = result.scalar_one_or_none()
+            await db.commit()
+            return deleted_id is not None
+        except SQLAlchemyError as e:
+            await db.rollback()
+            logger.error("Database error deleting blog %s: %s", blog_id, e, exc_info=True)
+            raise DatabaseError("Failed to delete blog", details={"id": blog_id, "error": str(e)})
+
+    async def _review(
+            self,
+            db: AsyncSession,
+            blog_id: int,
+            **values
+    ) -> Optional[Blog]:
+        """
+        Move a pending blog to a reviewed state in a single UPDATE ... RETURNING.
+
+        The status=PENDING condition makes concurrent reviews safe: only the
+        first one matches the row.
+
+        Args:
+            db: Database session
+            blog_id: Blog ID
+            values: Column values to set
+
+        Returns:
+            Updated blog instance, or None if the blog is missing or not pending
+        """
+        stmt = (
+            update(Blog)
+            .where(Blog.id == blog_id, Blog.status == BlogStatus.PENDING)
+            .values(**values)
+            .returning(Blog)
+        )
+        result = await db.execute(
+            select(Blog).from_statement(stmt).execution_options(populate_existing=True)
+        )
+        blog = result.scalar_one_or_none()
+        await db.commit()
+        return blog
 
     async def approve_blog(
             self,
@@ -140,32 +297,31 @@ class BlogCRUD(BaseCRUD[Blog, BlogCreate, BlogUpdate]):
             approver_id: Admin/approver user ID
 
         Returns:
-            Updated blog instance or None
+            Updated blog instance, or None if the blog is missing or not pending
 
         Raises:
             DatabaseError: If database operation fails
         """
         try:
-            logger.info(f"Approving blog id={blog_id} by approver_id={approver_id}")
-            blog = await self.get(db, blog_id)
+            logger.info("Approving blog id=%s by approver_id=%s", blog_id, approver_id)
+            blog = await self._review(
+                db,
+                blog_id,
+                status=BlogStatus.APPROVED,
+                approved_by=approver_id,
+                approved_at=func.now()
+            )
 
             if not blog:
-                logger.warning(f"Blog id={blog_id} not found for approval")
+                logger.warning("Blog id=%s not pending or not found for approval", blog_id)
                 return None
 
-            blog.status = BlogStatus.APPROVED
-            blog.approved_by = approver_id
-            blog.approved_at = datetime.utcnow()
-
-            await db.commit()
-            await db.refresh(blog)
-
-            logger.info(f"Blog id={blog_id} approved successfully")
+            logger.info("Blog id=%s approved successfully", blog_id)
             return blog
         except SQLAlchemyError as e:
             await db.rollback()
-            logger.error(f"Database error approving blog {blog_id}: {str(e)}", exc_info=True)
-            raise DatabaseError(f"Failed to approve blog", details={"blog_id": blog_id, "error": str(e)})
+            logger.error("Database error approving blog %s: %s", blog_id, e, exc_info=True)
+            raise DatabaseError("Failed to approve blog", details={"blog_id": blog_id, "error": str(e)})
 
     async def reject_blog(
             self,
@@ -180,30 +336,119 @@ class BlogCRUD(BaseCRUD[Blog, BlogCreate, BlogUpdate]):
             blog_id: Blog ID to reject
 
         Returns:
-            Updated blog instance or None
+            Updated blog instance, or None if the blog is missing or not pending
 
         Raises:
             DatabaseError: If database operation fails
         """
         try:
-            logger.info(f"Rejecting blog id={blog_id}")
-            blog = await self.get(db, blog_id)
+            logger.info("Rejecting blog id=%s", blog_id)
+            blog = await self._review(db, blog_id, status=BlogStatus.REJECTED)
 
             if not blog:
-                logger.warning(f"Blog id={blog_id} not found for rejection")
+                logger.warning("Blog id=%s not pending or not found for rejection", blog_id)
                 return None
 
-            blog.status = BlogStatus.REJECTED
+            logger.info("Blog id=%s rejected successfully", blog_id)
+            return blog
+        except SQLAlchemyError as e:
+            await db.rollback()
+            logger.error("Database error rejecting blog %s: %s", blog_id, e, exc_info=True)
+            raise DatabaseError("Failed to reject blog", details={"blog_id": blog_id, "error": str(e)})
 
-            await db.commit()
-            await db.refresh(blog)
+    async def _bulk_review(
+            self,
+            db: AsyncSession,
+            blog_ids: List[int],
+            returning: Sequence,
+            **values
+    ) -> List[Row]:
+        """
+        Move several pending blogs to a reviewed state in one UPDATE ... RETURNING.
 
-            logger.info(f"Blog id={blog_id} rejected successfully")
-            return blog
+        Ids that are missing or no longer pending are skipped.
+
+        Args:
+            db: Database session
+            blog_ids: Blog IDs to review
+            returning: Columns to return for each updated blog
+            values: Column values to set
+
+        Returns:
+            One row per blog actually updated
+        """
+        stmt = (
+            update(Blog)
+            .where(Blog.id.in_(blog_ids), Blog.status == BlogStatus.PENDING)
+            .values(**values)
+            .returning(*returning)
+            .execution_options(synchronize_session="fetch")
+        )
+        result = await db.execute(stmt)
+        rows = result.all()
+        await db.commit()
+        return rows
+
+    async def bulk_approve(
+            self,
+            db: AsyncSession,
+            blog_ids: List[int],
+            approver_id: int
+    ) -> List[Row]:
+        """
+        Approve several pending blogs at once.
+
+        Args:
+            db: Database session
+            blog_ids: Blog IDs to approve
+            approver_id: Admin/approver user ID
+
+        Returns:
+            (id, title, approved_at) rows for the blogs actually approved
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        try:
+            logger.info("Bulk approving %s blogs by approver_id=%s", len(blog_ids), approver_id)
+            rows = await self._bulk_review(
+                db,
+                blog_ids,
+                (Blog.id, Blog.title, Blog.approved_at),
+                status=BlogStatus.APPROVED,
+                approved_by=approver_id,
+                approved_at=func.now()
+            )
+            logger.info("Bulk approved %s of %s blogs", len(rows), len(blog_ids))
+            return rows
+        except SQLAlchemyError as e:
+            await db.rollback()
+            logger.error("Database error bulk approving blogs: %s", e, exc_info=True)
+            raise DatabaseError("Failed to approve blogs", details={"blog_ids": blog_ids, "error": str(e)})
+
+    async def bulk_reject(self, db: AsyncSession, blog_ids: List[int]) -> List[int]:
+        """
+        Reject several pending blogs at once.
+
+        Args:
+            db: Database session
+            blog_ids: Blog IDs to reject
+
+        Returns:
+            IDs of the blogs actually rejected
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        try:
+            logger.info("Bulk rejecting %s blogs", len(blog_ids))
+            rows = await self._bulk_review(db, blog_ids, (Blog.id,), status=BlogStatus.REJECTED)
+            logger.info("Bulk rejected %s of %s blogs", len(rows), len(blog_ids))
+            return [row.id for row in rows]
         except SQLAlchemyError as e:
             await db.rollback()
-            logger.error(f"Database error rejecting blog {blog_id}: {str(e)}", exc_info=True)
-            raise DatabaseError(f"Failed to reject blog", details={"blog_id": blog_id, "error": str(e)})
+            logger.error("Database error bulk rejecting blogs: %s", e, exc_info=True)
+            raise DatabaseError("Failed to reject blogs", details={"blog_ids": blog_ids, "error": str(e)})
 
 
 # Create singleton instance
@@ -3,10 +3,12 @@ Comment CRUD operations.
 Implements abstract BaseCRUD with comment-specific functionality.
 """
 import logging
-from typing import List
-from sqlalchemy import select
+from typing import List, Optional
+from sqlalchemy import select, insert, bindparam
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import raiseload
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from app.crud.base_crud import BaseCRUD
 from app.models.comment import Comment
 from app.schemas.comment_dto import CommentCreate, CommentBase
@@ -14,6 +16,13 @@ from app.core.exceptions import DatabaseError
 
 logger = logging.getLogger(__name__)
 
+# Built once at import; live comments only need the generated id and timestamp back
+_INSERT_COMMENT = insert(Comment).values(
+    content=bindparam("content"),
+    blog_id=bindparam("blog_id"),
+    user_id=bindparam("user_id")
+).returning(Comment.id, Comment.created_at)
+
 
 class CommentCRUD(BaseCRUD[Comment, CommentCreate, CommentBase]):
     """
@@ -26,16 +35,18 @@ class CommentCRUD(BaseCRUD[Comment, CommentCreate, CommentBase]):
             db: AsyncSession,
             blog_id: int,
             skip: int = 0,
-            limit: int = 100
+            limit: int = 100,
+            cursor: Optional[int] = None
     ) -> List[Comment]:
         """
-        Get all comments for a specific blog.
+        Get all comments for a specific blog, oldest first.
 
         Args:
             db: Database session
             blog_id: Blog ID
             skip: Pagination offset
             limit: Maximum results
+            cursor: Id of the last comment from the previous page (keyset pagination)
 
         Returns:
             List of comment instances
@@ -44,19 +55,53 @@ class CommentCRUD(BaseCRUD[Comment, CommentCreate, CommentBase]):
             DatabaseError: If database operation fails
         """
         try:
-            logger.debug(f"Fetching comments for blog_id={blog_id}")
-            query = select(Comment).where(
+            logger.debug("Fetching comments for blog_id=%s", blog_id)
+            query = select(Comment).options(raiseload("*")).where(
                 Comment.blog_id == blog_id
-            ).offset(skip).limit(limit).order_by(Comment.created_at.asc())
-            result = await db.execute(query)
+            ).order_by(Comment.created_at.asc(), Comment.id.asc())
+            query = self._paginate(query, skip, limit, cursor, Comment.created_at, descending=False)
+            result = await self._read(db, query)
             comments = result.scalars().all()
+            await self._check_cursor(db, comments, cursor)
 
-            logger.debug(f"Retrieved {len(comments)} comments for blog_id={blog_id}")
+            logger.debug("Retrieved %s comments for blog_id=%s", len(comments), blog_id)
             return list(comments)
         except SQLAlchemyError as e:
-            logger.error(f"Database error fetching comments for blog {blog_id}: {str(e)}", exc_info=True)
+            logger.error("Database error fetching comments for blog %s: %s", blog_id, e, exc_info=True)
             raise DatabaseError(f"Failed to fetch comments", details={"blog_id": blog_id, "error": str(e)})
 
+    async def insert_returning(self, db: AsyncSession, content: str, blog_id: int, user_id: int) -> Row:
+        """
+        Insert a comment in one round trip without building an ORM instance.
+
+        Args:
+            db: Database session
+            content: Comment text (already validated)
+            blog_id: Blog ID
+            user_id: Author user ID
+
+        Returns:
+            Row with the new comment's id and created_at
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        try:
+            result = await db.execute(
+                _INSERT_COMMENT, {"content": content, "blog_id": blog_id, "user_id": user_id}
+            )
+            row = result.one()
+            await db.commit()
+            return row
+        except IntegrityError as e:
+            await db.rollback()
+            logger.error("Integrity error creating comment for blog_id=%s: %s", blog_id, e, exc_info=True)
+            raise DatabaseError("Duplicate or invalid data for Comment", details={"error": str(e)})
+        except SQLAlchemyError as e:
+            await db.rollback()
+            logger.error("Database error creating comment for blog_id=%s: %s", blog_id, e, exc_info=True)
+            raise DatabaseError("Failed to create Comment", details={"error": str(e)})
+
 
 # Create singleton instance
 comment_crud = CommentCRUD(Comment)
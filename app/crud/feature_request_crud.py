@@ -3,9 +3,10 @@ Feature Request CRUD operations.
 Implements abstract BaseCRUD with feature request-specific functionality.
 """
 import logging
-from typing import List
+from typing import List, Optional
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 from sqlalchemy.exc import SQLAlchemyError
 from app.crud.base_crud import BaseCRUD
 from app.models.feature_request import FeatureRequest, FeatureRequestStatus
@@ -26,16 +27,18 @@ class FeatureRequestCRUD(BaseCRUD[FeatureRequest, FeatureRequestCreate, FeatureR
             db: AsyncSession,
             user_id: int,
             skip: int = 0,
-            limit: int = 100
+            limit: int = 100,
+            cursor: Optional[int] = None
     ) -> List[FeatureRequest]:
         """
-        Get all feature requests by specific user.
+        Get all feature requests by specific user, newest first.
 
         Args:
             db: Database session
             user_id: User ID
             skip: Pagination offset
             limit: Maximum results
+            cursor: Id of the last request from the previous page (keyset pagination)
 
         Returns:
             List of feature request instances
@@ -44,17 +47,19 @@ class FeatureRequestCRUD(BaseCRUD[FeatureRequest, FeatureRequestCreate, FeatureR
             DatabaseError: If database operation fails
         """
         try:
-            logger.debug(f"Fetching feature requests for user_id={user_id}")
-            query = select(FeatureRequest).where(
+            logger.debug("Fetching feature requests for user_id=%s", user_id)
+            query = select(FeatureRequest).options(raiseload("*")).where(
                 FeatureRequest.user_id == user_id
-            ).offset(skip).limit(limit).order_by(FeatureRequest.created_at.desc())
-            result = await db.execute(query)
+            ).order_by(FeatureRequest.created_at.desc(), FeatureRequest.id.desc())
+            query = self._paginate(query, skip, limit, cursor, FeatureRequest.created_at)
+            result = await self._read(db, query)
             requests = result.scalars().all()
+            await self._check_cursor(db, requests, cursor)
 
-            logger.debug(f"Retrieved {len(requests)} feature requests for user_id={user_id}")
+            logger.debug("Retrieved %s feature requests for user_id=%s", len(requests), user_id)
             return list(requests)
         except SQLAlchemyError as e:
-            logger.error(f"Database error fetching feature requests for user {user_id}: {str(e)}", exc_info=True)
+            logger.error("Database error fetching feature requests for user %s: %s", user_id, e, exc_info=True)
             raise DatabaseError(f"Failed to fetch feature requests", details={"user_id": user_id, "error": str(e)})
 
     async def get_by_status(
@@ -62,16 +67,18 @@ class FeatureRequestCRUD(BaseCRUD[FeatureRequest, FeatureRequestCreate, FeatureR
             db: AsyncSession,
             status: FeatureRequestStatus,
             skip: int = 0,
-            limit: int = 100
+            limit: int = 100,
+            cursor: Optional[int] = None
     ) -> List[FeatureRequest]:
         """
-        Get feature requests by status.
+        Get feature requests by status, highest priority and newest first.
 
         Args:
             db: Database session
             status: Feature request status
             skip: Pagination offset
             limit: Maximum results
+            cursor: Id of the last request from the previous page (keyset pagination)
 
         Returns:
             List of feature request instances
@@ -80,20 +87,66 @@ class FeatureRequestCRUD(BaseCRUD[FeatureRequest, FeatureRequestCreate, FeatureR
             DatabaseError: If database operation fails
         """
         try:
-            logger.debug(f"Fetching feature requests with status={status.value}")
-            query = select(FeatureRequest).where(
+            logger.debug("Fetching feature requests with status=%s", status.value)
+            query = select(FeatureRequest).options(raiseload("*")).where(
                 FeatureRequest.status == status
-            ).offset(skip).limit(limit).order_by(FeatureRequest.priority.desc(), FeatureRequest.created_at.desc())
-            result = await db.execute(query)
+            ).order_by(
+                FeatureRequest.priority.desc(), FeatureRequest.created_at.desc(), FeatureRequest.id.desc()
+            )
+            query = self._paginate(
+                query, skip, limit, cursor, FeatureRequest.priority, FeatureRequest.created_at
+            )
+            result = await self._read(db, query)
             requests = result.scalars().all()
+            await self._check_cursor(db, requests, cursor)
 
-            logger.debug(f"Retrieved {len(requests)} feature requests with status={status.value}")
+            logger.debug("Retrieved %s feature requests with status=%s", len(requests), status.value)
             return list(requests)
         except SQLAlchemyError as e:
-            logger.error(f"Database error fetching feature requests by status {status}: {str(e)}", exc_info=True)
+            logger.error("Database error fetching feature requests by status %s: %s", status, e, exc_info=True)
             raise DatabaseError(f"Failed to fetch feature requests by status",
                                 details={"status": status.value, "error": str(e)})
 
+    async def get_prioritized(
+            self,
+            db: AsyncSession,
+            skip: int = 0,
+            limit: int = 100,
+            cursor: Optional[int] = None
+    ) -> List[FeatureRequest]:
+        """
+        Get feature requests ordered by priority (high to low), newest first within a priority.
+
+        Args:
+            db: Database session
+            skip: Pagination offset
+            limit: Maximum results
+            cursor: Id of the last request from the previous page (keyset pagination)
+
+        Returns:
+            List of feature request instances
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        try:
+            logger.debug("Fetching prioritized feature requests: skip=%s, limit=%s", skip, limit)
+            query = select(FeatureRequest).options(raiseload("*")).order_by(
+                FeatureRequest.priority.desc(), FeatureRequest.created_at.desc(), FeatureRequest.id.desc()
+            )
+            query = self._paginate(
+                query, skip, limit, cursor, FeatureRequest.priority, FeatureRequest.created_at
+            )
+            result = await self._read(db, query)
+            requests = result.scalars().all()
+            await self._check_cursor(db, requests, cursor)
+
+            logger.debug("Retrieved %s prioritized feature requests", len(requests))
+            return list(requests)
+        except SQLAlchemyError as e:
+            logger.error("Database error fetching prioritized feature requests: %s", e, exc_info=True)
+            raise DatabaseError(f"Failed to fetch feature requests", details={"error": str(e)})
+
 
 # Create singleton instance
 feature_request_crud = FeatureRequestCRUD(FeatureRequest)
@@ -3,18 +3,89 @@ User CRUD operations with authentication methods.
 Implements abstract BaseCRUD with user-specific functionality.
 """
 import logging
-from typing import Optional
+from typing import NamedTuple, Optional
+import orjson
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from app.crud.base_crud import BaseCRUD
-from app.models.user import User
+from app.models.user import User, UserRole
 from app.schemas.user_dto import UserCreate, UserBase
-from app.core.security import get_password_hash, verify_password
+from app.core.security import aget_password_hash, averify_password
 from app.core.exceptions import DatabaseError, ValidationError
+from app.core.cache import cache_get, cache_set, cache_delete
 
 logger = logging.getLogger(__name__)
 
+# Short-lived identity cache for the per-request current-user lookup. Every
+# write through UserCRUD drops the entry; writes made outside it (raw SQL,
+# scripts, other services) are seen once the entry expires, so a deactivated
+# or demoted user keeps access for at most this many seconds unless the
+# writer calls user_crud.invalidate_cached().
+USER_CACHE_EXPIRE = 60
+# Remember emails with no account so repeated bad logins skip the database
+MISSING_EMAIL_CACHE_EXPIRE = 30
+
+
+class UserIdentity(NamedTuple):
+    """Read-only view of the user columns needed for authentication and authorization."""
+    id: int
+    email: str
+    username: str
+    role: UserRole
+    is_active: int
+
+
+def _user_cache_key(user_id: int) -> str:
+    """Build the cache key for a user id."""
+    return f"user:id:{user_id}"
+
+
+def _missing_email_key(email: str) -> str:
+    """Build the negative-cache key for an email with no account."""
+    return f"auth:missemail:{email}"
+
+
+def _mask_email(email: str) -> str:
+    """Hide the local part of an email for failed-login logs ("j***@example.com")."""
+    local, _, domain = email.partition("@")
+    return f"{local[:1]}***@{domain}"
+
+
+def _unique_violation(error: IntegrityError) -> Optional[str]:
+    """
+    Name the unique index an IntegrityError violated.
+
+    asyncpg reports the constraint name on the driver error; SQLite only
+    names the column ("UNIQUE constraint failed: users.email"), which is
+    mapped to the matching ix_<table>_<column> index name.
+    """
+    constraint = getattr(error.orig.__cause__, "constraint_name", None)
+    if constraint:
+        return constraint
+
+    message = str(error.orig)
+    prefix = "UNIQUE constraint failed: "
+    if message.startswith(prefix):
+        return "ix_" + message[len(prefix):].replace(".", "_")
+    return None
+
+
+def _identity(user: User) -> UserIdentity:
+    """Project a user row onto its identity fields."""
+    return UserIdentity(user.id, user.email, user.username, user.role, user.is_active)
+
+
+def _dump_identity(identity: UserIdentity) -> bytes:
+    """Serialize an identity for the cache."""
+    return orjson.dumps(tuple(identity))
+
+
+def _load_identity(data: bytes) -> UserIdentity:
+    """Rebuild an identity from its cached form."""
+    user_id, email, username, role, is_active = orjson.loads(data)
+    return UserIdentity(user_id, email, username, UserRole(role), is_active)
+
 
 class UserCRUD(BaseCRUD[User, UserCreate, UserBase]):
     """
@@ -22,6 +93,59 @@ class UserCRUD(BaseCRUD[User, UserCreate, UserBase]):
     Extends BaseCRUD with user-specific operations.
     """
 
+    async def get_cached(self, db: AsyncSession, id: int) -> Optional[UserIdentity]:
+        """
+        Get a user's identity by ID through the Redis identity cache.
+
+        Returns a read-only UserIdentity rather than an ORM instance, so it can
+        never be added to a session; use get() when the row is needed. Role and
+        active status may lag an out-of-band write by up to USER_CACHE_EXPIRE.
+
+        Args:
+            db: Database session
+            id: User ID
+
+        Returns:
+            UserIdentity or None
+
+        Raises:
+            DatabaseError: If database operation fails
+        """
+        cached = await cache_get(_user_cache_key(id))
+        if cached is not None:
+            return _load_identity(cached)
+
+        user = await self.get(db, id)
+        if user is None:
+            return None
+
+        identity = _identity(user)
+        await cache_set(_user_cache_key(id), _dump_identity(identity), USER_CACHE_EXPIRE)
+        return identity
+
+    async def invalidate_cached(self, id: int) -> None:
+        """
+        Drop a user's cached identity.
+
+        Call after changing a user's role or active status outside UserCRUD.
+
+        Args:
+            id: User ID
+        """
+        await cache_delete(_user_cache_key(id))
+
+    async def update(self, db: AsyncSession, id: int, obj_in: UserBase) -> Optional[User]:
+        """Update a user and drop its cached identity."""
+        user = await super().update(db, id, obj_in)
+        await self.invalidate_cached(id)
+        return user
+
+    async def delete(self, db: AsyncSession, id: int) -> bool:
+        """Delete a user and drop its cached identity."""
+        deleted = await super().delete(db, id)
+        await self.invalidate_cached(id)
+        return deleted
+
     async def get_by_email(self, db: AsyncSession, email: str) -> Optional[User]:
         """
         Get user by email address.
@@ -38,7 +162,7 @@ class UserCRUD(BaseCRUD[User, UserCreate, UserBase]):
         """
         try:
             logger.debug(f"Fetching user by email: {email}")
-            result = await db.execute(select(User).where(User.email == email))
+            result = await self._read(db, select(User).where(User.email == email))
             user = result.scalar_one_or_none()
 
             if user:
@@ -67,7 +191,7 @@ class UserCRUD(BaseCRUD[User, UserCreate, UserBase]):
         """
         try:
             logger.debug(f"Fetching user by username: {username}")
-            result = await db.execute(select(User).where(User.username == username))
+            result = await self._read(db, select(User).where(User.username == username))
             user = result.scalar_one_or_none()
 
             if user:
@@ -84,6 +208,9 @@ class UserCRUD(BaseCRUD[User, UserCreate, UserBase]):
         """
         Create new user with hashed password.
 
+        Uniqueness is enforced by the email/username UNIQUE constraints, so no
+        pre-check query is issued; a violation is reported as a ValidationError.
+
         Args:
             db: Database session
             obj_in: User creation schema
@@ -96,36 +223,37 @@ class UserCRUD(BaseCRUD[User, UserCreate, UserBase]):
             DatabaseError: If database operation fails
         """
         try:
-            logger.info(f"Creating new user with email: {obj_in.email}")
-
-            # Check if email already exists
-            existing_user = await self.get_by_email(db, obj_in.email)
-            if existing_user:
-                logger.warning(f"Attempt to create user with existing email: {obj_in.email}")
-                raise ValidationError("Email already registered")
-
-            # Check if username already exists
-            existing_user = await self.get_by_username(db, obj_in.username)
-            if existing_user:
-                logger.warning(f"Attempt to create user with existing username: {obj_in.username}")
-                raise ValidationError("Username already taken")
+            logger.info("Creating new user with email: %s", obj_in.email)
 
             # Create user with hashed password
             obj_data = obj_in.model_dump()
-            obj_data["hashed_password"] = get_password_hash(obj_data.pop("password"))
+            obj_data["hashed_password"] = await aget_password_hash(obj_data.pop("password"))
 
             db_obj = User(**obj_data)
             db.add(db_obj)
             await db.commit()
             await db.refresh(db_obj)
 
-            logger.info(f"User created successfully: id={db_obj.id}, email={db_obj.email}")
+            await cache_delete(_missing_email_key(db_obj.email))
+
+            logger.info("User created successfully: id=%s, email=%s", db_obj.id, db_obj.email)
             return db_obj
-        except ValidationError:
-            raise
+        except IntegrityError as e:
+            await db.rollback()
+            # Match on the index name: the error text also carries the
+            # duplicate value, which may itself contain "email"
+            constraint = _unique_violation(e)
+            if constraint == "ix_users_email":
+                logger.warning("Attempt to create user with existing email: %s", obj_in.email)
+                raise ValidationError("Email already registered")
+            if constraint == "ix_users_username":
+                logger.warning("Attempt to create user with existing username: %s", obj_in.username)
+                raise ValidationError("Username already taken")
+            logger.error("Integrity error creating user: %s", e, exc_info=True)
+            raise DatabaseError("Failed to create user", details={"error": str(e)})
         except SQLAlchemyError as e:
             await db.rollback()
-            logger.error(f"Database error creating user: {str(e)}", exc_info=True)
+            logger.error("Database error creating user: %s", e, exc_info=True)
             raise DatabaseError(f"Failed to create user", details={"error": str(e)})
 
     async def authenticate(
@@ -146,21 +274,27 @@ class UserCRUD(BaseCRUD[User, UserCreate, UserBase]):
             User instance if authenticated, None otherwise
         """
         try:
-            logger.info(f"Authenticating user: {email}")
+            logger.info("Authenticating user: %s", email)
+            missing_key = _missing_email_key(email)
+            if await cache_get(missing_key):
+                logger.warning("Authentication failed: user not found (cached) - %s", _mask_email(email))
+                return None
+
             user = await self.get_by_email(db, email)
 
             if not user:
-                logger.warning(f"Authentication failed: user not found - {email}")
+                logger.warning("Authentication failed: user not found - %s", _mask_email(email))
+                await cache_set(missing_key, b"1", MISSING_EMAIL_CACHE_EXPIRE)
                 return None
 
-            if not verify_password(password, user.hashed_password):
-                logger.warning(f"Authentication failed: invalid password for {email}")
+            if not await averify_password(password, user.hashed_password):
+                logger.warning("Authentication failed: invalid password for %s", _mask_email(email))
                 return None
 
-            logger.info(f"User authenticated successfully: {email}")
+            logger.info("User authenticated successfully: %s", email)
             return user
         except Exception as e:
-            logger.error(f"Error during authentication for {email}: {str(e)}", exc_info=True)
+            logger.error("Error during authentication for %s: %s", _mask_email(email), e, exc_info=True)
             return None
 
     async def is_active(self, user: User) -> bool:
@@ -2,8 +2,12 @@
 Async database connection and session management.
 Implements connection pooling and health checks.
 """
+import asyncio
+import enum
 import logging
-from typing import AsyncGenerator
+from functools import lru_cache
+from typing import AsyncGenerator, Optional, Type
+import asyncpg
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     create_async_engine,
@@ -11,8 +15,9 @@ from sqlalchemy.ext.asyncio import (
     AsyncEngine
 )
 from sqlalchemy.orm import declarative_base
-from sqlalchemy.pool import NullPool, QueuePool
-from sqlalchemy import text
+from sqlalchemy.pool import NullPool, AsyncAdaptedQueuePool
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy.engine import make_url
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -20,9 +25,38 @@ logger = logging.getLogger(__name__)
 # Base class for ORM models
 Base = declarative_base()
 
+
+def string_enum(enum_class: Type[enum.Enum], name: str) -> SQLEnum:
+    """
+    Column type for a Python enum stored as a short VARCHAR.
+
+    Stores member values ('pending', not 'PENDING') guarded by a CHECK
+    constraint instead of a native PostgreSQL ENUM type, so adding a member
+    needs no ALTER TYPE.
+
+    Args:
+        enum_class: Python enum class
+        name: Name of the CHECK constraint
+
+    Returns:
+        SQLAlchemy Enum type
+    """
+    return SQLEnum(
+        enum_class,
+        name=name,
+        native_enum=False,
+        create_constraint=True,
+        length=16,
+        values_callable=lambda members: [member.value for member in members]
+    )
+
 # Global engine instance
 engine: AsyncEngine = None
 
+# Dedicated connection for health probes, kept outside the pool
+_health_conn: Optional[asyncpg.Connection] = None
+_health_lock = asyncio.Lock()
+
 
 def get_engine() -> AsyncEngine:
     """
@@ -35,35 +69,63 @@ def get_engine() -> AsyncEngine:
 
     if engine is None:
         try:
-            logger.info(f"Creating database engine for: {settings.DATABASE_URL.split('@')[1]}")
+            logger.info("Creating database engine for: %s", settings.DATABASE_URL.split('@')[1])
 
-            # Use QueuePool for production, NullPool for testing
-            poolclass = NullPool if settings.ENVIRONMENT == "testing" else QueuePool
+            # Async engines need the asyncio-aware queue pool; NullPool for testing,
+            # which rejects the queue sizing arguments
+            testing = settings.ENVIRONMENT == "testing"
+            if testing:
+                pool_args = {"poolclass": NullPool}
+            else:
+                pool_args = {
+                    "poolclass": AsyncAdaptedQueuePool,
+                    "pool_size": settings.DATABASE_POOL_SIZE,
+                    "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+                    "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+                    # LIFO keeps a small set of recently used connections warm
+                    "pool_use_lifo": settings.DATABASE_POOL_USE_LIFO
+                }
 
             engine = create_async_engine(
                 settings.DATABASE_URL,
                 echo=settings.DEBUG,
                 future=True,
-                pool_pre_ping=True,  # Verify connections before using
-                pool_size=settings.DATABASE_POOL_SIZE,
-                max_overflow=settings.DATABASE_MAX_OVERFLOW,
-                poolclass=poolclass,
+                # Pinging costs a round trip per checkout; pool_recycle plus the CRUD
+                # read retry cover stale connections instead
+                pool_pre_ping=settings.DATABASE_POOL_PRE_PING or testing,
+                pool_recycle=settings.DATABASE_POOL_RECYCLE,
+                **pool_args,
+                # SQLAlchemy's engine-wide LRU of compiled SQL, shared by all sessions
+                query_cache_size=settings.DATABASE_QUERY_CACHE_SIZE,
                 connect_args={
-                    "server_settings": {"application_name": settings.APP_NAME}
+                    # Sent in asyncpg's startup packet, so these cost no extra round trip
+                    "server_settings": {
+                        "application_name": settings.APP_NAME,
+                        "timezone": "UTC",
+                        "jit": "off",
+                        "statement_timeout": str(settings.DATABASE_STATEMENT_TIMEOUT_MS)
+                    },
+                    # asyncpg's and SQLAlchemy's prepared statement caches (per connection)
+                    "statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE,
+                    "prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE
                 }
             )
             logger.info("Database engine created successfully")
         except Exception as e:
-            logger.error(f"Failed to create database engine: {str(e)}", exc_info=True)
+            logger.error("Failed to create database engine: %s", e, exc_info=True)
             raise
 
     return engine
 
 
 # Create async session factory
+@lru_cache(maxsize=1)
 def get_session_factory() -> async_sessionmaker:
     """
-    Create async session factory.
+    Create async session factory on first use.
+
+    Built lazily so each worker creates its engine after forking instead
+    of inheriting one created at import time.
 
     Returns:
         Configured async_sessionmaker
@@ -77,9 +139,6 @@ def get_session_factory() -> async_sessionmaker:
     )
 
 
-AsyncSessionLocal = get_session_factory()
-
-
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency to get database session with automatic cleanup.
@@ -92,12 +151,12 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         async def get_users(db: AsyncSession = Depends(get_db)):
             ...
     """
-    async with AsyncSessionLocal() as session:
+    async with get_session_factory()() as session:
         try:
             logger.debug("Database session created")
             yield session
         except Exception as e:
-            logger.error(f"Database session error: {str(e)}", exc_info=True)
+            logger.error("Database session error: %s", e, exc_info=True)
             await session.rollback()
             raise
         finally:
@@ -109,6 +168,9 @@ async def init_db() -> None:
     """
     Initialize database tables.
     Creates all tables defined in Base metadata.
+
+    Runs on a single connection checkout, so a successful call also proves
+    the database is reachable.
     """
     try:
         logger.info("Initializing database tables...")
@@ -116,33 +178,81 @@ async def init_db() -> None:
             await conn.run_sync(Base.metadata.create_all)
         logger.info("Database tables created successfully")
     except Exception as e:
-        logger.error(f"Failed to initialize database: {str(e)}", exc_info=True)
+        logger.error("Failed to initialize database: %s", e, exc_info=True)
         raise
 
 
-async def check_db_connection() -> bool:
+async def check_db_connection_lite() -> bool:
     """
-    Check database connectivity.
+    Check database connectivity without borrowing a pooled connection.
+
+    Health probes run every few seconds; pinging over a dedicated asyncpg
+    connection keeps them from taking a pool slot or reordering the LIFO
+    pool. The connection is reopened after a failure.
 
     Returns:
         True if database is accessible
     """
-    try:
-        async with AsyncSessionLocal() as session:
-            await session.execute(text("SELECT 1"))
-            logger.info("Database connection successful")
+    global _health_conn
+
+    async with _health_lock:
+        try:
+            if _health_conn is None or _health_conn.is_closed():
+                dsn = make_url(settings.DATABASE_URL).set(drivername="postgresql")
+                _health_conn = await asyncpg.connect(
+                    dsn.render_as_string(hide_password=False),
+                    timeout=settings.DATABASE_POOL_TIMEOUT
+                )
+            await _health_conn.fetchval("SELECT 1", timeout=settings.DATABASE_POOL_TIMEOUT)
             return True
-    except Exception as e:
-        logger.error(f"Database connection failed: {str(e)}", exc_info=True)
-        return False
+        except Exception as e:
+            logger.error("Database health check failed: %s", e)
+            if _health_conn is not None:
+                _health_conn.terminate()
+                _health_conn = None
+            return False
+
+
+async def warm_db_pool() -> int:
+    """
+    Pre-create pooled connections so the first requests skip connection setup.
+
+    Opens DATABASE_POOL_SIZE connections concurrently and returns them to the
+    pool. Failures are logged and do not block startup.
+
+    Returns:
+        Number of connections opened
+    """
+    db_engine = get_engine()
+    if isinstance(db_engine.pool, NullPool):
+        return 0
+
+    results = await asyncio.gather(
+        *(db_engine.connect().start() for _ in range(settings.DATABASE_POOL_SIZE)),
+        return_exceptions=True
+    )
+
+    opened = 0
+    for result in results:
+        if isinstance(result, BaseException):
+            logger.warning("Failed to pre-create database connection: %s", result)
+            continue
+        await result.close()
+        opened += 1
+
+    logger.info("Database pool warmed with %s connections", opened)
+    return opened
 
 
 async def close_db_connection() -> None:
     """Close database engine and connections."""
-    global engine
+    global engine, _health_conn
+    if _health_conn is not None:
+        await _health_conn.close()
+        _health_conn = None
     if engine:
         try:
             await engine.dispose()
             logger.info("Database connections closed")
         except Exception as e:
-            logger.error(f"Error closing database connections: {str(e)}", exc_info=True)
+            logger.error("Error closing database connections: %s", e, exc_info=True)
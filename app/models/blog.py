@@ -1,9 +1,10 @@
 """Blog model with approval workflow."""
 import enum
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum as SQLEnum, ForeignKey, Index
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, JSON, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from app.database import Base
+from app.database import Base, string_enum
 
 
 class BlogStatus(str, enum.Enum):
@@ -34,8 +35,8 @@ class Blog(Base):
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False)
     content = Column(Text, nullable=False)
-    images = Column(Text, nullable=True)  # JSON string
-    status = Column(SQLEnum(BlogStatus), default=BlogStatus.PENDING, nullable=False, index=True)
+    images = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)  # List of image URLs
+    status = Column(string_enum(BlogStatus, 'ck_blogs_status'), default=BlogStatus.PENDING, nullable=False, index=True)
     author_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     approved_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -44,13 +45,27 @@ class Blog(Base):
 
     # Relationships
     author = relationship("User", back_populates="blogs", foreign_keys=[author_id])
-    approver = relationship("User", foreign_keys=[approved_by])
-    comments = relationship("Comment", back_populates="blog", cascade="all, delete-orphan")
+    approver = relationship("User", back_populates="approved_blogs", foreign_keys=[approved_by])
+    comments = relationship("Comment", back_populates="blog", cascade="all, delete-orphan", passive_deletes=True)
 
     # Indexes for performance
     __table_args__ = (
-        Index('idx_blog_status_created', 'status', 'created_at'),
+        # Listing indexes mirror each query's filter and ORDER BY (including
+        # the id tiebreaker) so pages come from an index range scan, not a sort
+        Index('idx_blog_author_created', author_id, created_at.desc(), id.desc()),
         Index('idx_blog_author_status', 'author_id', 'status'),
+        # Public listing and review queue: partial indexes hold only their
+        # status's rows, already in listing order, and also serve counts.
+        Index(
+            'idx_blog_approved_listing',
+            approved_at.desc(), id.desc(),
+            postgresql_where=text("status = 'approved'")
+        ),
+        Index(
+            'idx_blog_pending_listing',
+            created_at.desc(), id.desc(),
+            postgresql_where=text("status = 'pending'")
+        ),
     )
 
     def __repr__(self):
@@ -21,7 +21,7 @@ class Comment(Base):
     id = Column(Integer, primary_key=True, index=True)
     content = Column(Text, nullable=False)
     blog_id = Column(Integer, ForeignKey("blogs.id", ondelete="CASCADE"), nullable=False, index=True)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
@@ -30,7 +30,9 @@ class Comment(Base):
 
     # Indexes
     __table_args__ = (
-        Index('idx_comment_blog_created', 'blog_id', 'created_at'),
+        Index('idx_comment_blog_created', blog_id, created_at, id),
+        # A user's recent comments; also serves user_id lookups and the FK cascade
+        Index('idx_comment_user_created', user_id, created_at.desc(), id.desc()),
     )
 
     def __repr__(self):
@@ -1,9 +1,9 @@
 """Feature request model."""
 import enum
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum as SQLEnum, ForeignKey, Index
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from app.database import Base
+from app.database import Base, string_enum
 
 
 class FeatureRequestStatus(str, enum.Enum):
@@ -32,9 +32,9 @@ class FeatureRequest(Base):
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=False)
-    status = Column(SQLEnum(FeatureRequestStatus), default=FeatureRequestStatus.PENDING, nullable=False, index=True)
+    status = Column(string_enum(FeatureRequestStatus, 'ck_feature_requests_status'), default=FeatureRequestStatus.PENDING, nullable=False)
     priority = Column(Integer, default=0, nullable=False)
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
@@ -43,7 +43,14 @@ class FeatureRequest(Base):
 
     # Indexes
     __table_args__ = (
-        Index('idx_feature_request_status_priority', 'status', 'priority'),
+        # Listing indexes mirror each query's filter and ORDER BY; their leading
+        # status/user_id columns also serve plain lookups on those columns
+        Index(
+            'idx_feature_request_status_priority',
+            status, priority.desc(), created_at.desc(), id.desc()
+        ),
+        Index('idx_feature_request_priority', priority.desc(), created_at.desc(), id.desc()),
+        Index('idx_feature_request_user_created', user_id, created_at.desc(), id.desc()),
     )
 
     def __repr__(self):
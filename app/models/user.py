@@ -1,9 +1,9 @@
 """User model with role-based access control."""
 import enum
-from sqlalchemy import Column, Integer, String, DateTime, Enum as SQLEnum, Text
+from sqlalchemy import Column, Integer, String, DateTime, Text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from app.database import Base
+from app.database import Base, string_enum
 
 
 class UserRole(str, enum.Enum):
@@ -33,16 +33,25 @@ class User(Base):
     email = Column(String(255), unique=True, index=True, nullable=False)
     username = Column(String(100), unique=True, index=True, nullable=False)
     hashed_password = Column(String(255), nullable=False)
-    role = Column(SQLEnum(UserRole), default=UserRole.USER, nullable=False)
+    role = Column(string_enum(UserRole, 'ck_users_role'), default=UserRole.USER, nullable=False)
     is_active = Column(Integer, default=1, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     # Relationships
-    blogs = relationship("Blog", back_populates="author", foreign_keys="Blog.author_id", cascade="all, delete-orphan")
-    approved_blogs = relationship("Blog", foreign_keys="Blog.approved_by")
-    feature_requests = relationship("FeatureRequest", back_populates="user", cascade="all, delete-orphan")
-    comments = relationship("Comment", back_populates="user", cascade="all, delete-orphan")
+    # passive_deletes: unloaded children are left to the ON DELETE foreign keys
+    # instead of being SELECTed into the session before the parent is deleted
+    blogs = relationship(
+        "Blog", back_populates="author", foreign_keys="Blog.author_id",
+        cascade="all, delete-orphan", passive_deletes=True
+    )
+    approved_blogs = relationship(
+        "Blog", back_populates="approver", foreign_keys="Blog.approved_by", passive_deletes=True
+    )
+    feature_requests = relationship(
+        "FeatureRequest", back_populates="user", cascade="all, delete-orphan", passive_deletes=True
+    )
+    comments = relationship("Comment", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self):
         return f"<User(id={self.id}, email={self.email}, role={self.role})>"
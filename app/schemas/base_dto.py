@@ -0,0 +1,109 @@
+"""Shared helpers for Data Transfer Objects."""
+from typing import Any, Callable, Dict, Iterable, Type, TypeVar
+import orjson
+from pydantic import BaseModel
+
+ResponseType = TypeVar("ResponseType", bound=BaseModel)
+
+# UTC datetimes end in "Z", matching pydantic's JSON output
+_ORJSON_OPTIONS = orjson.OPT_UTC_Z
+
+# Generated per-schema projection functions, keyed by schema class
+_projectors: Dict[type, Callable[[Any], Dict[str, Any]]] = {}
+
+
+def _make_projector(fields: Iterable[str]) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Generate a function that copies the given attributes into a dict.
+
+    The generated body is a single dict literal (``{"id": obj.id, ...}``),
+    which avoids the per-field loop and getattr calls of a generic comprehension.
+
+    Args:
+        fields: Attribute names (pydantic field names, so valid identifiers)
+
+    Returns:
+        Projection function
+    """
+    items = ", ".join(f"{name!r}: obj.{name}" for name in fields)
+    namespace: Dict[str, Any] = {}
+    exec(f"def project(obj):\n    return {{{items}}}", namespace)
+    return namespace["project"]
+
+
+def _get_projector(schema: type) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Get the cached projection function for a response schema, generating it on first use.
+
+    Args:
+        schema: Pydantic model class
+
+    Returns:
+        Projection function for the schema's fields
+    """
+    project = _projectors.get(schema)
+    if project is None:
+        project = _projectors[schema] = _make_projector(schema.model_fields)
+    return project
+
+
+class TrustedResponseMixin:
+    """
+    Mixin for response schemas built from database rows.
+
+    Values loaded from the database already satisfy the schema, so these
+    helpers copy them without running field validation.
+    """
+
+    @classmethod
+    def build(cls: Type[ResponseType], obj: Any) -> ResponseType:
+        """
+        Build the response from an ORM instance or row without validation.
+
+        Args:
+            obj: Object exposing every schema field as an attribute
+
+        Returns:
+            Response instance
+        """
+        return cls.model_construct(**cls.to_dict(obj))
+
+    @classmethod
+    def to_dict(cls, obj: Any) -> Dict[str, Any]:
+        """
+        Project an ORM instance or row onto the schema's fields as a plain dict.
+
+        Args:
+            obj: Object exposing every schema field as an attribute
+
+        Returns:
+            Field name to value mapping
+        """
+        return _get_projector(cls)(obj)
+
+    @classmethod
+    def encode(cls, obj: Any) -> bytes:
+        """
+        Serialize one object to JSON without building a pydantic model.
+
+        Args:
+            obj: Object exposing every schema field as an attribute
+
+        Returns:
+            JSON bytes
+        """
+        return orjson.dumps(cls.to_dict(obj), option=_ORJSON_OPTIONS)
+
+    @classmethod
+    def encode_many(cls, objs: Iterable[Any]) -> bytes:
+        """
+        Serialize a list of objects to a JSON array without building pydantic models.
+
+        Args:
+            objs: Objects exposing every schema field as an attribute
+
+        Returns:
+            JSON bytes
+        """
+        project = _get_projector(cls)
+        return orjson.dumps([project(obj) for obj in objs], option=_ORJSON_OPTIONS)
@@ -3,8 +3,11 @@ from pydantic import BaseModel, Field, ConfigDict, field_validator
 from datetime import datetime
 from typing import Optional, List
 from app.models.blog import BlogStatus
+from app.schemas.base_dto import TrustedResponseMixin
 import json
 
+_IMAGE_URL_PREFIXES = ('http://', 'https://')
+
 
 class BlogBase(BaseModel):
     """Base blog schema."""
@@ -18,7 +21,7 @@ class BlogBase(BaseModel):
         """Validate image URLs."""
         if v:
             for url in v:
-                if not url.startswith(('http://', 'https://')):
+                if not url.startswith(_IMAGE_URL_PREFIXES):
                     raise ValueError(f'Invalid image URL: {url}')
         return v
 
@@ -35,7 +38,7 @@ class BlogUpdate(BaseModel):
     images: Optional[List[str]] = None
 
 
-class BlogResponse(BlogBase):
+class BlogResponse(BlogBase, TrustedResponseMixin):
     """Schema for blog response."""
     id: int
     status: BlogStatus
@@ -59,3 +62,13 @@ class BlogListResponse(BaseModel):
 class BlogApprovalRequest(BaseModel):
     """Schema for blog approval/rejection."""
     reason: Optional[str] = Field(None, max_length=500)
+
+
+class BlogBulkReviewRequest(BaseModel):
+    """Schema for approving/rejecting several blogs at once."""
+    blog_ids: List[int] = Field(..., min_length=1, max_length=100)
+
+
+class BlogBulkReviewResponse(BaseModel):
+    """Schema for a bulk approval/rejection result."""
+    updated_ids: List[int]
@@ -2,6 +2,7 @@
 from pydantic import BaseModel, Field, ConfigDict
 from datetime import datetime
 from typing import List
+from app.schemas.base_dto import TrustedResponseMixin
 
 
 class CommentBase(BaseModel):
@@ -14,7 +15,7 @@ class CommentCreate(CommentBase):
     blog_id: int
 
 
-class CommentResponse(CommentBase):
+class CommentResponse(CommentBase, TrustedResponseMixin):
     """Schema for comment response."""
     id: int
     blog_id: int
@@ -3,6 +3,7 @@ from pydantic import BaseModel, Field, ConfigDict
 from datetime import datetime
 from typing import Optional, List
 from app.models.feature_request import FeatureRequestStatus
+from app.schemas.base_dto import TrustedResponseMixin
 
 
 class FeatureRequestBase(BaseModel):
@@ -24,7 +25,7 @@ class FeatureRequestUpdate(BaseModel):
     description: Optional[str] = Field(None, min_length=10)
 
 
-class FeatureRequestResponse(FeatureRequestBase):
+class FeatureRequestResponse(FeatureRequestBase, TrustedResponseMixin):
     """Schema for feature request response."""
     id: int
     status: FeatureRequestStatus
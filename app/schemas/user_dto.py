@@ -1,8 +1,15 @@
 """User Data Transfer Objects."""
+import re
 from pydantic import BaseModel, EmailStr, Field, ConfigDict, field_validator
 from datetime import datetime
 from typing import Optional
 from app.models.user import UserRole
+from app.schemas.base_dto import TrustedResponseMixin
+
+# Letters, digits and underscores, with at least one letter or digit
+_USERNAME_MATCH = re.compile(r"(?=\w*[^\W_])\w+").fullmatch
+# Fast check for a password with a digit, an uppercase and a lowercase letter
+_STRONG_PASSWORD_MATCH = re.compile(r"(?=.*\d)(?=.*[A-Z])(?=.*[a-z])", re.DOTALL).match
 
 
 class UserBase(BaseModel):
@@ -14,7 +21,7 @@ class UserBase(BaseModel):
     @classmethod
     def validate_username(cls, v: str) -> str:
         """Validate username contains only alphanumeric and underscore."""
-        if not v.replace('_', '').isalnum():
+        if not _USERNAME_MATCH(v):
             raise ValueError('Username must contain only letters, numbers, and underscores')
         return v
 
@@ -28,6 +35,9 @@ class UserCreate(UserBase):
     @classmethod
     def validate_password(cls, v: str) -> str:
         """Validate password strength."""
+        if _STRONG_PASSWORD_MATCH(v):
+            return v
+        # Slow path only to report which rule failed
         if not any(char.isdigit() for char in v):
             raise ValueError('Password must contain at least one digit')
         if not any(char.isupper() for char in v):
@@ -43,7 +53,7 @@ class UserLogin(BaseModel):
     password: str
 
 
-class UserResponse(UserBase):
+class UserResponse(UserBase, TrustedResponseMixin):
     """Schema for user response."""
     id: int
     role: UserRole
@@ -54,7 +64,7 @@ class UserResponse(UserBase):
     model_config = ConfigDict(from_attributes=True)
 
 
-class TokenResponse(BaseModel):
+class TokenResponse(BaseModel, TrustedResponseMixin):
     """Schema for JWT token response."""
     access_token: str
     refresh_token: str
@@ -31,7 +31,7 @@ class BaseService(ABC, Generic[CRUDType]):
         """
         self.crud = crud
         self.service_name = self.__class__.__name__
-        logger.info(f"Initialized {self.service_name}")
+        logger.info("Initialized %s", self.service_name)
 
     @abstractmethod
     async def validate_create(self, db: AsyncSession, obj_in: any) -> bool:
@@ -86,5 +86,5 @@ class BaseService(ABC, Generic[CRUDType]):
         Raises:
             ValidationError: If validation fails
         """
-        logger.debug(f"{self.service_name}: Validating delete for id={id}")
+        logger.debug("%s: Validating delete for id=%s", self.service_name, id)
         return True
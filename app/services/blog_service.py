@@ -8,13 +8,19 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.services.base_service import BaseService
 from app.crud.blog_crud import blog_crud, BlogCRUD
 from app.schemas.blog_dto import BlogCreate, BlogUpdate, BlogResponse
-from app.core.exceptions import ValidationError, AuthorizationError, NotFoundError
-from app.models.blog import BlogStatus
+from app.core.exceptions import ValidationError, AuthorizationError, NotFoundError, ConflictError
+from app.models.blog import Blog, BlogStatus
 from app.models.user import UserRole
 
 logger = logging.getLogger(__name__)
 
 
+class BlogCreateExtended(BlogCreate):
+    """Blog creation schema with the server-assigned author and status."""
+    author_id: int
+    status: BlogStatus = BlogStatus.PENDING
+
+
 class BlogService(BaseService[BlogCRUD]):
     """
     Blog service handling article lifecycle and approval workflow.
@@ -40,17 +46,17 @@ class BlogService(BaseService[BlogCRUD]):
         Raises:
             ValidationError: If validation fails
         """
-        logger.debug(f"Validating blog creation: {obj_in.title}")
+        logger.debug("Validating blog creation: %s", obj_in.title)
 
         if len(obj_in.title) < 5:
-            logger.warning(f"Validation failed: Title too short - {obj_in.title}")
+            logger.warning("Validation failed: Title too short - %s", obj_in.title)
             raise ValidationError("Title must be at least 5 characters")
 
         if len(obj_in.content) < 10:
-            logger.warning(f"Validation failed: Content too short")
+            logger.warning("Validation failed: Content too short")
             raise ValidationError("Content must be at least 10 characters")
 
-        logger.debug(f"Blog creation validation passed: {obj_in.title}")
+        logger.debug("Blog creation validation passed: %s", obj_in.title)
         return True
 
     async def validate_update(self, db: AsyncSession, id: int, obj_in: BlogUpdate) -> bool:
@@ -67,21 +73,22 @@ class BlogService(BaseService[BlogCRUD]):
             True if valid
 
         Raises:
-            ValidationError: If validation fails
+            NotFoundError: If blog does not exist
+            AuthorizationError: If blog is no longer editable
         """
-        logger.debug(f"Validating blog update for id={id}")
+        logger.debug("Validating blog update for id=%s", id)
 
         blog = await self.crud.get(db, id)
         if not blog:
-            logger.warning(f"Validation failed: Blog not found - id={id}")
+            logger.warning("Validation failed: Blog not found - id=%s", id)
             raise NotFoundError("Blog not found")
 
         # Only pending blogs can be edited
         if blog.status != BlogStatus.PENDING:
-            logger.warning(f"Validation failed: Blog not in pending status - id={id}, status={blog.status}")
-            raise ValidationError("Only pending blogs can be edited")
+            logger.warning("Validation failed: Blog not in pending status - id=%s, status=%s", id, blog.status)
+            raise AuthorizationError("Only pending blogs can be edited")
 
-        logger.debug(f"Blog update validation passed for id={id}")
+        logger.debug("Blog update validation passed for id=%s", id)
         return True
 
     async def create_blog(
@@ -104,40 +111,34 @@ class BlogService(BaseService[BlogCRUD]):
         Raises:
             ValidationError: If validation fails
         """
-        logger.info(f"Creating blog by author_id={author_id}: {blog_in.title}")
+        logger.info("Creating blog by author_id=%s: %s", author_id, blog_in.title)
 
         try:
             await self.validate_create(db, blog_in)
 
             # Create blog data with author_id
-            from pydantic import create_model
-            BlogCreateExtended = create_model(
-                'BlogCreateExtended',
-                author_id=(int, ...),
-                status=(BlogStatus, BlogStatus.PENDING),
-                __base__=BlogCreate
-            )
-
             blog_data = blog_in.model_dump()
             blog_data["author_id"] = author_id
             blog_data["status"] = BlogStatus.PENDING
 
-            blog_extended = BlogCreateExtended(**blog_data)
+            # blog_in is already validated; skip a second validation pass
+            blog_extended = BlogCreateExtended.model_construct(**blog_data)
             blog = await self.crud.create(db, blog_extended)
 
-            logger.info(f"Blog created successfully: id={blog.id}, title={blog.title}")
+            logger.info("Blog created successfully: id=%s, title=%s", blog.id, blog.title)
             return blog
         except ValidationError:
             raise
         except Exception as e:
-            logger.error(f"Error creating blog: {str(e)}", exc_info=True)
+            logger.error("Error creating blog: %s", e, exc_info=True)
             raise ValidationError(f"Failed to create blog: {str(e)}")
 
     async def get_public_blogs(
         self,
         db: AsyncSession,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[int] = None
     ) -> List:
         """
         Get all approved (public) blogs.
@@ -146,26 +147,42 @@ class BlogService(BaseService[BlogCRUD]):
             db: Database session
             skip: Pagination offset
             limit: Maximum results
+            cursor: Id of the last blog from the previous page
 
         Returns:
             List of approved blogs
         """
-        logger.debug(f"Fetching public blogs: skip={skip}, limit={limit}")
+        logger.debug("Fetching public blogs: skip=%s, limit=%s", skip, limit)
 
         try:
-            blogs = await self.crud.get_approved_blogs(db, skip, limit)
-            logger.debug(f"Retrieved {len(blogs)} public blogs")
+            blogs = await self.crud.get_approved_blogs(db, skip, limit, cursor)
+            logger.debug("Retrieved %s public blogs", len(blogs))
             return blogs
         except Exception as e:
-            logger.error(f"Error fetching public blogs: {str(e)}", exc_info=True)
+            logger.error("Error fetching public blogs: %s", e, exc_info=True)
             raise
 
+    async def get_public_blog(self, db: AsyncSession, blog_id: int) -> Optional[Blog]:
+        """
+        Get a single approved blog.
+
+        Args:
+            db: Database session
+            blog_id: Blog ID
+
+        Returns:
+            Approved blog, or None if it does not exist or is not approved
+        """
+        logger.debug("Fetching public blog id=%s", blog_id)
+        return await self.crud.get_public(db, blog_id)
+
     async def get_user_blogs(
         self,
         db: AsyncSession,
         user_id: int,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[int] = None
     ) -> List:
         """
         Get all blogs by a specific user.
@@ -175,18 +192,19 @@ class BlogService(BaseService[BlogCRUD]):
             user_id: User ID
             skip: Pagination offset
             limit: Maximum results
+            cursor: Id of the last blog from the previous page
 
         Returns:
             List of user's blogs
         """
-        logger.debug(f"Fetching blogs for user_id={user_id}")
+        logger.debug("Fetching blogs for user_id=%s", user_id)
 
         try:
-            blogs = await self.crud.get_by_author(db, user_id, skip, limit)
-            logger.debug(f"Retrieved {len(blogs)} blogs for user_id={user_id}")
+            blogs = await self.crud.get_by_author(db, user_id, skip, limit, cursor)
+            logger.debug("Retrieved %s blogs for user_id=%s", len(blogs), user_id)
             return blogs
         except Exception as e:
-            logger.error(f"Error fetching user blogs: {str(e)}", exc_info=True)
+            logger.error("Error fetching user blogs: %s", e, exc_info=True)
             raise
 
     async def update_blog(
@@ -212,30 +230,36 @@ class BlogService(BaseService[BlogCRUD]):
             Updated blog instance
 
         Raises:
-            AuthorizationError: If user lacks permission
+            NotFoundError: If blog does not exist
+            AuthorizationError: If user lacks permission or blog is no longer editable
+            ConflictError: If the blog changed while the update was being applied
         """
-        logger.info(f"Updating blog id={blog_id} by user_id={user_id}")
+        logger.info("Updating blog id=%s by user_id=%s", blog_id, user_id)
 
         try:
-            blog = await self.crud.get(db, blog_id)
-            if not blog:
-                logger.warning(f"Blog not found: id={blog_id}")
-                raise NotFoundError("Blog not found")
-
-            # Check ownership
-            if blog.author_id != user_id:
-                logger.warning(f"Authorization failed: user_id={user_id} attempted to edit blog id={blog_id}")
-                raise AuthorizationError("You can only edit your own blogs")
-
-            await self.validate_update(db, blog_id, blog_in)
-            updated_blog = await self.crud.update(db, blog_id, blog_in)
-
-            logger.info(f"Blog updated successfully: id={blog_id}")
+            # Ownership and pending status are checked by the UPDATE itself
+            updated_blog = await self.crud.update_pending_by_author(db, blog_id, user_id, blog_in)
+            if not updated_blog:
+                # Only on failure: load the blog to report why
+                blog = await self.crud.get(db, blog_id)
+                if not blog:
+                    logger.warning("Blog not found: id=%s", blog_id)
+                    raise NotFoundError("Blog not found")
+
+                if blog.author_id != user_id:
+                    logger.warning("Authorization failed: user_id=%s attempted to edit blog id=%s", user_id, blog_id)
+                    raise AuthorizationError("You can only edit your own blogs")
+
+                await self.validate_update(db, blog_id, blog_in)
+                # Passed validation, so the blog changed between the UPDATE and the check
+                raise ConflictError("Blog was modified concurrently, please retry")
+
+            logger.info("Blog updated successfully: id=%s", blog_id)
             return updated_blog
-        except (ValidationError, AuthorizationError, NotFoundError):
+        except (ValidationError, AuthorizationError, NotFoundError, ConflictError):
             raise
         except Exception as e:
-            logger.error(f"Error updating blog: {str(e)}", exc_info=True)
+            logger.error("Error updating blog: %s", e, exc_info=True)
             raise ValidationError(f"Failed to update blog: {str(e)}")
 
     async def delete_blog(
@@ -261,26 +285,25 @@ class BlogService(BaseService[BlogCRUD]):
         Raises:
             AuthorizationError: If user lacks permission
         """
-        logger.info(f"Deleting blog id={blog_id} by user_id={user_id}")
+        logger.info("Deleting blog id=%s by user_id=%s", blog_id, user_id)
 
         try:
-            blog = await self.crud.get(db, blog_id)
-            if not blog:
-                logger.warning(f"Blog not found: id={blog_id}")
-                raise NotFoundError("Blog not found")
-
-            # Check ownership or admin
-            if blog.author_id != user_id and user_role != UserRole.ADMIN:
-                logger.warning(f"Authorization failed: user_id={user_id} attempted to delete blog id={blog_id}")
+            # Admins may delete any blog; everyone else only their own
+            author_id = None if user_role == UserRole.ADMIN else user_id
+            if not await self.crud.delete_by_author(db, blog_id, author_id):
+                if not await self.crud.exists(db, {"id": blog_id}):
+                    logger.warning("Blog not found: id=%s", blog_id)
+                    raise NotFoundError("Blog not found")
+
+                logger.warning("Authorization failed: user_id=%s attempted to delete blog id=%s", user_id, blog_id)
                 raise AuthorizationError("You can only delete your own blogs")
 
-            result = await self.crud.delete(db, blog_id)
-            logger.info(f"Blog deleted successfully: id={blog_id}")
-            return result
+            logger.info("Blog deleted successfully: id=%s", blog_id)
+            return True
         except (AuthorizationError, NotFoundError):
             raise
         except Exception as e:
-            logger.error(f"Error deleting blog: {str(e)}", exc_info=True)
+            logger.error("Error deleting blog: %s", e, exc_info=True)
             raise ValidationError(f"Failed to delete blog: {str(e)}")
 
     async def approve_blog(
@@ -300,20 +323,23 @@ class BlogService(BaseService[BlogCRUD]):
         Returns:
             Approved blog instance
         """
-        logger.info(f"Approving blog id={blog_id} by approver_id={approver_id}")
+        logger.info("Approving blog id=%s by approver_id=%s", blog_id, approver_id)
 
         try:
             blog = await self.crud.approve_blog(db, blog_id, approver_id)
             if not blog:
-                logger.warning(f"Blog not found for approval: id={blog_id}")
+                if await self.crud.exists(db, {"id": blog_id}):
+                    logger.warning("Blog not pending for approval: id=%s", blog_id)
+                    raise ConflictError("Blog is not pending approval")
+                logger.warning("Blog not found for approval: id=%s", blog_id)
                 raise NotFoundError("Blog not found")
 
-            logger.info(f"Blog approved successfully: id={blog_id}")
+            logger.info("Blog approved successfully: id=%s", blog_id)
             return blog
-        except NotFoundError:
+        except (NotFoundError, ConflictError):
             raise
         except Exception as e:
-            logger.error(f"Error approving blog: {str(e)}", exc_info=True)
+            logger.error("Error approving blog: %s", e, exc_info=True)
             raise ValidationError(f"Failed to approve blog: {str(e)}")
 
     async def reject_blog(
@@ -331,27 +357,79 @@ class BlogService(BaseService[BlogCRUD]):
         Returns:
             Rejected blog instance
         """
-        logger.info(f"Rejecting blog id={blog_id}")
+        logger.info("Rejecting blog id=%s", blog_id)
 
         try:
             blog = await self.crud.reject_blog(db, blog_id)
             if not blog:
-                logger.warning(f"Blog not found for rejection: id={blog_id}")
+                if await self.crud.exists(db, {"id": blog_id}):
+                    logger.warning("Blog not pending for rejection: id=%s", blog_id)
+                    raise ConflictError("Blog is not pending approval")
+                logger.warning("Blog not found for rejection: id=%s", blog_id)
                 raise NotFoundError("Blog not found")
 
-            logger.info(f"Blog rejected successfully: id={blog_id}")
+            logger.info("Blog rejected successfully: id=%s", blog_id)
             return blog
-        except NotFoundError:
+        except (NotFoundError, ConflictError):
             raise
         except Exception as e:
-            logger.error(f"Error rejecting blog: {str(e)}", exc_info=True)
+            logger.error("Error rejecting blog: %s", e, exc_info=True)
             raise ValidationError(f"Failed to reject blog: {str(e)}")
 
+    async def bulk_approve_blogs(
+        self,
+        db: AsyncSession,
+        blog_ids: List[int],
+        approver_id: int
+    ) -> List:
+        """
+        Approve several pending blogs in one statement (admin/approver only).
+
+        Args:
+            db: Database session
+            blog_ids: Blog IDs
+            approver_id: Approver user ID
+
+        Returns:
+            (id, title, approved_at) rows for the blogs that were pending
+        """
+        logger.info("Bulk approving %s blogs by approver_id=%s", len(blog_ids), approver_id)
+
+        try:
+            return await self.crud.bulk_approve(db, list(dict.fromkeys(blog_ids)), approver_id)
+        except Exception as e:
+            logger.error("Error bulk approving blogs: %s", e, exc_info=True)
+            raise ValidationError(f"Failed to approve blogs: {str(e)}")
+
+    async def bulk_reject_blogs(
+        self,
+        db: AsyncSession,
+        blog_ids: List[int]
+    ) -> List[int]:
+        """
+        Reject several pending blogs in one statement (admin/approver only).
+
+        Args:
+            db: Database session
+            blog_ids: Blog IDs
+
+        Returns:
+            IDs of the blogs that were pending
+        """
+        logger.info("Bulk rejecting %s blogs", len(blog_ids))
+
+        try:
+            return await self.crud.bulk_reject(db, list(dict.fromkeys(blog_ids)))
+        except Exception as e:
+            logger.error("Error bulk rejecting blogs: %s", e, exc_info=True)
+            raise ValidationError(f"Failed to reject blogs: {str(e)}")
+
     async def get_pending_blogs(
         self,
         db: AsyncSession,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[int] = None
     ) -> List:
         """
         Get all pending blogs for approval.
@@ -360,18 +438,19 @@ class BlogService(BaseService[BlogCRUD]):
             db: Database session
             skip: Pagination offset
             limit: Maximum results
+            cursor: Id of the last blog from the previous page
 
         Returns:
             List of pending blogs
         """
-        logger.debug(f"Fetching pending blogs: skip={skip}, limit={limit}")
+        logger.debug("Fetching pending blogs: skip=%s, limit=%s", skip, limit)
 
         try:
-            blogs = await self.crud.get_pending_blogs(db, skip, limit)
-            logger.debug(f"Retrieved {len(blogs)} pending blogs")
+            blogs = await self.crud.get_pending_blogs(db, skip, limit, cursor)
+            logger.debug("Retrieved %s pending blogs", len(blogs))
             return blogs
         except Exception as e:
-            logger.error(f"Error fetching pending blogs: {str(e)}", exc_info=True)
+            logger.error("Error fetching pending blogs: %s", e, exc_info=True)
             raise
 
 
@@ -3,7 +3,7 @@ Feature request management service.
 Handles user suggestions and admin actions.
 """
 import logging
-from typing import List
+from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.services.base_service import BaseService
 from app.crud.feature_request_crud import feature_request_crud, FeatureRequestCRUD
@@ -14,6 +14,11 @@ from app.models.feature_request import FeatureRequestStatus
 logger = logging.getLogger(__name__)
 
 
+class FeatureRequestCreateExtended(FeatureRequestCreate):
+    """Feature request creation schema with the submitting user resolved."""
+    user_id: int
+
+
 class FeatureRequestService(BaseService[FeatureRequestCRUD]):
     """
     Feature request service handling user suggestions.
@@ -38,17 +43,17 @@ class FeatureRequestService(BaseService[FeatureRequestCRUD]):
         Raises:
             ValidationError: If validation fails
         """
-        logger.debug(f"Validating feature request creation: {obj_in.title}")
+        logger.debug("Validating feature request creation: %s", obj_in.title)
 
         if len(obj_in.title) < 5:
-            logger.warning(f"Validation failed: Title too short")
+            logger.warning("Validation failed: Title too short")
             raise ValidationError("Title must be at least 5 characters")
 
         if len(obj_in.description) < 10:
-            logger.warning(f"Validation failed: Description too short")
+            logger.warning("Validation failed: Description too short")
             raise ValidationError("Description must be at least 10 characters")
 
-        logger.debug(f"Feature request validation passed: {obj_in.title}")
+        logger.debug("Feature request validation passed: %s", obj_in.title)
         return True
 
     async def validate_update(self, db: AsyncSession, id: int, obj_in: FeatureRequestUpdate) -> bool:
@@ -66,14 +71,14 @@ class FeatureRequestService(BaseService[FeatureRequestCRUD]):
         Raises:
             ValidationError: If validation fails
         """
-        logger.debug(f"Validating feature request update for id={id}")
+        logger.debug("Validating feature request update for id=%s", id)
 
         fr = await self.crud.get(db, id)
         if not fr:
-            logger.warning(f"Validation failed: Feature request not found - id={id}")
+            logger.warning("Validation failed: Feature request not found - id=%s", id)
             raise NotFoundError("Feature request not found")
 
-        logger.debug(f"Feature request update validation passed for id={id}")
+        logger.debug("Feature request update validation passed for id=%s", id)
         return True
 
     async def create_feature_request(
@@ -96,29 +101,23 @@ class FeatureRequestService(BaseService[FeatureRequestCRUD]):
         Raises:
             ValidationError: If validation fails
         """
-        logger.info(f"Creating feature request by user_id={user_id}: {fr_in.title}")
+        logger.info("Creating feature request by user_id=%s: %s", user_id, fr_in.title)
 
         try:
             await self.validate_create(db, fr_in)
 
-            from pydantic import create_model
-            FeatureRequestCreateExtended = create_model(
-                'FeatureRequestCreateExtended',
-                user_id=(int, ...),
-                __base__=FeatureRequestCreate
-            )
-
             fr_data = fr_in.model_dump()
             fr_data["user_id"] = user_id
-            fr_extended = FeatureRequestCreateExtended(**fr_data)
+            # fr_in is already validated; skip a second validation pass
+            fr_extended = FeatureRequestCreateExtended.model_construct(**fr_data)
 
             feature_request = await self.crud.create(db, fr_extended)
-            logger.info(f"Feature request created successfully: id={feature_request.id}")
+            logger.info("Feature request created successfully: id=%s", feature_request.id)
             return feature_request
         except ValidationError:
             raise
         except Exception as e:
-            logger.error(f"Error creating feature request: {str(e)}", exc_info=True)
+            logger.error("Error creating feature request: %s", e, exc_info=True)
             raise ValidationError(f"Failed to create feature request: {str(e)}")
 
     async def update_status(
@@ -141,46 +140,48 @@ class FeatureRequestService(BaseService[FeatureRequestCRUD]):
         Raises:
             ValidationError: If validation fails
         """
-        logger.info(f"Updating feature request id={fr_id} status to {status.value}")
+        logger.info("Updating feature request id=%s status to %s", fr_id, status.value)
 
         try:
             update_data = FeatureRequestUpdate(status=status)
             await self.validate_update(db, fr_id, update_data)
 
             feature_request = await self.crud.update(db, fr_id, update_data)
-            logger.info(f"Feature request status updated: id={fr_id}, status={status.value}")
+            logger.info("Feature request status updated: id=%s, status=%s", fr_id, status.value)
             return feature_request
         except (ValidationError, NotFoundError):
             raise
         except Exception as e:
-            logger.error(f"Error updating feature request status: {str(e)}", exc_info=True)
+            logger.error("Error updating feature request status: %s", e, exc_info=True)
             raise ValidationError(f"Failed to update status: {str(e)}")
 
     async def get_all(
             self,
             db: AsyncSession,
             skip: int = 0,
-            limit: int = 100
+            limit: int = 100,
+            cursor: Optional[int] = None
     ) -> List:
         """
-        Get all feature requests.
+        Get all feature requests ordered by priority, then creation date.
 
         Args:
             db: Database session
             skip: Pagination offset
             limit: Maximum results
+            cursor: Id of the last feature request from the previous page
 
         Returns:
             List of feature requests
         """
-        logger.debug(f"Fetching all feature requests: skip={skip}, limit={limit}")
+        logger.debug("Fetching all feature requests: skip=%s, limit=%s", skip, limit)
 
         try:
-            requests = await self.crud.get_multi(db, skip, limit)
-            logger.debug(f"Retrieved {len(requests)} feature requests")
+            requests = await self.crud.get_prioritized(db, skip, limit, cursor)
+            logger.debug("Retrieved %s feature requests", len(requests))
             return requests
         except Exception as e:
-            logger.error(f"Error fetching feature requests: {str(e)}", exc_info=True)
+            logger.error("Error fetching feature requests: %s", e, exc_info=True)
             raise
 
     async def get_by_user(
@@ -188,7 +189,8 @@ class FeatureRequestService(BaseService[FeatureRequestCRUD]):
             db: AsyncSession,
             user_id: int,
             skip: int = 0,
-            limit: int = 100
+            limit: int = 100,
+            cursor: Optional[int] = None
     ) -> List:
         """
         Get feature requests by user.
@@ -198,18 +200,19 @@ class FeatureRequestService(BaseService[FeatureRequestCRUD]):
             user_id: User ID
             skip: Pagination offset
             limit: Maximum results
+            cursor: Id of the last request from the previous page
 
         Returns:
             List of user's feature requests
         """
-        logger.debug(f"Fetching feature requests for user_id={user_id}")
+        logger.debug("Fetching feature requests for user_id=%s", user_id)
 
         try:
-            requests = await self.crud.get_by_user(db, user_id, skip, limit)
-            logger.debug(f"Retrieved {len(requests)} feature requests for user_id={user_id}")
+            requests = await self.crud.get_by_user(db, user_id, skip, limit, cursor)
+            logger.debug("Retrieved %s feature requests for user_id=%s", len(requests), user_id)
             return requests
         except Exception as e:
-            logger.error(f"Error fetching user feature requests: {str(e)}", exc_info=True)
+            logger.error("Error fetching user feature requests: %s", e, exc_info=True)
             raise
 
 
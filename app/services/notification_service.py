@@ -4,7 +4,9 @@ Manages real-time notifications for admins and approvers.
 """
 import logging
 import asyncio
-from typing import Set
+from collections import deque
+from itertools import islice
+from typing import Deque, List, Optional, Tuple
 from app.models.blog import Blog
 
 logger = logging.getLogger(__name__)
@@ -14,34 +16,77 @@ class NotificationService:
     """
     Notification service for Server-Sent Events (SSE).
     Manages real-time notifications for pending blog approvals.
+
+    Messages are appended once to a shared ring buffer with a sequence
+    number; each subscriber keeps its own cursor and reads what it has not
+    yet seen, so publishing costs the same regardless of subscriber count.
     """
 
+    BUFFER_SIZE = 256
+
     def __init__(self):
-        """Initialize notification queues and subscribers."""
-        self._subscribers: Set[asyncio.Queue] = set()
+        """Initialize the shared message buffer."""
+        self._buffer: Deque[Tuple[int, dict]] = deque(maxlen=self.BUFFER_SIZE)
+        self._seq = 0
+        self._new_message: Optional[asyncio.Event] = None
+        self._subscriber_count = 0
         logger.info("NotificationService initialized")
 
-    async def subscribe(self) -> asyncio.Queue:
+    def _publish(self, message: dict):
+        """
+        Append a message to the buffer and wake all waiting subscribers.
+
+        Args:
+            message: Notification payload
+        """
+        self._seq += 1
+        self._buffer.append((self._seq, message))
+
+        if self._new_message is not None:
+            waiters, self._new_message = self._new_message, None
+            waiters.set()
+
+    async def subscribe(self) -> int:
         """
         Subscribe to notifications.
 
         Returns:
-            Queue for receiving notifications
+            Cursor positioned after the latest published message
         """
-        queue = asyncio.Queue()
-        self._subscribers.add(queue)
-        logger.info(f"New subscriber added. Total subscribers: {len(self._subscribers)}")
-        return queue
+        self._subscriber_count += 1
+        logger.info("New subscriber added. Total subscribers: %s", self._subscriber_count)
+        return self._seq
 
-    async def unsubscribe(self, queue: asyncio.Queue):
+    async def unsubscribe(self):
+        """Unsubscribe from notifications."""
+        self._subscriber_count = max(self._subscriber_count - 1, 0)
+        logger.info("Subscriber removed. Total subscribers: %s", self._subscriber_count)
+
+    async def wait_for_messages(self, cursor: int) -> Tuple[int, List[dict]]:
         """
-        Unsubscribe from notifications.
+        Wait until messages newer than the cursor are available.
+
+        Subscribers that fall more than BUFFER_SIZE messages behind skip
+        ahead to the oldest message still buffered.
 
         Args:
-            queue: Queue to remove
+            cursor: Sequence number of the last message the subscriber received
+
+        Returns:
+            Tuple of the new cursor and the unseen messages in publish order
         """
-        self._subscribers.discard(queue)
-        logger.info(f"Subscriber removed. Total subscribers: {len(self._subscribers)}")
+        while self._seq <= cursor:
+            if self._new_message is None:
+                self._new_message = asyncio.Event()
+            await self._new_message.wait()
+
+        unseen = self._seq - cursor
+        if unseen > len(self._buffer):
+            logger.warning("Subscriber missed %s notifications", unseen - len(self._buffer))
+            unseen = len(self._buffer)
+
+        messages = [message for _, message in islice(self._buffer, len(self._buffer) - unseen, None)]
+        return self._seq, messages
 
     async def notify_pending_blog(self, blog: Blog):
         """
@@ -50,7 +95,7 @@ class NotificationService:
         Args:
             blog: Newly created pending blog
         """
-        logger.info(f"Broadcasting notification for pending blog id={blog.id}")
+        logger.info("Broadcasting notification for pending blog id=%s", blog.id)
 
         message = {
             "event": "new_pending_blog",
@@ -58,25 +103,12 @@ class NotificationService:
                 "id": blog.id,
                 "title": blog.title,
                 "author_id": blog.author_id,
-                "created_at": str(blog.created_at)
+                "created_at": blog.created_at.isoformat() if blog.created_at else None
             }
         }
 
-        # Send to all subscribers
-        dead_queues = []
-        for queue in self._subscribers:
-            try:
-                await queue.put(message)
-                logger.debug(f"Notification sent to subscriber")
-            except Exception as e:
-                logger.error(f"Error sending notification to subscriber: {str(e)}")
-                dead_queues.append(queue)
-
-        # Remove dead queues
-        for queue in dead_queues:
-            self._subscribers.discard(queue)
-
-        logger.info(f"Notification broadcast complete. Active subscribers: {len(self._subscribers)}")
+        self._publish(message)
+        logger.info("Notification broadcast complete. Active subscribers: %s", self._subscriber_count)
 
     async def notify_blog_approved(self, blog: Blog):
         """
@@ -85,22 +117,18 @@ class NotificationService:
         Args:
             blog: Approved blog
         """
-        logger.info(f"Broadcasting notification for approved blog id={blog.id}")
+        logger.info("Broadcasting notification for approved blog id=%s", blog.id)
 
         message = {
             "event": "blog_approved",
             "data": {
                 "id": blog.id,
                 "title": blog.title,
-                "approved_at": str(blog.approved_at)
+                "approved_at": blog.approved_at.isoformat() if blog.approved_at else None
             }
         }
 
-        for queue in self._subscribers:
-            try:
-                await queue.put(message)
-            except Exception as e:
-                logger.error(f"Error sending approval notification: {str(e)}")
+        self._publish(message)
 
 
 # Create singleton instance
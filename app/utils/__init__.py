@@ -0,0 +1,12 @@
+"""Utility helpers package."""
+from app.utils.http_cache import make_etag, etag_matches, conditional_json_response
+from app.utils.pagination import NEXT_CURSOR_HEADER, next_cursor, split_page
+
+__all__ = [
+    "make_etag",
+    "etag_matches",
+    "conditional_json_response",
+    "NEXT_CURSOR_HEADER",
+    "next_cursor",
+    "split_page"
+]
@@ -0,0 +1,81 @@
+"""
+HTTP conditional request helpers.
+Builds ETag-tagged JSON responses and answers If-None-Match with 304.
+"""
+import hashlib
+from typing import Dict, Optional
+from fastapi import Request, Response, status
+
+# Multiple of max-age during which shared caches may serve a stale copy while refetching
+STALE_WHILE_REVALIDATE_FACTOR = 4
+
+
+def make_etag(body: bytes) -> str:
+    """
+    Build a weak ETag from a serialized response body.
+
+    Args:
+        body: Response body bytes
+
+    Returns:
+        Quoted weak ETag value
+    """
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check whether the request's If-None-Match header matches an ETag.
+
+    Args:
+        request: Incoming request
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client already holds this representation
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def conditional_json_response(
+        request: Request,
+        body: bytes,
+        max_age: int,
+        headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """
+    Return a JSON response, or 304 Not Modified if the client's copy is current.
+
+    Args:
+        request: Incoming request
+        body: Serialized JSON body
+        max_age: Cache-Control max-age in seconds (stale-while-revalidate is derived from it)
+        headers: Extra response headers
+
+    Returns:
+        Response with ETag and Cache-Control headers
+    """
+    etag = make_etag(body)
+    cache_control = (
+        f"public, max-age={max_age}, "
+        f"stale-while-revalidate={max_age * STALE_WHILE_REVALIDATE_FACTOR}"
+    )
+    headers = {**(headers or {}), "ETag": etag, "Cache-Control": cache_control}
+
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,43 @@
+"""
+Keyset pagination helpers.
+List endpoints return the id of the last row in a response header so the
+response body keeps its plain list shape.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def next_cursor(rows: Sequence, limit: int) -> Optional[int]:
+    """
+    Get the cursor for the page after rows.
+
+    Rows are expected to be fetched with ``limit + 1``; the extra row only
+    signals that another page exists, so no separate COUNT query is needed.
+
+    Args:
+        rows: Rows fetched for the current page (up to limit + 1)
+        limit: Page size that was requested
+
+    Returns:
+        Id of the last row on this page, or None if this was the last page
+    """
+    if len(rows) <= limit:
+        return None
+    return rows[limit - 1].id
+
+
+def split_page(rows: Sequence, limit: int) -> Tuple[List, Dict[str, str]]:
+    """
+    Trim a ``limit + 1`` fetch to one page and build its next-cursor header.
+
+    Args:
+        rows: Rows fetched for the current page (up to limit + 1)
+        limit: Page size that was requested
+
+    Returns:
+        Tuple of (page rows, header mapping); headers are empty on the last page
+    """
+    cursor = next_cursor(rows, limit)
+    headers = {NEXT_CURSOR_HEADER: str(cursor)} if cursor is not None else {}
+    return list(rows[:limit]), headers
@@ -2,32 +2,52 @@
 Pytest configuration and fixtures.
 Provides common test fixtures and setup.
 """
+import os
+
+# Minimum bcrypt cost for test users; must be set before app settings are loaded
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+# Skips CORS and request-logging middleware the tests never assert on
+os.environ["APP_TESTING"] = "1"
+
 import pytest
 import asyncio
-from typing import AsyncGenerator
-from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from typing import AsyncGenerator, Dict
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
 from app.main import app
 from app.database import Base, get_db
 from app.config import settings
 from app.models.user import User, UserRole
+from app.models.blog import Blog, BlogStatus
+from app.models.feature_request import FeatureRequest, FeatureRequestStatus
 from app.core.security import get_password_hash
+from app.services.auth_service import auth_service
 
-# Test database URL
-TEST_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
+# In-memory database; StaticPool makes every checkout share its single connection.
+# Each pytest-xdist worker is its own process and so gets a private database.
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 # Create test engine
 test_engine = create_async_engine(
     TEST_DATABASE_URL,
     echo=False,
-    connect_args={"check_same_thread": False}
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool
 )
 
-TestSessionLocal = async_sessionmaker(
-    test_engine,
-    class_=AsyncSession,
-    expire_on_commit=False
-)
+
+# The sqlite driver's own transaction handling breaks SAVEPOINTs; disable it
+# and emit BEGIN ourselves (SQLAlchemy's documented SQLite recipe)
+@event.listens_for(test_engine.sync_engine, "connect")
+def _disable_driver_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(test_engine.sync_engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
 
 
 @pytest.fixture(scope="session")
@@ -38,29 +58,49 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(scope="session")
+async def db_schema() -> AsyncGenerator[None, None]:
+    """Create all tables once for the whole test session."""
+    async with test_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield
+
+    await test_engine.dispose()
+
+
 @pytest.fixture(scope="function")
-async def db_session() -> AsyncGenerator[AsyncSession, None]:
+async def db_session(db_schema) -> AsyncGenerator[AsyncSession, None]:
     """
     Create test database session.
-    Creates all tables before test and drops them after.
+    Runs the test inside an outer transaction that is rolled back afterwards;
+    commits made by the code under test only release SAVEPOINTs.
     """
-    # Create tables
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    async with test_engine.connect() as conn:
+        transaction = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint"
+        )
 
-    # Create session
-    async with TestSessionLocal() as session:
         yield session
 
-    # Drop tables
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+        await session.close()
+        await transaction.rollback()
+
+
+@pytest.fixture(scope="session")
+async def http_client() -> AsyncGenerator[AsyncClient, None]:
+    """Create one HTTP client for the whole test session."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
 
 
 @pytest.fixture(scope="function")
-async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+async def client(http_client: AsyncClient, db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     """
-    Create test HTTP client with database session override.
+    Get the shared HTTP client with the database session override for this test.
     """
 
     async def override_get_db():
@@ -68,94 +108,137 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
 
     app.dependency_overrides[get_db] = override_get_db
 
-    async with AsyncClient(app=app, base_url="http://test") as ac:
-        yield ac
+    yield http_client
 
-    app.dependency_overrides.clear()
+    app.dependency_overrides.pop(get_db, None)
 
 
-@pytest.fixture
-async def test_user(db_session: AsyncSession) -> User:
-    """Create a test user."""
-    user = User(
-        email="test@example.com",
-        username="testuser",
-        hashed_password=get_password_hash("TestPassword123"),
-        role=UserRole.USER,
-        is_active=1
-    )
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-    return user
+def _access_token(user: User) -> str:
+    """Mint an access token directly instead of going through /auth/login."""
+    return auth_service._create_access_token(user.id, user.email, user.role.value)
 
 
-@pytest.fixture
-async def test_admin(db_session: AsyncSession) -> User:
-    """Create a test admin user."""
-    admin = User(
-        email="admin@example.com",
-        username="adminuser",
-        hashed_password=get_password_hash("AdminPassword123"),
-        role=UserRole.ADMIN,
-        is_active=1
-    )
-    db_session.add(admin)
-    await db_session.commit()
-    await db_session.refresh(admin)
-    return admin
+@pytest.fixture(scope="session")
+async def seed_users(db_schema) -> Dict[UserRole, User]:
+    """
+    Create the test user, admin and approver once for the whole test session.
+    Committed outside the per-test transactions, so the rows (and tokens
+    minted for them) survive every test's rollback; bcrypt runs once per password.
+    """
+    users = {
+        UserRole.USER: User(
+            email="test@example.com",
+            username="testuser",
+            hashed_password=get_password_hash("TestPassword123"),
+            role=UserRole.USER,
+            is_active=1
+        ),
+        UserRole.ADMIN: User(
+            email="admin@example.com",
+            username="adminuser",
+            hashed_password=get_password_hash("AdminPassword123"),
+            role=UserRole.ADMIN,
+            is_active=1
+        ),
+        UserRole.L1_APPROVER: User(
+            email="approver@example.com",
+            username="approveruser",
+            hashed_password=get_password_hash("ApproverPassword123"),
+            role=UserRole.L1_APPROVER,
+            is_active=1
+        )
+    }
+    async with AsyncSession(bind=test_engine, expire_on_commit=False) as session:
+        session.add_all(users.values())
+        # expire_on_commit=False and flushed primary keys make a refresh unnecessary
+        await session.commit()
+    return users
 
 
-@pytest.fixture
-async def test_approver(db_session: AsyncSession) -> User:
-    """Create a test approver user."""
-    approver = User(
-        email="approver@example.com",
-        username="approveruser",
-        hashed_password=get_password_hash("ApproverPassword123"),
-        role=UserRole.L1_APPROVER,
-        is_active=1
-    )
-    db_session.add(approver)
-    await db_session.commit()
-    await db_session.refresh(approver)
-    return approver
+@pytest.fixture(scope="session")
+async def test_user(seed_users: Dict[UserRole, User]) -> User:
+    """Get the test user."""
+    return seed_users[UserRole.USER]
 
 
-@pytest.fixture
-async def user_token(client: AsyncClient, test_user: User) -> str:
+@pytest.fixture(scope="session")
+async def test_admin(seed_users: Dict[UserRole, User]) -> User:
+    """Get the test admin user."""
+    return seed_users[UserRole.ADMIN]
+
+
+@pytest.fixture(scope="session")
+async def test_approver(seed_users: Dict[UserRole, User]) -> User:
+    """Get the test approver user."""
+    return seed_users[UserRole.L1_APPROVER]
+
+
+@pytest.fixture(scope="session")
+async def user_token(test_user: User) -> str:
     """Get authentication token for test user."""
-    response = await client.post(
-        "/api/v1/auth/login",
-        json={
-            "email": "test@example.com",
-            "password": "TestPassword123"
-        }
-    )
-    return response.json()["access_token"]
+    return _access_token(test_user)
 
 
-@pytest.fixture
-async def admin_token(client: AsyncClient, test_admin: User) -> str:
+@pytest.fixture(scope="session")
+async def admin_token(test_admin: User) -> str:
     """Get authentication token for admin user."""
-    response = await client.post(
-        "/api/v1/auth/login",
-        json={
-            "email": "admin@example.com",
-            "password": "AdminPassword123"
-        }
+    return _access_token(test_admin)
+
+
+@pytest.fixture(scope="session")
+async def approver_token(test_approver: User) -> str:
+    """Get authentication token for approver user."""
+    return _access_token(test_approver)
+
+
+@pytest.fixture(scope="session")
+def user_headers(user_token: str) -> Dict[str, str]:
+    """Get Authorization headers for test user."""
+    return {"Authorization": f"Bearer {user_token}"}
+
+
+@pytest.fixture(scope="session")
+def admin_headers(admin_token: str) -> Dict[str, str]:
+    """Get Authorization headers for admin user."""
+    return {"Authorization": f"Bearer {admin_token}"}
+
+
+@pytest.fixture(scope="session")
+def approver_headers(approver_token: str) -> Dict[str, str]:
+    """Get Authorization headers for approver user."""
+    return {"Authorization": f"Bearer {approver_token}"}
+
+
+@pytest.fixture
+async def pending_blog(db_session: AsyncSession, test_user: User) -> Blog:
+    """
+    Create a pending blog owned by the test user.
+    Inserted directly, so tests of other blog endpoints skip a POST /blogs/ round trip.
+    """
+    blog = Blog(
+        title="Fixture Blog Post",
+        content="Fixture content for blog endpoint tests.",
+        author_id=test_user.id,
+        status=BlogStatus.PENDING
     )
-    return response.json()["access_token"]
+    db_session.add(blog)
+    await db_session.commit()
+    return blog
 
 
 @pytest.fixture
-async def approver_token(client: AsyncClient, test_approver: User) -> str:
-    """Get authentication token for approver user."""
-    response = await client.post(
-        "/api/v1/auth/login",
-        json={
-            "email": "approver@example.com",
-            "password": "ApproverPassword123"
-        }
+async def pending_feature_request(db_session: AsyncSession, test_user: User) -> FeatureRequest:
+    """
+    Create a pending feature request submitted by the test user.
+    Inserted directly, so tests of other endpoints skip a POST /feature-requests/ round trip.
+    """
+    feature_request = FeatureRequest(
+        title="Fixture Feature Request",
+        description="Fixture description for feature request tests.",
+        priority=5,
+        user_id=test_user.id,
+        status=FeatureRequestStatus.PENDING
     )
-    return response.json()["access_token"]
+    db_session.add(feature_request)
+    await db_session.commit()
+    return feature_request
@@ -0,0 +1,135 @@
+"""
+Authentication endpoint tests.
+Tests login rate limiting, the identity and unknown-email caches, and duplicate-user errors.
+"""
+import importlib
+import pytest
+from typing import Dict
+from httpx import AsyncClient
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api import deps
+from app.core.exceptions import ValidationError
+from app.models.user import User
+from app.schemas.user_dto import UserCreate
+
+# app.crud re-exports the user_crud singleton under the module's name
+user_crud_module = importlib.import_module("app.crud.user_crud")
+
+LOGIN_URL = "/api/v1/auth/login"
+REGISTER_URL = "/api/v1/auth/register"
+
+
+@pytest.fixture
+def fake_cache(monkeypatch: pytest.MonkeyPatch) -> Dict[str, bytes]:
+    """Replace the Redis helpers used by login with an in-memory store."""
+    store: Dict[str, bytes] = {}
+
+    async def cache_get(key: str):
+        return store.get(key)
+
+    async def cache_set(key: str, value: bytes, expire: int) -> None:
+        store[key] = value
+
+    async def cache_delete(*keys: str) -> None:
+        for key in keys:
+            store.pop(key, None)
+
+    async def cache_incr(key: str, expire: int) -> int:
+        store[key] = store.get(key, 0) + 1
+        return store[key]
+
+    monkeypatch.setattr(user_crud_module, "cache_get", cache_get)
+    monkeypatch.setattr(user_crud_module, "cache_set", cache_set)
+    monkeypatch.setattr(user_crud_module, "cache_delete", cache_delete)
+    monkeypatch.setattr(deps, "cache_incr", cache_incr)
+    return store
+
+
+@pytest.mark.asyncio
+async def test_login_rate_limit(client: AsyncClient, fake_cache: Dict[str, bytes]):
+    """Test the attempt after LOGIN_RATE_LIMIT is rejected with Retry-After."""
+    credentials = {"email": "nobody@example.com", "password": "Wrong123"}
+
+    for _ in range(deps.LOGIN_RATE_LIMIT):
+        response = await client.post(LOGIN_URL, json=credentials)
+        assert response.status_code == 401
+
+    response = await client.post(LOGIN_URL, json=credentials)
+
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == str(deps.LOGIN_RATE_WINDOW_SECONDS)
+
+
+@pytest.mark.asyncio
+async def test_register_clears_missing_email_cache(client: AsyncClient, fake_cache: Dict[str, bytes]):
+    """Test an email cached as unknown can log in once it is registered."""
+    credentials = {"email": "newcomer@example.com", "password": "Newcomer123"}
+
+    response = await client.post(LOGIN_URL, json=credentials)
+    assert response.status_code == 401
+    assert user_crud_module._missing_email_key(credentials["email"]) in fake_cache
+
+    response = await client.post(REGISTER_URL, json={**credentials, "username": "newcomer"})
+    assert response.status_code == 201
+    assert user_crud_module._missing_email_key(credentials["email"]) not in fake_cache
+
+    response = await client.post(LOGIN_URL, json=credentials)
+    assert response.status_code == 200
+    assert "access_token" in response.json()
+
+
+@pytest.mark.asyncio
+async def test_create_user_duplicate_username(db_session: AsyncSession, test_user: User):
+    """Test a duplicate username is reported as such, whatever its value."""
+    user_in = UserCreate(email="other@example.com", username=test_user.username, password="Other1234")
+
+    with pytest.raises(ValidationError) as exc_info:
+        await user_crud_module.user_crud.create(db_session, user_in)
+
+    assert exc_info.value.message == "Username already taken"
+
+
+def test_unique_violation_uses_constraint_name():
+    """Test asyncpg errors are classified by constraint name, not message text."""
+    class UniqueViolation(Exception):
+        constraint_name = "ix_users_username"
+
+    orig = Exception("duplicate key value: Key (username)=(myemail) already exists")
+    orig.__cause__ = UniqueViolation()
+
+    error = IntegrityError("INSERT INTO users ...", {}, orig)
+
+    assert user_crud_module._unique_violation(error) == "ix_users_username"
+
+
+@pytest.mark.asyncio
+async def test_cached_identity_is_read_only(
+        db_session: AsyncSession,
+        test_user: User,
+        fake_cache: Dict[str, bytes]
+):
+    """Test cache misses and hits both return a UserIdentity, never an ORM user."""
+    user_crud = user_crud_module.user_crud
+
+    miss = await user_crud.get_cached(db_session, test_user.id)
+    hit = await user_crud.get_cached(db_session, test_user.id)
+
+    assert isinstance(miss, user_crud_module.UserIdentity)
+    assert hit == miss
+    assert hit.role == test_user.role
+
+    await user_crud.invalidate_cached(test_user.id)
+    assert user_crud_module._user_cache_key(test_user.id) not in fake_cache
+
+
+@pytest.mark.asyncio
+async def test_register_duplicate_email(client: AsyncClient, test_user: User):
+    """Test registering an existing email is rejected by the unique index."""
+    response = await client.post(
+        REGISTER_URL,
+        json={"email": test_user.email, "username": "freshname", "password": "Fresh1234"}
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Email already registered"
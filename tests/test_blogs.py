@@ -3,15 +3,27 @@ Blog endpoint tests.
 Tests blog CRUD operations and approval workflow.
 """
 import pytest
+from typing import Dict
 from httpx import AsyncClient
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.blog import Blog
+from app.models.user import User
+
+BLOGS_URL = "/api/v1/blogs/"
+MY_BLOGS_URL = "/api/v1/blogs/user/my-blogs"
+BLOG_URL = "/api/v1/blogs/{}".format
+APPROVE_URL = "/api/v1/blogs/{}/approve".format
+BULK_APPROVE_URL = "/api/v1/blogs/approve/bulk"
+BULK_REJECT_URL = "/api/v1/blogs/reject/bulk"
 
 
 @pytest.mark.asyncio
-async def test_create_blog(client: AsyncClient, user_token: str):
+async def test_create_blog(client: AsyncClient, user_headers: Dict[str, str]):
     """Test blog creation."""
     response = await client.post(
-        "/api/v1/blogs/",
-        headers={"Authorization": f"Bearer {user_token}"},
+        BLOGS_URL,
+        headers=user_headers,
         json={
             "title": "Test Blog Post",
             "content": "This is test content for the blog post.",
@@ -30,7 +42,7 @@ async def test_create_blog(client: AsyncClient, user_token: str):
 async def test_create_blog_without_auth(client: AsyncClient):
     """Test blog creation without authentication."""
     response = await client.post(
-        "/api/v1/blogs/",
+        BLOGS_URL,
         json={
             "title": "Test Blog Post",
             "content": "This is test content."
@@ -43,55 +55,97 @@ async def test_create_blog_without_auth(client: AsyncClient):
 @pytest.mark.asyncio
 async def test_list_public_blogs(client: AsyncClient):
     """Test listing public blogs (no auth required)."""
-    response = await client.get("/api/v1/blogs/")
+    response = await client.get(BLOGS_URL)
 
     assert response.status_code == 200
     assert isinstance(response.json(), list)
 
 
 @pytest.mark.asyncio
-async def test_get_my_blogs(client: AsyncClient, user_token: str):
-    """Test getting user's own blogs."""
-    # Create a blog first
-    await client.post(
-        "/api/v1/blogs/",
-        headers={"Authorization": f"Bearer {user_token}"},
-        json={
-            "title": "My Blog",
-            "content": "My blog content"
-        }
-    )
+async def test_list_public_blogs_not_modified(client: AsyncClient):
+    """Test conditional GET on public blogs returns 304 for a matching ETag."""
+    response = await client.get(BLOGS_URL)
+    etag = response.headers["etag"]
 
+    response = await client.get(BLOGS_URL, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+@pytest.mark.asyncio
+async def test_get_my_blogs(client: AsyncClient, user_headers: Dict[str, str], pending_blog: Blog):
+    """Test getting user's own blogs."""
     # Get user's blogs
     response = await client.get(
-        "/api/v1/blogs/user/my-blogs",
-        headers={"Authorization": f"Bearer {user_token}"}
+        MY_BLOGS_URL,
+        headers=user_headers
     )
 
     assert response.status_code == 200
     blogs = response.json()
     assert len(blogs) > 0
-    assert blogs[0]["title"] == "My Blog"
+    assert blogs[0]["title"] == pending_blog.title
 
 
 @pytest.mark.asyncio
-async def test_approve_blog(client: AsyncClient, user_token: str, approver_token: str):
-    """Test blog approval by approver."""
-    # Create blog
-    create_response = await client.post(
-        "/api/v1/blogs/",
-        headers={"Authorization": f"Bearer {user_token}"},
-        json={
-            "title": "Blog to Approve",
-            "content": "Content to be approved"
-        }
+async def test_get_my_blogs_cursor_pagination(
+        client: AsyncClient,
+        db_session: AsyncSession,
+        test_user: User,
+        user_headers: Dict[str, str]
+):
+    """Test paging through user's blogs with the X-Next-Cursor header."""
+    db_session.add_all(
+        Blog(title=f"Paged Blog {i}", content="Paged blog content", author_id=test_user.id)
+        for i in range(3)
+    )
+    await db_session.commit()
+
+    first = await client.get(MY_BLOGS_URL, params={"limit": 2}, headers=user_headers)
+    cursor = first.headers["x-next-cursor"]
+
+    second = await client.get(MY_BLOGS_URL, params={"limit": 2, "cursor": cursor}, headers=user_headers)
+    exact = await client.get(MY_BLOGS_URL, params={"limit": 3}, headers=user_headers)
+
+    assert [b["title"] for b in first.json()] == ["Paged Blog 2", "Paged Blog 1"]
+    assert [b["title"] for b in second.json()] == ["Paged Blog 0"]
+    assert "x-next-cursor" not in second.headers
+    assert len(exact.json()) == 3
+    assert "x-next-cursor" not in exact.headers
+
+
+@pytest.mark.asyncio
+async def test_get_my_blogs_deleted_cursor(
+        client: AsyncClient,
+        db_session: AsyncSession,
+        test_user: User,
+        user_headers: Dict[str, str]
+):
+    """Test a cursor whose row was deleted between pages is rejected, not read as the end."""
+    db_session.add_all(
+        Blog(title=f"Paged Blog {i}", content="Paged blog content", author_id=test_user.id)
+        for i in range(3)
     )
-    blog_id = create_response.json()["id"]
+    await db_session.commit()
+
+    first = await client.get(MY_BLOGS_URL, params={"limit": 2}, headers=user_headers)
+    cursor = first.headers["x-next-cursor"]
+    await db_session.execute(delete(Blog).where(Blog.id == int(cursor)))
+    await db_session.commit()
+
+    response = await client.get(MY_BLOGS_URL, params={"limit": 2, "cursor": cursor}, headers=user_headers)
 
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_approve_blog(client: AsyncClient, approver_headers: Dict[str, str], pending_blog: Blog):
+    """Test blog approval by approver."""
     # Approve blog
     approve_response = await client.post(
-        f"/api/v1/blogs/{blog_id}/approve",
-        headers={"Authorization": f"Bearer {approver_token}"},
+        APPROVE_URL(pending_blog.id),
+        headers=approver_headers,
         json={"reason": "Looks good"}
     )
 
@@ -102,23 +156,30 @@ async def test_approve_blog(client: AsyncClient, user_token: str, approver_token
 
 
 @pytest.mark.asyncio
-async def test_approve_blog_without_permission(client: AsyncClient, user_token: str):
-    """Test blog approval without approver role."""
-    # Create blog
-    create_response = await client.post(
-        "/api/v1/blogs/",
-        headers={"Authorization": f"Bearer {user_token}"},
-        json={
-            "title": "Blog to Approve",
-            "content": "Content"
-        }
-    )
-    blog_id = create_response.json()["id"]
+async def test_approve_blog_twice(client: AsyncClient, approver_headers: Dict[str, str], pending_blog: Blog):
+    """Test approving a blog that is no longer pending."""
+    await client.post(APPROVE_URL(pending_blog.id), headers=approver_headers, json={})
 
+    response = await client.post(APPROVE_URL(pending_blog.id), headers=approver_headers, json={})
+
+    assert response.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_approve_missing_blog(client: AsyncClient, approver_headers: Dict[str, str]):
+    """Test approving a blog that does not exist."""
+    response = await client.post(APPROVE_URL(999999), headers=approver_headers, json={})
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_approve_blog_without_permission(client: AsyncClient, user_headers: Dict[str, str], pending_blog: Blog):
+    """Test blog approval without approver role."""
     # Try to approve with regular user
     approve_response = await client.post(
-        f"/api/v1/blogs/{blog_id}/approve",
-        headers={"Authorization": f"Bearer {user_token}"},
+        APPROVE_URL(pending_blog.id),
+        headers=user_headers,
         json={}
     )
 
@@ -126,23 +187,64 @@ async def test_approve_blog_without_permission(client: AsyncClient, user_token:
 
 
 @pytest.mark.asyncio
-async def test_update_blog(client: AsyncClient, user_token: str):
-    """Test blog update by author."""
-    # Create blog
-    create_response = await client.post(
-        "/api/v1/blogs/",
-        headers={"Authorization": f"Bearer {user_token}"},
-        json={
-            "title": "Original Title",
-            "content": "Original content"
-        }
+async def test_bulk_approve_blogs(client: AsyncClient, approver_headers: Dict[str, str], pending_blog: Blog):
+    """Test bulk approval collapses duplicate ids and skips missing ones."""
+    response = await client.post(
+        BULK_APPROVE_URL,
+        headers=approver_headers,
+        json={"blog_ids": [pending_blog.id, pending_blog.id, 999999]}
     )
-    blog_id = create_response.json()["id"]
 
+    assert response.status_code == 200
+    assert response.json() == {"updated_ids": [pending_blog.id]}
+
+
+@pytest.mark.asyncio
+async def test_bulk_reject_skips_reviewed_blogs(
+        client: AsyncClient,
+        approver_headers: Dict[str, str],
+        pending_blog: Blog
+):
+    """Test a second bulk rejection of the same blogs updates nothing."""
+    first = await client.post(BULK_REJECT_URL, headers=approver_headers, json={"blog_ids": [pending_blog.id]})
+    second = await client.post(BULK_REJECT_URL, headers=approver_headers, json={"blog_ids": [pending_blog.id]})
+
+    assert first.json() == {"updated_ids": [pending_blog.id]}
+    assert second.status_code == 200
+    assert second.json() == {"updated_ids": []}
+
+
+@pytest.mark.asyncio
+async def test_bulk_approve_without_permission(
+        client: AsyncClient,
+        user_headers: Dict[str, str],
+        pending_blog: Blog
+):
+    """Test bulk approval without approver role."""
+    response = await client.post(BULK_APPROVE_URL, headers=user_headers, json={"blog_ids": [pending_blog.id]})
+
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_bulk_reject_too_many_ids(client: AsyncClient, approver_headers: Dict[str, str]):
+    """Test bulk review rejects more than 100 ids."""
+    response = await client.post(
+        BULK_REJECT_URL,
+        headers=approver_headers,
+        json={"blog_ids": list(range(1, 102))}
+    )
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_update_blog(client: AsyncClient, user_headers: Dict[str, str], pending_blog: Blog):
+    """Test blog update by author."""
     # Update blog
     update_response = await client.put(
-        f"/api/v1/blogs/{blog_id}",
-        headers={"Authorization": f"Bearer {user_token}"},
+        BLOG_URL(pending_blog.id),
+        headers=user_headers,
         json={
             "title": "Updated Title",
             "content": "Updated content"
@@ -156,23 +258,12 @@ async def test_update_blog(client: AsyncClient, user_token: str):
 
 
 @pytest.mark.asyncio
-async def test_delete_blog(client: AsyncClient, user_token: str):
+async def test_delete_blog(client: AsyncClient, user_headers: Dict[str, str], pending_blog: Blog):
     """Test blog deletion by author."""
-    # Create blog
-    create_response = await client.post(
-        "/api/v1/blogs/",
-        headers={"Authorization": f"Bearer {user_token}"},
-        json={
-            "title": "Blog to Delete",
-            "content": "Content"
-        }
-    )
-    blog_id = create_response.json()["id"]
-
     # Delete blog
     delete_response = await client.delete(
-        f"/api/v1/blogs/{blog_id}",
-        headers={"Authorization": f"Bearer {user_token}"}
+        BLOG_URL(pending_blog.id),
+        headers=user_headers
     )
 
     assert delete_response.status_code == 204
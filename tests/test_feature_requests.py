@@ -2,15 +2,20 @@
 Feature request endpoint tests.
 """
 import pytest
+from typing import Dict
 from httpx import AsyncClient
+from app.models.feature_request import FeatureRequest
+
+FEATURE_REQUESTS_URL = "/api/v1/feature-requests/"
+FEATURE_REQUEST_URL = "/api/v1/feature-requests/{}".format
 
 
 @pytest.mark.asyncio
-async def test_create_feature_request(client: AsyncClient, user_token: str):
+async def test_create_feature_request(client: AsyncClient, user_headers: Dict[str, str]):
     """Test feature request creation."""
     response = await client.post(
-        "/api/v1/feature-requests/",
-        headers={"Authorization": f"Bearer {user_token}"},
+        FEATURE_REQUESTS_URL,
+        headers=user_headers,
         json={
             "title": "New Feature Request",
             "description": "This is a description of the feature",
@@ -26,23 +31,16 @@ async def test_create_feature_request(client: AsyncClient, user_token: str):
 
 
 @pytest.mark.asyncio
-async def test_list_feature_requests(client: AsyncClient, user_token: str):
+async def test_list_feature_requests(
+        client: AsyncClient,
+        user_headers: Dict[str, str],
+        pending_feature_request: FeatureRequest
+):
     """Test listing feature requests."""
-    # Create a feature request first
-    await client.post(
-        "/api/v1/feature-requests/",
-        headers={"Authorization": f"Bearer {user_token}"},
-        json={
-            "title": "Test Feature",
-            "description": "Test description",
-            "priority": 3
-        }
-    )
-
     # List all requests
     response = await client.get(
-        "/api/v1/feature-requests/",
-        headers={"Authorization": f"Bearer {user_token}"}
+        FEATURE_REQUESTS_URL,
+        headers=user_headers
     )
 
     assert response.status_code == 200
@@ -53,26 +51,14 @@ async def test_list_feature_requests(client: AsyncClient, user_token: str):
 @pytest.mark.asyncio
 async def test_update_feature_request_status(
         client: AsyncClient,
-        user_token: str,
-        admin_token: str
+        admin_headers: Dict[str, str],
+        pending_feature_request: FeatureRequest
 ):
     """Test updating feature request status by admin."""
-    # Create feature request
-    create_response = await client.post(
-        "/api/v1/feature-requests/",
-        headers={"Authorization": f"Bearer {user_token}"},
-        json={
-            "title": "Feature to Update",
-            "description": "Description",
-            "priority": 5
-        }
-    )
-    request_id = create_response.json()["id"]
-
     # Update status as admin
     update_response = await client.patch(
-        f"/api/v1/feature-requests/{request_id}",
-        headers={"Authorization": f"Bearer {admin_token}"},
+        FEATURE_REQUEST_URL(pending_feature_request.id),
+        headers=admin_headers,
         json={"status": "accepted"}
     )
 
@@ -0,0 +1,31 @@
+"""
+Notification payload tests.
+Pins the SSE event shapes that clients parse.
+"""
+import pytest
+from datetime import datetime, timezone
+from app.models.blog import Blog
+from app.services.notification_service import NotificationService
+
+
+@pytest.mark.asyncio
+async def test_notification_timestamps_are_iso_8601():
+    """Test timestamps are sent as ISO 8601 strings and missing ones as null."""
+    service = NotificationService()
+    cursor = await service.subscribe()
+    created_at = datetime(2025, 11, 16, 12, 0, tzinfo=timezone.utc)
+
+    await service.notify_pending_blog(Blog(id=1, title="Pending", author_id=2, created_at=created_at))
+    await service.notify_blog_approved(Blog(id=1, title="Pending", approved_at=None))
+    _, messages = await service.wait_for_messages(cursor)
+
+    assert messages == [
+        {
+            "event": "new_pending_blog",
+            "data": {"id": 1, "title": "Pending", "author_id": 2, "created_at": "2025-11-16T12:00:00+00:00"}
+        },
+        {
+            "event": "blog_approved",
+            "data": {"id": 1, "title": "Pending", "approved_at": None}
+        }
+    ]